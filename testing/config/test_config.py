@@ -21,12 +21,18 @@ class TestConfig:
     
     # Test Data
     TEST_DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
-    REPORTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'reports')
+    TEST_SUITE = os.getenv('TEST_SUITE', '')  # set per suite by concurrent runs
+    # Concurrent suites each write their raw metrics and stats under reports/<suite>
+    REPORTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'reports', *([TEST_SUITE] if TEST_SUITE else []))
+    FRONTEND_APP_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'frontend', 'src', 'app')
+    REPO_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+    TESTS_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests')
     
     # Timeouts (in seconds)
     IMPLICIT_WAIT = 10
     EXPLICIT_WAIT = 20
     PAGE_LOAD_TIMEOUT = 30
+    PAGE_IDLE_MS = int(os.getenv('PAGE_IDLE_MS', '500'))  # network + DOM quiet window before a page counts as settled
     
     # Test Users
     ADMIN_EMAIL = os.getenv('ADMIN_EMAIL', 'admin@school.com')
@@ -52,14 +58,133 @@ class TestConfig:
     PARALLEL_WORKERS = int(os.getenv('PARALLEL_WORKERS', '2'))
     RETRY_COUNT = int(os.getenv('RETRY_COUNT', '2'))
     SCREENSHOT_ON_FAILURE = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
+    BROWSER_RECYCLE_AFTER = int(os.getenv('BROWSER_RECYCLE_AFTER', '25'))  # tests per browser session
+    E2E_TOKEN_LOGIN = os.getenv('E2E_TOKEN_LOGIN', 'true').lower() == 'true'  # inject API tokens instead of UI login
+    TOKEN_CACHE = os.getenv('TOKEN_CACHE', os.path.join(TEST_DATA_DIR, 'token_cache.json'))
     
     # API Testing
     API_TIMEOUT = 30
     API_RETRY_COUNT = 3
     
     # Performance Testing
+    PERF_MODE = os.getenv('PERF_MODE', 'false').lower() == 'true'  # GC frozen/disabled during test calls
     LOAD_TEST_USERS = int(os.getenv('LOAD_TEST_USERS', '10'))
     LOAD_TEST_DURATION = int(os.getenv('LOAD_TEST_DURATION', '60'))  # seconds
+    CLASSROOM_TEACHERS = int(os.getenv('CLASSROOM_TEACHERS', '3'))  # concurrent teacher browsers
+    CLASSROOM_PARENTS = int(os.getenv('CLASSROOM_PARENTS', '10'))  # concurrent parent browsers
+    LOAD_USER_POOL_SIZE = int(os.getenv('LOAD_USER_POOL_SIZE', '100'))  # users per role
+    LOAD_USER_MANIFEST = os.getenv('LOAD_USER_MANIFEST', os.path.join(TEST_DATA_DIR, 'load_users.json'))
+    PASSWORD_HASH_CACHE = os.getenv('PASSWORD_HASH_CACHE', os.path.join(TEST_DATA_DIR, 'password_hashes.json'))
+    BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))  # matches backend SALT_ROUNDS
+    
+    # Page Performance (browser-side, per frontend route)
+    PAGE_METRICS = os.getenv('PAGE_METRICS', 'true').lower() == 'true'
+    PAGE_BUDGET_ENFORCE = os.getenv('PAGE_BUDGET_ENFORCE', 'false').lower() == 'true'
+    PAGE_API_BUDGETS = {'apiRequests': 15, 'apiDepth': 3, 'apiDuplicates': 0, 'apiBytes': 500000}
+    PAGE_BUDGETS = {  # p75 per route; ms except cls (unitless) and counts
+        'default': {'ttfb': 800, 'fcp': 1800, 'lcp': 2500, 'cls': 0.1, 'tbt': 300, 'load': 4000,
+                    **PAGE_API_BUDGETS},
+        '/admin/dashboard': {'lcp': 3000, 'tbt': 400},
+        '/teacher/attendance': {'lcp': 3000, 'tbt': 400},
+    }
+    
+    # Device Emulation (Chromium only; applied through DevTools); every profile needs budgets
+    DEVICE_PROFILE = os.getenv('DEVICE_PROFILE', '')  # empty = full-speed local machine
+    DEVICE_PROFILES = {
+        'school-chromebook-3g': {
+            'description': '3G school Wi-Fi, 4x CPU slowdown, 1366x768',
+            'network': {'latency_ms': 300, 'download_kbps': 1600, 'upload_kbps': 750},
+            'cpu_slowdown': 4,
+            'viewport': (1366, 768),
+            'budgets': {'default': {'ttfb': 1500, 'fcp': 4000, 'lcp': 6000, 'cls': 0.1, 'tbt': 1200,
+                                    'load': 10000, **PAGE_API_BUDGETS}},
+        },
+        'congested-wifi': {
+            'description': 'Congested classroom Wi-Fi, 2x CPU slowdown',
+            'network': {'latency_ms': 150, 'download_kbps': 5000, 'upload_kbps': 1000},
+            'cpu_slowdown': 2,
+            'budgets': {'default': {'ttfb': 1200, 'fcp': 3000, 'lcp': 4000, 'cls': 0.1, 'tbt': 600,
+                                    'load': 7000, **PAGE_API_BUDGETS}},
+        },
+        'slow-cpu': {
+            'description': 'Local network, 6x CPU slowdown',
+            'cpu_slowdown': 6,
+            'budgets': {'default': {'ttfb': 1000, 'fcp': 4000, 'lcp': 5500, 'cls': 0.1, 'tbt': 1800,
+                                    'load': 9000, **PAGE_API_BUDGETS}},
+        },
+    }
+    
+    # Duration-aware scheduling (xdist --dist loadgroup)
+    TEST_DURATIONS_FILE = os.getenv('TEST_DURATIONS_FILE', os.path.join(TEST_DATA_DIR, 'test_durations.json'))
+    DEFAULT_TEST_DURATIONS = {  # seconds, for tests with no recorded history
+        'tests/e2e/': 15.0,
+        'tests/performance/': 30.0,
+        'tests/integration/': 1.0,
+    }
+    
+    # Database queries per API call (pg_stat_statements, N+1 detection)
+    QUERY_PROFILE = os.getenv('QUERY_PROFILE', 'false').lower() == 'true'
+    QUERY_BUDGET_ENFORCE = os.getenv('QUERY_BUDGET_ENFORCE', 'true').lower() == 'true'
+    QUERY_BUDGETS = {
+        # queries: statements per request; repeated: executions of one statement
+        'default': {'queries': 20, 'repeated': 5},
+        'GET /api/v1/dashboard/admin': {'queries': 30},
+        'GET /api/v1/analytics/school': {'queries': 30},
+    }
+    
+    # Server-side prepared statements for DatabaseHelper lookups (LRU per connection, 0 disables)
+    DB_PREPARED_CACHE_SIZE = int(os.getenv('DB_PREPARED_CACHE_SIZE', '64'))
+    
+    # Rows per statement for DatabaseHelper insert_many/update_many/delete_many
+    DB_BATCH_PAGE_SIZE = int(os.getenv('DB_BATCH_PAGE_SIZE', '1000'))
+    
+    # AsyncDatabaseHelper connection pool
+    DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', '2'))
+    DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '20'))
+    
+    # Harness-side query timing in DatabaseHelper (latency histograms, slow-query log)
+    DB_QUERY_STATS = os.getenv('DB_QUERY_STATS', 'false').lower() == 'true'
+    DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', '100'))
+    
+    # Hot query plans at volume (EXPLAIN ANALYZE index guard)
+    INDEX_GUARD_SCALE = {
+        'schools': int(os.getenv('INDEX_GUARD_SCHOOLS', '10')),
+        'classes_per_school': 20,
+        'students_per_class': 40,
+        'attendance_days': 60,
+        'homework_per_class': 30,
+        'notifications_per_student': 20,
+    }
+    INDEX_GUARD_BUDGETS = {
+        # seq_scan_min_rows: tables this large must not be scanned sequentially
+        'default': {'max_buffers': 1000, 'seq_scan_min_rows': 10000},
+    }
+    
+    # Seeded volume dataset, snapshotted once and restored per run
+    VOLUME_DATASET = {
+        'schools': int(os.getenv('VOLUME_SCHOOLS', '5')),
+        'classes_per_school': 50,
+        'students_per_class': 40,
+        'attendance_days': 60,
+        'homework_per_class': 30,
+        'notifications_per_student': 20,
+    }
+    VOLUME_SEED = int(os.getenv('VOLUME_SEED', '42'))
+    SNAPSHOT_STRATEGY = os.getenv('SNAPSHOT_STRATEGY', 'template')  # template or dump
+    SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', os.path.join(TEST_DATA_DIR, 'snapshots'))
+    SNAPSHOT_JOBS = int(os.getenv('SNAPSHOT_JOBS', str(os.cpu_count() or 4)))
+    
+    # Lock and wait-event sampling during concurrent write tests (seconds)
+    LOCK_SAMPLE_INTERVAL = float(os.getenv('LOCK_SAMPLE_INTERVAL', '0.05'))
+    
+    # Tables watched by LISTEN/NOTIFY change notification triggers
+    CHANGE_NOTIFY_TABLES = ['users', 'classes', 'attendance', 'homework', 'notifications']
+    
+    # Harness startup (pytest startup + collection, seconds)
+    STARTUP_BUDGET = float(os.getenv('STARTUP_BUDGET', '1.0'))
+    
+    # Change-based test selection
+    TEST_IMPACT_MAP = os.getenv('TEST_IMPACT_MAP', os.path.join(TEST_DATA_DIR, 'test_impact_map.json'))
     
     # Test Categories
     SMOKE_TESTS = ['auth', 'dashboard', 'navigation']
@@ -81,6 +206,10 @@ class TestConfig:
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-plugins')
             options.add_argument('--disable-images')
+            # Network events for the API chattiness part of page metrics; the log
+            # buffers every DevTools network event, so it's only on when read
+            if cls.PAGE_METRICS:
+                options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
             return options
         elif cls.BROWSER.lower() == 'firefox':
             from selenium.webdriver.firefox.options import Options
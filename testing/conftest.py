@@ -0,0 +1,376 @@
+"""
+Pytest configuration and fixtures
+"""
+import pytest
+import gc
+import json
+import os
+import time
+
+from config.test_config import TestConfig
+from utils.test_data_generator import TestDataGenerator
+from utils.api_helper import APIHelper
+from utils.duration_scheduler import GROUP_SUFFIX, DurationHistory, schedule_items
+from utils import page_metrics as page_metrics_report
+from utils.page_metrics import PageMetricsCollector
+from utils.query_stats import query_stats
+from utils.test_impact import ImpactMap
+from utils.token_store import TokenStore
+
+# selenium, webdriver_manager, psycopg2 and bcrypt are imported inside the
+# fixtures that need them, so API-only runs start without loading them
+
+
+@pytest.fixture(scope="session")
+def config():
+    """Provide test configuration"""
+    return TestConfig
+
+
+@pytest.fixture(scope="session")
+def browser_pool(config):
+    """Provide one reusable browser per test process (xdist worker)"""
+    from utils.browser_pool import BrowserPool
+    
+    pool = BrowserPool(config)
+    yield pool
+    pool.quit()
+
+
+@pytest.fixture(scope="session")
+def page_metrics():
+    """Collect browser-side performance metrics for every page visit"""
+    collector = PageMetricsCollector()
+    yield collector
+    collector.save()
+
+
+@pytest.fixture(scope="function")
+def driver(request, browser_pool, page_metrics):
+    """Provide a clean WebDriver from the pool"""
+    try:
+        driver = browser_pool.acquire()
+    except Exception as e:
+        print(f"Error creating driver: {e}")
+        raise
+    
+    if TestConfig.PAGE_METRICS:
+        page_metrics.track(driver, request.node.nodeid)
+    
+    yield driver
+    
+    if TestConfig.PAGE_METRICS:
+        page_metrics.untrack(driver, request.node.nodeid)
+        visited = [r for r in page_metrics.records if r['test'] == request.node.nodeid]
+        request.node.user_properties.append(('pages', sorted({r['route'] for r in visited})))
+        request.node.user_properties.append(
+            ('api_calls', sorted({call for r in visited for call in r.get('apiCalls', [])})))
+    browser_pool.release()
+
+
+@pytest.fixture(scope="function")
+def wait(driver):
+    """Create WebDriverWait instance"""
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    return WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
+
+
+@pytest.fixture(scope="function")
+def page_sync(driver):
+    """Wait for network idle and DOM stability instead of fixed sleeps"""
+    from utils.page_sync import PageSync
+    
+    return PageSync(driver)
+
+
+@pytest.fixture(scope="function")
+def test_data():
+    """Provide test data generator"""
+    return TestDataGenerator()
+
+
+@pytest.fixture(scope="session")
+def query_profiler():
+    """Attribute database statements to API calls through pg_stat_statements"""
+    from utils.query_profiler import QueryProfiler
+    
+    profiler = QueryProfiler()
+    yield profiler
+    profiler.save()
+    profiler.close()
+
+
+@pytest.fixture(scope="session")
+def change_notifier():
+    """Wait for committed rows via LISTEN/NOTIFY instead of polling"""
+    from utils.change_notifier import ChangeNotifier
+    
+    notifier = ChangeNotifier()
+    notifier.install()
+    yield notifier
+    notifier.close()
+
+
+@pytest.fixture(scope="function")
+def lock_sampler(request):
+    """Sample database wait events and lock chains while a test applies load"""
+    from utils.lock_sampler import LockSampler
+    
+    sampler = LockSampler()
+    yield sampler
+    sampler.stop()
+    if sampler.samples:
+        report = sampler.report()
+        path = sampler.save_report(request.node.name, report)
+        print(f"\nLock samples: {report['samples']}, blocked {report['blocked_sample_ratio']:.0%} "
+              f"of the time, report: {path}")
+    sampler.close()
+
+
+@pytest.fixture(scope="function")
+def api_helper(request):
+    """Provide API helper"""
+    helper = APIHelper()
+    profiler = request.getfixturevalue('query_profiler') if TestConfig.QUERY_PROFILE else None
+    if profiler and profiler.available:
+        profiler.attach(helper)
+    start = len(profiler.records) if profiler else 0
+    
+    yield helper
+    
+    request.node.user_properties.append(('api_calls', sorted(helper.calls)))
+    request.node.user_properties.append(('api_time', helper.api_time))
+    if profiler:
+        violations = profiler.check_budgets(profiler.records[start:])
+        if violations and TestConfig.QUERY_BUDGET_ENFORCE:
+            pytest.fail("Query budget exceeded:\n" + "\n".join(violations))
+
+
+@pytest.fixture(scope="function", autouse=True)
+def harness_db_time(request):
+    """Record the time this test's harness code spent in DatabaseHelper statements"""
+    start = query_stats.total_time
+    yield
+    if TestConfig.DB_QUERY_STATS:
+        request.node.user_properties.append(('db_time', query_stats.total_time - start))
+
+
+@pytest.fixture(scope="function")
+def db_helper():
+    """Provide database helper"""
+    from utils.database_helper import DatabaseHelper
+    
+    return DatabaseHelper()
+
+
+@pytest.fixture(scope="session")
+def load_user_pool():
+    """Provide provisioned load-test users, provisioning them on first use"""
+    from utils.database_helper import DatabaseHelper
+    from utils.user_pool_provisioner import UserPool, UserPoolProvisioner
+    
+    # Manifests from before class assignment have class teachers without a class
+    if not UserPool.exists() or not all(t.get('classId') for t in UserPool().by_role('class_teacher')):
+        with DatabaseHelper() as db:
+            UserPoolProvisioner(db).provision()
+    return UserPool()
+
+
+@pytest.fixture(scope="function")
+def admin_user(test_data):
+    """Provide admin user data"""
+    return {
+        'email': TestConfig.ADMIN_EMAIL,
+        'password': TestConfig.ADMIN_PASSWORD,
+        'role': 'admin'
+    }
+
+
+@pytest.fixture(scope="function")
+def teacher_user(test_data):
+    """Provide teacher user data"""
+    return {
+        'email': TestConfig.TEACHER_EMAIL,
+        'password': TestConfig.TEACHER_PASSWORD,
+        'role': 'teacher'
+    }
+
+
+@pytest.fixture(scope="function")
+def student_user(test_data):
+    """Provide student user data"""
+    return {
+        'email': TestConfig.STUDENT_EMAIL,
+        'password': TestConfig.STUDENT_PASSWORD,
+        'role': 'student'
+    }
+
+
+@pytest.fixture(scope="function")
+def parent_user(test_data):
+    """Provide parent user data"""
+    return {
+        'email': TestConfig.PARENT_EMAIL,
+        'password': TestConfig.PARENT_PASSWORD,
+        'role': 'parent'
+    }
+
+
+@pytest.fixture(scope="session")
+def token_store():
+    """Provide cached API login tokens"""
+    return TokenStore()
+
+
+@pytest.fixture(scope="function")
+def login_admin(driver, wait, token_store, admin_user):
+    """Login as admin and return driver"""
+    from utils.login_helper import login_as
+    
+    return login_as(driver, wait, token_store, admin_user, "/admin/dashboard")
+
+
+@pytest.fixture(scope="function")
+def login_teacher(driver, wait, token_store, teacher_user):
+    """Login as teacher and return driver"""
+    from utils.login_helper import login_as
+    
+    return login_as(driver, wait, token_store, teacher_user, "/teacher/dashboard")
+
+
+@pytest.fixture(scope="function")
+def login_student(driver, wait, token_store, student_user):
+    """Login as student and return driver"""
+    from utils.login_helper import login_as
+    
+    return login_as(driver, wait, token_store, student_user, "/student/dashboard")
+
+
+@pytest.fixture(scope="function")
+def login_parent(driver, wait, token_store, parent_user):
+    """Login as parent and return driver"""
+    from utils.login_helper import login_as
+    
+    return login_as(driver, wait, token_store, parent_user, "/parent/dashboard")
+
+
+def save_failure_screenshot(item, driver):
+    """Save a screenshot for a failed test"""
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    screenshot_name = f"{item.name}_{timestamp}.png"
+    screenshot_path = os.path.join(TestConfig.REPORTS_DIR, screenshot_name)
+    
+    try:
+        driver.save_screenshot(screenshot_path)
+        print(f"Screenshot saved: {screenshot_path}")
+    except Exception as e:
+        print(f"Failed to save screenshot: {e}")
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Hook to capture test results and screenshot failed browser tests"""
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, "rep_" + rep.when, rep)
+    
+    # Browsers are opt-in: only tests that requested the driver fixture get a
+    # screenshot, so API, integration and performance tests never launch one
+    driver = getattr(item, 'funcargs', {}).get('driver')
+    if rep.when == "call" and rep.failed and driver and TestConfig.SCREENSHOT_ON_FAILURE:
+        save_failure_screenshot(item, driver)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """In performance mode keep GC pauses out of measured latencies"""
+    if not TestConfig.PERF_MODE:
+        yield
+        return
+    
+    # Collect now, move survivors out of the tracked generations, and stop
+    # automatic collection while the test body runs
+    gc.collect()
+    gc.freeze()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+        gc.unfreeze()
+
+
+duration_history = DurationHistory()
+impact_map = ImpactMap()
+harness_times = {}  # nodeid -> harness DB time and API time (seconds)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Balance xdist workers by predicted duration (with --dist loadgroup)"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput and config.getoption("dist", None) == "loadgroup":
+        schedule_items(items, duration_history, workerinput["workercount"])
+
+
+def pytest_runtest_logreport(report):
+    """Record test durations and exercised endpoints (the xdist controller sees every worker's reports)"""
+    duration_history.add(report.nodeid, report.duration)
+    
+    if report.when == "teardown":
+        api_calls = [call for name, calls in report.user_properties if name == 'api_calls' for call in calls]
+        pages = [page for name, values in report.user_properties if name == 'pages' for page in values]
+        # Tests that recorded nothing stay unmapped and are selected for any backend change
+        if api_calls or pages:
+            impact_map.update(GROUP_SUFFIX.sub('', report.nodeid), api_calls, pages)
+        
+        times = {name: value for name, value in report.user_properties if name in ('db_time', 'api_time')}
+        if 'db_time' in times:
+            harness_times[report.nodeid] = times
+
+
+def save_harness_times(times):
+    """Write per-test harness DB time next to API time, slowest DB time first"""
+    path = os.path.join(TestConfig.REPORTS_DIR, 'db_query_stats', 'test_times.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    ordered = dict(sorted(times.items(), key=lambda item: -item[1]['db_time']))
+    with open(path, 'w') as f:
+        json.dump(ordered, f, indent=2)
+    
+    db_time = sum(t['db_time'] for t in times.values())
+    api_time = sum(t.get('api_time', 0.0) for t in times.values())
+    print(f"\nHarness DB time {db_time:.1f}s, API time {api_time:.1f}s: {path}")
+
+
+def pytest_sessionstart(session):
+    """Clear raw page metrics from a previous run (controller process only)"""
+    if not hasattr(session.config, "workerinput"):
+        page_metrics_report.clear_records()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Save test durations and check per-route page metrics against budgets"""
+    query_stats.save()  # per process, like the other per-worker summaries
+    if hasattr(session.config, "workerinput"):
+        return  # workers only write raw records; the controller aggregates
+    
+    duration_history.save()
+    impact_map.save()
+    if harness_times:
+        save_harness_times(harness_times)
+    
+    records = page_metrics_report.load_records()
+    if not records:
+        return
+    
+    summary = page_metrics_report.aggregate(records)
+    violations = page_metrics_report.check_budgets(summary)
+    report_path = page_metrics_report.write_report(summary, violations)
+    
+    print(f"\nPage metrics for {len(summary)} routes: {report_path}")
+    for violation in violations:
+        print(f"Page budget exceeded - {violation}")
+    
+    if violations and TestConfig.PAGE_BUDGET_ENFORCE and session.exitstatus == 0:
+        session.exitstatus = 1
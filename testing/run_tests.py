@@ -6,32 +6,38 @@ import os
 import sys
 import subprocess
 import argparse
+import shlex
 from pathlib import Path
 
-def run_command(command, description):
+from utils.test_orchestrator import Suite, TestOrchestrator
+
+def run_command(command, description, env=None):
     """Run a command and return the result"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
     print(f"Command: {command}")
     print(f"{'='*60}")
     
-    result = subprocess.run(command, shell=True, capture_output=True, text=True)
-    
-    if result.stdout:
-        print("STDOUT:")
-        print(result.stdout)
-    
-    if result.stderr:
-        print("STDERR:")
-        print(result.stderr)
+    # Stream output as it is produced instead of buffering it until exit
+    process = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, bufsize=1, env=env)
+    for line in process.stdout:
+        print(line, end="", flush=True)
     
-    return result.returncode == 0
+    return process.wait() == 0
 
 def install_dependencies():
     """Install test dependencies"""
     print("Installing test dependencies...")
     return run_command("pip install -r requirements.txt", "Installing dependencies")
 
+def provision_load_users():
+    """Provision load-test user pool"""
+    return run_command(
+        "python -m utils.user_pool_provisioner",
+        "Provisioning load-test user pool"
+    )
+
 def run_smoke_tests():
     """Run smoke tests"""
     return run_command(
@@ -53,11 +59,28 @@ def run_integration_tests():
         "Running integration tests"
     )
 
+# Performance profile: no ini addopts, no coverage tracer or report plugins in the
+# client's hot loop; PERF_MODE also freezes/disables the GC around each test call
+PERF_PROFILE_ARGS = [
+    "-o", "addopts=",
+    "-p", "no:pytest_cov",
+    "-p", "no:html",
+    "-p", "no:allure_pytest",
+    "-p", "no:cacheprovider",
+    "--strict-markers",
+    "--tb=short",
+    "-q",
+]
+# Report collection (--html/--cov/--alluredir in PYTEST_ADDOPTS) needs the plugins
+# the profile disables, so performance runs never inherit it
+PERF_PROFILE_ENV = {"PERF_MODE": "true", "PYTEST_ADDOPTS": ""}
+
 def run_performance_tests():
     """Run performance tests"""
     return run_command(
-        "pytest tests/performance/ -v --tb=short -m performance",
-        "Running performance tests"
+        f"python -m pytest tests/performance/ {' '.join(PERF_PROFILE_ARGS)} -m performance",
+        "Running performance tests",
+        env={**os.environ, **PERF_PROFILE_ENV}
     )
 
 def run_api_tests():
@@ -95,6 +118,24 @@ def run_edge_case_tests():
         "Running edge case tests"
     )
 
+# Suites for concurrent runs, each with its own resource budget
+SUITES = {
+    "integration": Suite("integration", ["tests/integration/", "--tb=short"], workers=2),
+    "performance": Suite("performance", ["tests/performance/", *PERF_PROFILE_ARGS, "-m", "performance"],
+                         env=PERF_PROFILE_ENV),
+    "e2e": Suite("e2e", ["tests/e2e/", "--tb=short"], workers=2, nice=5, env={"HEADLESS": "true"}),
+}
+
+def run_concurrent_suites(names, fail_fast=False):
+    """Run several suites at the same time, streaming their output"""
+    print(f"\n{'='*60}")
+    print(f"Running suites concurrently: {', '.join(names)}")
+    print(f"{'='*60}")
+    
+    orchestrator = TestOrchestrator([SUITES[name] for name in names], fail_fast=fail_fast)
+    orchestrator.run()
+    return orchestrator.success
+
 def run_all_tests():
     """Run all tests"""
     return run_command(
@@ -105,36 +146,91 @@ def run_all_tests():
 def run_parallel_tests():
     """Run tests in parallel"""
     return run_command(
-        "pytest tests/ -v --tb=short -n auto",
+        "pytest tests/ -v --tb=short -n auto --dist loadgroup",
         "Running tests in parallel"
     )
 
+def profile_startup():
+    """Profile pytest startup and collection of the integration suite"""
+    return run_command(
+        "python -m utils.startup_profile tests/integration",
+        "Profiling harness startup"
+    )
+
+def restore_volume_dataset():
+    """Restore the seeded volume dataset snapshot, creating it on first use"""
+    return run_command(
+        "python -m utils.db_snapshot ensure",
+        "Restoring volume dataset snapshot"
+    )
+
+def run_impacted_tests(base, parallel=False):
+    """Run only the tests affected by changes since base"""
+    from utils.test_impact import changed_files, impacted_tests
+    
+    changes = changed_files(base)
+    selected = impacted_tests(changes)
+    if selected is None:
+        print(f"Changes since {base} can't be mapped to tests, running everything")
+        return run_parallel_tests() if parallel else run_all_tests()
+    if not selected:
+        print(f"No tests affected by {len(changes)} changed files since {base}")
+        return True
+    
+    command = "pytest " + " ".join(shlex.quote(t) for t in sorted(selected)) + " -v --tb=short"
+    if parallel:
+        command += " -n auto --dist loadgroup"
+    return run_command(command, f"Running {len(selected)} tests impacted by changes since {base}")
+
+# Collected during the single test run; rendered afterwards by generate_report()
+REPORT_COLLECTION_ARGS = [
+    "--junitxml=reports/junit.xml",
+    "--html=reports/report.html",
+    "--self-contained-html",
+    "--cov=.",
+    "--cov-report=",
+    "--alluredir=reports/allure-results",
+]
+
+def enable_report_collection():
+    """Make the next pytest run collect raw results for every report format"""
+    addopts = os.environ.get("PYTEST_ADDOPTS", "")
+    os.environ["PYTEST_ADDOPTS"] = " ".join([addopts] + REPORT_COLLECTION_ARGS).strip()
+    # A previous run's coverage data must not be rendered for a run that collects none
+    if os.path.exists(".coverage"):
+        os.remove(".coverage")
+
 def generate_report():
-    """Generate test report"""
+    """Render reports from the results collected by the test run"""
     print("\nGenerating test report...")
+    success = True
     
-    # Generate HTML report
-    run_command(
-        "pytest tests/ --html=reports/report.html --self-contained-html",
-        "Generating HTML report"
-    )
-    
-    # Generate coverage report
-    run_command(
-        "pytest tests/ --cov=. --cov-report=html:reports/coverage --cov-report=term-missing",
-        "Generating coverage report"
-    )
+    # Runs without coverage collection (the performance profile) leave no data to render
+    if os.path.exists(".coverage"):
+        success &= run_command(
+            "coverage html -d reports/coverage && coverage report -m",
+            "Rendering coverage report"
+        )
+    else:
+        print("No coverage data collected, skipping coverage report")
     
-    # Generate Allure report
-    run_command(
-        "allure generate reports/allure-results -o reports/allure-report --clean",
-        "Generating Allure report"
-    )
+    # Render Allure report from raw results
+    if os.path.isdir("reports/allure-results"):
+        success &= run_command(
+            "allure generate reports/allure-results -o reports/allure-report --clean",
+            "Generating Allure report"
+        )
+    else:
+        print("No Allure results collected, skipping Allure report")
     
     print("\nReports generated:")
-    print("- HTML Report: reports/report.html")
-    print("- Coverage Report: reports/coverage/index.html")
-    print("- Allure Report: reports/allure-report/index.html")
+    for name, path in [("HTML Report", "reports/report.html"), ("JUnit XML", "reports/junit.xml"),
+                       ("Coverage Report", "reports/coverage/index.html"),
+                       ("Allure Report", "reports/allure-report/index.html")]:
+        if os.path.exists(path):
+            print(f"- {name}: {path}")
+    
+    return success
 
 def main():
     """Main function"""
@@ -143,8 +239,18 @@ def main():
         "smoke", "regression", "integration", "performance", 
         "api", "ui", "security", "negative", "edge_case", "all"
     ], default="all", help="Type of tests to run")
+    parser.add_argument("--device-profile", help="Throttle e2e browsers with a TestConfig.DEVICE_PROFILES entry")
     parser.add_argument("--parallel", action="store_true", help="Run tests in parallel")
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES),
+                        help="Run these suites concurrently (overrides --test-type)")
+    parser.add_argument("--impacted", nargs="?", const="HEAD", metavar="BASE",
+                        help="Run only tests affected by changes since BASE (default HEAD)")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop all suites on the first failure")
     parser.add_argument("--install-deps", action="store_true", help="Install dependencies first")
+    parser.add_argument("--profile-startup", action="store_true", help="Profile pytest startup time first")
+    parser.add_argument("--restore-volume", action="store_true",
+                        help="Restore the seeded volume dataset snapshot first")
+    parser.add_argument("--provision-users", action="store_true", help="Provision load-test user pool first")
     parser.add_argument("--generate-report", action="store_true", help="Generate test report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     
@@ -153,6 +259,10 @@ def main():
     # Change to testing directory
     os.chdir(Path(__file__).parent)
     
+    # Device profile is read by TestConfig in the pytest process
+    if args.device_profile:
+        os.environ["DEVICE_PROFILE"] = args.device_profile
+    
     # Create reports directory
     os.makedirs("reports", exist_ok=True)
     
@@ -162,8 +272,28 @@ def main():
     if args.install_deps:
         success &= install_dependencies()
     
+    # Profile startup if requested
+    if args.profile_startup:
+        success &= profile_startup()
+    
+    # Restore the volume dataset before anything logs in or provisions users
+    if args.restore_volume:
+        success &= restore_volume_dataset()
+    
+    # Provision load-test users if requested
+    if args.provision_users:
+        success &= provision_load_users()
+    
+    # Collect report data in the same run instead of re-running the suite
+    if args.generate_report:
+        enable_report_collection()
+    
     # Run tests based on type
-    if args.test_type == "smoke":
+    if args.suites:
+        success &= run_concurrent_suites(args.suites, args.fail_fast)
+    elif args.impacted:
+        success &= run_impacted_tests(args.impacted, args.parallel)
+    elif args.test_type == "smoke":
         success &= run_smoke_tests()
     elif args.test_type == "regression":
         success &= run_regression_tests()
@@ -189,7 +319,7 @@ def main():
     
     # Generate report if requested
     if args.generate_report:
-        generate_report()
+        success &= generate_report()
     
     # Print final result
     print(f"\n{'='*60}")
@@ -12,7 +12,7 @@ from config.test_config import TestConfig
 class TestAttendanceManagement:
     """Test cases for attendance management functionality"""
     
-    def test_mark_attendance_success(self, login_teacher, driver, wait, test_data):
+    def test_mark_attendance_success(self, login_teacher, driver, wait, test_data, page_sync):
         """Test successful attendance marking"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -22,7 +22,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)  # Select first available class
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Mark attendance for students
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -60,7 +60,7 @@ class TestAttendanceManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Please select a class" in error_message.text or "Class is required" in error_message.text
     
-    def test_mark_attendance_no_students_selected(self, login_teacher, driver, wait):
+    def test_mark_attendance_no_students_selected(self, login_teacher, driver, wait, page_sync):
         """Test marking attendance without selecting students"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -70,7 +70,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Submit without selecting any students
         submit_button = driver.find_element(By.XPATH, "//button[@type='submit']")
@@ -80,7 +80,7 @@ class TestAttendanceManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Please select at least one student" in error_message.text or "No students selected" in error_message.text
     
-    def test_mark_attendance_different_statuses(self, login_teacher, driver, wait):
+    def test_mark_attendance_different_statuses(self, login_teacher, driver, wait, page_sync):
         """Test marking different attendance statuses"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -90,7 +90,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Mark different statuses for different students
         student_rows = driver.find_elements(By.XPATH, "//tr[contains(@class, 'student-row')]")
@@ -137,7 +137,7 @@ class TestAttendanceManagement:
         for header in expected_headers:
             assert any(header in h.text for h in headers)
     
-    def test_view_attendance_by_date_range(self, login_teacher, driver, wait):
+    def test_view_attendance_by_date_range(self, login_teacher, driver, wait, page_sync):
         """Test viewing attendance by date range"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -160,7 +160,7 @@ class TestAttendanceManagement:
         filter_button.click()
         
         # Verify filtered results
-        time.sleep(2)
+        page_sync.wait()
         attendance_records = driver.find_elements(By.XPATH, "//tr[contains(@class, 'attendance-record')]")
         assert len(attendance_records) > 0
     
@@ -207,7 +207,7 @@ class TestAttendanceManagement:
         assert driver.find_element(By.XPATH, "//div[contains(text(), 'Absent')]")
         assert driver.find_element(By.XPATH, "//div[contains(text(), 'Attendance Rate')]")
     
-    def test_attendance_bulk_update(self, login_teacher, driver, wait):
+    def test_attendance_bulk_update(self, login_teacher, driver, wait, page_sync):
         """Test bulk updating attendance"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -217,7 +217,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Select multiple students
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -236,7 +236,7 @@ class TestAttendanceManagement:
         success_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "success")))
         assert "Attendance updated successfully" in success_message.text
     
-    def test_attendance_validation_errors(self, login_teacher, driver, wait):
+    def test_attendance_validation_errors(self, login_teacher, driver, wait, page_sync):
         """Test attendance validation errors"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -246,7 +246,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Try to submit with invalid data
         remarks_input = driver.find_element(By.NAME, "remarks")
@@ -260,7 +260,7 @@ class TestAttendanceManagement:
         remarks_error = driver.find_element(By.XPATH, "//input[@name='remarks']/following-sibling::div[contains(@class, 'error')]")
         assert remarks_error.is_displayed()
     
-    def test_attendance_duplicate_entry(self, login_teacher, driver, wait):
+    def test_attendance_duplicate_entry(self, login_teacher, driver, wait, page_sync):
         """Test preventing duplicate attendance entries"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -270,7 +270,7 @@ class TestAttendanceManagement:
         class_select.select_by_index(1)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Mark attendance for first time
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -294,7 +294,7 @@ class TestAttendanceManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Attendance already marked for this date" in error_message.text or "Duplicate entry" in error_message.text
     
-    def test_attendance_future_date_validation(self, login_teacher, driver, wait):
+    def test_attendance_future_date_validation(self, login_teacher, driver, wait, page_sync):
         """Test preventing attendance marking for future dates"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -310,7 +310,7 @@ class TestAttendanceManagement:
         date_input.send_keys(future_date)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Try to mark attendance
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -323,7 +323,7 @@ class TestAttendanceManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Cannot mark attendance for future dates" in error_message.text or "Future date not allowed" in error_message.text
     
-    def test_attendance_weekend_validation(self, login_teacher, driver, wait):
+    def test_attendance_weekend_validation(self, login_teacher, driver, wait, page_sync):
         """Test preventing attendance marking on weekends"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -339,7 +339,7 @@ class TestAttendanceManagement:
         date_input.send_keys(weekend_date)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Try to mark attendance
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -352,7 +352,7 @@ class TestAttendanceManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Cannot mark attendance on weekends" in error_message.text or "Weekend not allowed" in error_message.text
     
-    def test_attendance_holiday_validation(self, login_teacher, driver, wait):
+    def test_attendance_holiday_validation(self, login_teacher, driver, wait, page_sync):
         """Test preventing attendance marking on holidays"""
         # Navigate to attendance page
         driver.get(f"{TestConfig.BASE_URL}/teacher/attendance")
@@ -368,7 +368,7 @@ class TestAttendanceManagement:
         date_input.send_keys(holiday_date)
         
         # Wait for students to load
-        time.sleep(2)
+        page_sync.wait()
         
         # Try to mark attendance
         student_checkboxes = driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]")
@@ -2,7 +2,6 @@
 Class Management Test Cases for School Management System
 """
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
@@ -227,7 +226,7 @@ class TestClassManagement:
         assert name_error.is_displayed()
         assert section_error.is_displayed()
     
-    def test_delete_class_success(self, login_admin, driver, wait):
+    def test_delete_class_success(self, login_admin, driver, wait, page_sync):
         """Test successful class deletion"""
         # Navigate to classes page
         driver.get(f"{TestConfig.BASE_URL}/admin/classes")
@@ -245,7 +244,7 @@ class TestClassManagement:
         assert "Class deleted successfully" in success_message.text
         
         # Verify class is removed from list
-        time.sleep(2)  # Wait for list to update
+        page_sync.wait()  # Wait for list to update
         class_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'class-card')]")
         # Verify one less class card exists
     
@@ -266,7 +265,7 @@ class TestClassManagement:
         error_message = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "error")))
         assert "Cannot delete class with existing students" in error_message.text or "Class has students" in error_message.text
     
-    def test_class_search_functionality(self, login_admin, driver, wait):
+    def test_class_search_functionality(self, login_admin, driver, wait, page_sync):
         """Test class search functionality"""
         # Navigate to classes page
         driver.get(f"{TestConfig.BASE_URL}/admin/classes")
@@ -281,14 +280,14 @@ class TestClassManagement:
         search_button.click()
         
         # Verify search results
-        time.sleep(2)  # Wait for search results
+        page_sync.wait()  # Wait for search results
         class_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'class-card')]")
         
         # Verify only matching classes are displayed
         for card in class_cards:
             assert "Class 1" in card.text
     
-    def test_class_filter_by_academic_year(self, login_admin, driver, wait):
+    def test_class_filter_by_academic_year(self, login_admin, driver, wait, page_sync):
         """Test filtering classes by academic year"""
         # Navigate to classes page
         driver.get(f"{TestConfig.BASE_URL}/admin/classes")
@@ -302,14 +301,14 @@ class TestClassManagement:
         filter_button.click()
         
         # Verify filtered results
-        time.sleep(2)  # Wait for filter results
+        page_sync.wait()  # Wait for filter results
         class_cards = driver.find_elements(By.XPATH, "//div[contains(@class, 'class-card')]")
         
         # Verify only classes from selected year are displayed
         for card in class_cards:
             assert "2024-25" in card.text
     
-    def test_class_pagination(self, login_admin, driver, wait):
+    def test_class_pagination(self, login_admin, driver, wait, page_sync):
         """Test class list pagination"""
         # Navigate to classes page
         driver.get(f"{TestConfig.BASE_URL}/admin/classes")
@@ -324,7 +323,7 @@ class TestClassManagement:
             next_button.click()
             
             # Verify page changed
-            time.sleep(2)
+            page_sync.wait()
             current_page = driver.find_element(By.XPATH, "//span[contains(@class, 'current-page')]")
             assert current_page.text == "2"
     
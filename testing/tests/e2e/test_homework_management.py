@@ -2,7 +2,6 @@
 Homework Management Test Cases for School Management System
 """
 import pytest
-import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
@@ -205,7 +204,7 @@ class TestHomeworkManagement:
         wait.until(EC.url_contains("/teacher/homework/"))
         assert "/edit" not in driver.current_url
     
-    def test_delete_homework_success(self, login_teacher, driver, wait):
+    def test_delete_homework_success(self, login_teacher, driver, wait, page_sync):
         """Test successful homework deletion"""
         # Navigate to homework page
         driver.get(f"{TestConfig.BASE_URL}/teacher/homework")
@@ -223,7 +222,7 @@ class TestHomeworkManagement:
         assert "Homework deleted successfully" in success_message.text
         
         # Verify homework is removed from list
-        time.sleep(2)  # Wait for list to update
+        page_sync.wait()  # Wait for list to update
         homework_rows = driver.find_elements(By.XPATH, "//tr[contains(@class, 'homework-row')]")
         # Verify one less homework row exists
     
@@ -269,7 +268,7 @@ class TestHomeworkManagement:
         status_badge = driver.find_element(By.XPATH, "//span[contains(@class, 'status-draft')]")
         assert status_badge.is_displayed()
     
-    def test_homework_search_functionality(self, login_teacher, driver, wait):
+    def test_homework_search_functionality(self, login_teacher, driver, wait, page_sync):
         """Test homework search functionality"""
         # Navigate to homework page
         driver.get(f"{TestConfig.BASE_URL}/teacher/homework")
@@ -284,14 +283,14 @@ class TestHomeworkManagement:
         search_button.click()
         
         # Verify search results
-        time.sleep(2)  # Wait for search results
+        page_sync.wait()  # Wait for search results
         homework_rows = driver.find_elements(By.XPATH, "//tr[contains(@class, 'homework-row')]")
         
         # Verify only matching homeworks are displayed
         for row in homework_rows:
             assert "Math" in row.text
     
-    def test_homework_filter_by_class(self, login_teacher, driver, wait):
+    def test_homework_filter_by_class(self, login_teacher, driver, wait, page_sync):
         """Test filtering homework by class"""
         # Navigate to homework page
         driver.get(f"{TestConfig.BASE_URL}/teacher/homework")
@@ -305,7 +304,7 @@ class TestHomeworkManagement:
         filter_button.click()
         
         # Verify filtered results
-        time.sleep(2)  # Wait for filter results
+        page_sync.wait()  # Wait for filter results
         homework_rows = driver.find_elements(By.XPATH, "//tr[contains(@class, 'homework-row')]")
         
         # Verify only homeworks from selected class are displayed
@@ -313,7 +312,7 @@ class TestHomeworkManagement:
             # Check if class name is in the row
             assert len(row.find_elements(By.XPATH, ".//td[contains(text(), 'Class')]")) > 0
     
-    def test_homework_filter_by_status(self, login_teacher, driver, wait):
+    def test_homework_filter_by_status(self, login_teacher, driver, wait, page_sync):
         """Test filtering homework by status"""
         # Navigate to homework page
         driver.get(f"{TestConfig.BASE_URL}/teacher/homework")
@@ -327,7 +326,7 @@ class TestHomeworkManagement:
         filter_button.click()
         
         # Verify filtered results
-        time.sleep(2)  # Wait for filter results
+        page_sync.wait()  # Wait for filter results
         homework_rows = driver.find_elements(By.XPATH, "//tr[contains(@class, 'homework-row')]")
         
         # Verify only published homeworks are displayed
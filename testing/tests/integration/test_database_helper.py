@@ -0,0 +1,109 @@
+"""
+Database Helper Integration Test Cases for School Management System
+"""
+import asyncio
+import uuid
+import pytest
+
+pytestmark = pytest.mark.database
+
+
+class TestDatabaseHelper:
+    """Test cases for DatabaseHelper writes against the test database"""
+    
+    def test_create_and_insert_many_write_the_same_columns(self, db_helper):
+        """Test a row written by create_class and by insert_many reads back identically"""
+        school_id = db_helper.execute_query(
+            "INSERT INTO schools (name, email) VALUES (%s, %s) RETURNING id",
+            ("Round Trip School", f"roundtrip-{uuid.uuid4()}@loadtest.school.com"))[0]['id']
+        db_helper.connection.commit()
+        try:
+            teacher_id = db_helper.create_user({
+                'schoolId': school_id, 'firstName': 'Round', 'lastName': 'Trip', 'role': 'class_teacher',
+                'email': f"roundtrip.{uuid.uuid4()}@loadtest.school.com", 'passwordHash': 'x'})
+            row = {'schoolId': school_id, 'name': 'Round Trip', 'section': 'A', 'academicYear': 'roundtrip',
+                   'classTeacherId': teacher_id, 'roomNumber': '101'}
+            
+            created_id = db_helper.create_class(row)
+            batch_id, = db_helper.insert_many('classes', [{**row, 'section': 'B'}])
+            
+            ignored = {'id', 'section', 'created_at', 'updated_at'}
+            created = {k: v for k, v in db_helper.get_class_by_id(created_id).items() if k not in ignored}
+            batched = {k: v for k, v in db_helper.get_class_by_id(batch_id).items() if k not in ignored}
+            assert created == batched
+            assert created['room_number'] == '101' and created['is_active'] is True
+        finally:
+            db_helper.execute_update("DELETE FROM schools WHERE id = %s", (school_id,))
+    
+    def test_batch_writes_return_ids_in_input_order(self, db_helper):
+        """Test insert_many/update_many/delete_many write in pages and return ids in input order"""
+        school_id = db_helper.execute_query(
+            "INSERT INTO schools (name, email) VALUES (%s, %s) RETURNING id",
+            ("Batch Write School", f"batch-{uuid.uuid4()}@loadtest.school.com"))[0]['id']
+        try:
+            teacher_id, = db_helper.insert_many('users', [{
+                'schoolId': school_id, 'firstName': 'Batch', 'lastName': 'Teacher', 'role': 'class_teacher',
+                'email': f"batch.teacher.{uuid.uuid4()}@loadtest.school.com", 'passwordHash': 'x'}])
+            subject_id = db_helper.execute_query(
+                "INSERT INTO subjects (school_id, name) VALUES (%s, 'Batch Subject') RETURNING id", (school_id,))[0]['id']
+            
+            # 500 classes and then their homework, 100 rows per statement
+            classes = [{'schoolId': school_id, 'name': f"Class {i}", 'section': 'A', 'academicYear': 'batch',
+                        'classTeacherId': teacher_id} for i in range(500)]
+            class_ids = db_helper.insert_many('classes', classes, page_size=100)
+            names = {str(r['id']): r['name'] for r in db_helper.execute_query(
+                "SELECT id, name FROM classes WHERE school_id = %s", (school_id,))}
+            assert [names[class_id] for class_id in class_ids] == [c['name'] for c in classes]
+            
+            homework = [{'schoolId': school_id, 'classId': class_id, 'subjectId': subject_id,
+                         'teacherId': teacher_id, 'title': f"Homework {i}"} for i, class_id in enumerate(class_ids)]
+            homework_ids = db_helper.insert_many('homework', homework, page_size=100)
+            owners = {str(r['id']): str(r['class_id']) for r in db_helper.execute_query(
+                "SELECT id, class_id FROM homework WHERE school_id = %s", (school_id,))}
+            assert [owners[homework_id] for homework_id in homework_ids] == class_ids
+            
+            # A missing row keeps its position as None
+            missing_id = str(uuid.uuid4())
+            updates = [{'id': class_id, 'roomNumber': f"Room {i}"} for i, class_id in enumerate(class_ids)]
+            updates.insert(250, {'id': missing_id, 'roomNumber': 'Nowhere'})
+            updated = db_helper.update_many('classes', updates, page_size=100)
+            assert updated == class_ids[:250] + [None] + class_ids[250:]
+            rooms = {str(r['id']): r['room_number'] for r in db_helper.execute_query(
+                "SELECT id, room_number FROM classes WHERE school_id = %s", (school_id,))}
+            assert [rooms[class_id] for class_id in class_ids] == [f"Room {i}" for i in range(500)]
+            
+            with pytest.raises(ValueError):
+                db_helper.update_many('classes', [{'id': class_ids[0], 'roomNumber': 'A'}, {'id': class_ids[1]}])
+            
+            deleted = db_helper.delete_many('homework', [missing_id] + homework_ids, page_size=100)
+            assert deleted == [None] + homework_ids
+            assert db_helper.find_missing_records('homework', homework_ids) == homework_ids
+        finally:
+            db_helper.execute_update("DELETE FROM schools WHERE id = %s", (school_id,))
+    
+    def test_async_pipelined_results_in_order(self, db_helper):
+        """Test pipelined statements return results in input order and disconnect closes the pool"""
+        from utils.async_database_helper import AsyncDatabaseHelper
+        
+        users = db_helper.execute_query("SELECT id FROM users ORDER BY email DESC LIMIT 20")
+        if not users:
+            pytest.skip("No users to look up")
+        missing_id = str(uuid.uuid4())
+        record_ids = [str(u['id']) for u in users]
+        record_ids.insert(len(record_ids) // 2, missing_id)
+        
+        async def run():
+            async with AsyncDatabaseHelper(min_size=1, max_size=2) as helper:
+                numbers = await helper.execute_pipelined(
+                    [("SELECT %s::int AS n", (n,)) for n in range(50, 0, -1)])
+                rows = await helper.get_many_by_id('users', record_ids)
+                missing = await helper.find_missing_records('users', record_ids, batch_size=5)
+            return helper, numbers, rows, missing
+        
+        helper, numbers, rows, missing = asyncio.run(run())
+        
+        assert [result[0]['n'] for result in numbers] == list(range(50, 0, -1))
+        assert [str(row['id']) if row else None for row in rows] == [
+            None if record_id == missing_id else record_id for record_id in record_ids]
+        assert missing == [missing_id]
+        assert helper.pool.closed
@@ -7,19 +7,16 @@ import concurrent.futures
 import threading
 from config.test_config import TestConfig
 
+pytestmark = pytest.mark.performance
+
+
 class TestPerformance:
     """Test cases for performance testing"""
     
-    def test_concurrent_user_login(self, api_helper, test_data):
+    def test_concurrent_user_login(self, api_helper, load_user_pool):
         """Test concurrent user login performance"""
-        # Generate multiple user credentials
-        users = []
-        for i in range(TestConfig.LOAD_TEST_USERS):
-            user_data = test_data.generate_user_data('student')
-            users.append({
-                'email': user_data['email'],
-                'password': user_data['password']
-            })
+        # Draw provisioned user credentials
+        users = load_user_pool.draw(TestConfig.LOAD_TEST_USERS, 'student')
         
         def login_user(user_creds):
             """Login a single user"""
@@ -51,7 +48,7 @@ class TestPerformance:
         assert max_response_time < 5.0  # Max response time under 5 seconds
         assert total_time < 30.0  # Total time under 30 seconds
     
-    def test_concurrent_class_creation(self, api_helper, test_data, admin_user):
+    def test_concurrent_class_creation(self, api_helper, test_data, admin_user, lock_sampler, db_helper):
         """Test concurrent class creation performance"""
         # Login as admin
         api_helper.login(admin_user['email'], admin_user['password'])
@@ -72,12 +69,13 @@ class TestPerformance:
             return {
                 'success': response['success'],
                 'response_time': end_time - start_time,
-                'class_name': class_data['name']
+                'class_name': class_data['name'],
+                'class_id': (response.get('data') or {}).get('id')
             }
         
         # Execute concurrent class creation
         start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        with lock_sampler, concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
             futures = [executor.submit(create_class, class_data) for class_data in classes]
             results = [future.result() for future in concurrent.futures.as_completed(futures)]
         end_time = time.time()
@@ -87,12 +85,17 @@ class TestPerformance:
         successful_creations = sum(1 for r in results if r['success'])
         avg_response_time = sum(r['response_time'] for r in results) / len(results)
         
+        # Every acknowledged class must be persisted; one query checks them all
+        created_ids = [r['class_id'] for r in results if r['success'] and r['class_id']]
+        missing = db_helper.find_missing_records('classes', created_ids)
+        
         # Assertions
         assert successful_creations >= TestConfig.LOAD_TEST_USERS * 0.8  # 80% success rate
         assert avg_response_time < 3.0  # Average response time under 3 seconds
         assert total_time < 60.0  # Total time under 60 seconds
+        assert not missing, f"Created classes not persisted: {missing}"
     
-    def test_concurrent_attendance_marking(self, api_helper, test_data, teacher_user):
+    def test_concurrent_attendance_marking(self, api_helper, test_data, teacher_user, lock_sampler):
         """Test concurrent attendance marking performance"""
         # Login as teacher
         api_helper.login(teacher_user['email'], teacher_user['password'])
@@ -115,7 +118,7 @@ class TestPerformance:
         
         # Execute concurrent attendance marking
         start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        with lock_sampler, concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
             futures = [executor.submit(mark_attendance, record) for record in attendance_records]
             results = [future.result() for future in concurrent.futures.as_completed(futures)]
         end_time = time.time()
@@ -141,6 +144,86 @@ class TestPerformance:
         assert query_time < 1.0  # Query should complete under 1 second
         assert len(users) >= 0  # Should return results
     
+    @pytest.mark.database
+    def test_prepared_lookup_throughput(self, db_helper, record_property):
+        """Test repeated lookups reuse prepared statements and report their throughput"""
+        users = db_helper.execute_query("SELECT id, email FROM users LIMIT 50")
+        if not users:
+            pytest.skip("No users to look up")
+        
+        def lookups_per_second(rounds=20):
+            """Look up every user by email and by ID, rounds times"""
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                for user in users:
+                    db_helper.get_user_by_email(user['email'])
+                    db_helper.get_user_by_id(user['id'])
+            return rounds * len(users) * 2 / (time.perf_counter() - start_time)
+        
+        cache_size = db_helper.prepared_cache_size
+        lookups_per_second(rounds=1)  # warm up caches and prepare both statements
+        prepared_rate = lookups_per_second()
+        db_helper.prepared_cache_size = 0
+        plain_rate = lookups_per_second()
+        db_helper.prepared_cache_size = cache_size
+        
+        # Primary-key lookups plan in microseconds, so the gain is within run-to-run noise
+        # on a small table; the rates are reported (junit properties) rather than gated
+        print(f"\nLookups/s: prepared {prepared_rate:.0f}, plain {plain_rate:.0f} "
+              f"({prepared_rate / plain_rate - 1:+.0%})")
+        record_property('prepared_lookups_per_second', round(prepared_rate))
+        record_property('plain_lookups_per_second', round(plain_rate))
+        assert len(db_helper.prepared) == 2  # one statement per distinct SQL text
+    
+    @pytest.mark.database
+    def test_dashboard_query_budgets(self, api_helper, admin_user, query_profiler):
+        """Test dashboard and analytics endpoints stay within their query budgets (N+1 detection)"""
+        if not query_profiler.available:
+            pytest.skip("pg_stat_statements extension is not installed")
+        
+        api_helper.login(admin_user['email'], admin_user['password'])
+        query_profiler.attach(api_helper)
+        start = len(query_profiler.records)
+        
+        api_helper.get_admin_dashboard()
+        api_helper.get_school_analytics()
+        
+        records = query_profiler.records[start:]
+        assert [r['endpoint'] for r in records] == ['GET /api/v1/dashboard/admin', 'GET /api/v1/analytics/school']
+        violations = query_profiler.check_budgets(records)
+        assert not violations, "\n".join(violations)
+    
+    @pytest.mark.database
+    def test_class_creation_write_visibility(self, api_helper, test_data, admin_user, change_notifier):
+        """Test a created class is committed and visible to other sessions promptly"""
+        api_helper.login(admin_user['email'], admin_user['password'])
+        change_notifier.clear()
+        
+        start_time = time.perf_counter()
+        response = api_helper.create_class(test_data.generate_class_data())
+        class_id = response['data']['id']
+        events = change_notifier.wait_for('classes', [class_id], timeout=5)
+        
+        assert events, f"Class {class_id} was never committed"
+        visibility_time = events[0]['received'] - start_time
+        assert visibility_time < 2.0  # Visible within 2 seconds of the request
+    
+    @pytest.mark.database
+    @pytest.mark.volume
+    def test_hot_query_plans_at_volume(self):
+        """Test hot queries keep using their indexes on a large seeded dataset"""
+        from utils.index_guard import IndexGuard
+        
+        guard = IndexGuard()
+        try:
+            report = guard.run()
+        finally:
+            guard.db_helper.disconnect()
+        guard.save_report(report)
+        
+        violations = IndexGuard.violations(report)
+        assert not violations, "\n".join(violations)
+    
     def test_api_response_time_under_load(self, api_helper, admin_user):
         """Test API response time under load"""
         # Login first
@@ -314,16 +397,10 @@ class TestPerformance:
         assert success_rate > 0.95  # Success rate should be above 95%
         assert total_time >= TestConfig.LOAD_TEST_DURATION  # Should run for the specified duration
     
-    def test_stress_test_authentication(self, api_helper, test_data):
+    def test_stress_test_authentication(self, api_helper, load_user_pool):
         """Test authentication under stress"""
-        # Generate many user credentials
-        users = []
-        for i in range(100):
-            user_data = test_data.generate_user_data('student')
-            users.append({
-                'email': user_data['email'],
-                'password': user_data['password']
-            })
+        # Draw provisioned user credentials across all roles
+        users = load_user_pool.draw(100)
         
         def stress_login(user_creds):
             """Perform stress login"""
@@ -395,3 +472,39 @@ class TestPerformance:
         # Final assertions
         assert total_memory_increase < 100  # Total memory increase should be less than 100MB
         assert final_memory < 500  # Final memory usage should be less than 500MB
+    
+    @pytest.mark.ui
+    @pytest.mark.load
+    def test_classroom_simulation(self, load_user_pool, token_store):
+        """Test UI latency with teachers and parents using the app at the same time"""
+        # Imported here so collecting the performance suite doesn't load selenium
+        from utils.classroom_simulation import ClassroomSimulation, submit_attendance, load_dashboard
+        
+        simulation = ClassroomSimulation([
+            ('class_teacher', TestConfig.CLASSROOM_TEACHERS, submit_attendance),
+            ('parent', TestConfig.CLASSROOM_PARENTS, load_dashboard),
+        ], user_pool=load_user_pool, token_store=token_store)
+        
+        report = simulation.run()
+        simulation.save_report(report)
+        steps = report['steps']
+        
+        def step(name):
+            """Stats of a step, failing when no flow got that far"""
+            stats = steps.get(name)
+            assert stats, f"No browser reached '{name}' (recorded steps: {sorted(steps)})"
+            return stats
+        
+        def p95(name):
+            """p95 of a step, failing when every sample errored"""
+            stats = step(name)
+            assert stats['p95'] is not None, f"All {stats['errors']} '{name}' samples failed"
+            return stats['p95']
+        
+        # Assertions
+        assert report['startup_errors'] == 0  # Every browser logged in
+        assert p95('load /parent/dashboard') < 5.0  # Parent dashboard p95 under 5 seconds
+        assert p95('load /teacher/attendance') < 5.0  # Attendance page p95 under 5 seconds
+        submit = step('submit attendance')
+        assert submit['errors'] <= TestConfig.CLASSROOM_TEACHERS * 0.2, \
+            f"{submit['errors']} of {submit['count']} attendance submissions failed"  # 80% success rate
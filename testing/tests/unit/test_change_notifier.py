@@ -0,0 +1,120 @@
+"""
+Change Notifier Test Cases for School Management System
+"""
+import json
+import socket
+import time
+from collections import namedtuple
+
+import pytest
+
+from utils.change_notifier import ChangeNotifier
+
+pytestmark = pytest.mark.unit
+
+Notify = namedtuple('Notify', 'payload')
+LIVE_PID = 4321
+
+
+class FakeConnection:
+    """psycopg2 connection stand-in whose notifications arrive through a socket"""
+    
+    def __init__(self):
+        self.reader, self.writer = socket.socketpair()
+        self.notifies = []
+        self.pending = []
+    
+    def fileno(self):
+        return self.reader.fileno()
+    
+    def get_backend_pid(self):
+        return LIVE_PID
+    
+    def poll(self):
+        self.reader.recv(1024)
+        self.notifies.extend(self.pending)
+        self.pending = []
+    
+    def deliver(self, table, row_id, op='INSERT'):
+        """Make Postgres send a notification"""
+        self.pending.append(Notify(json.dumps({'table': table, 'op': op, 'id': row_id})))
+        self.writer.send(b'n')
+
+
+class FakeCursor:
+    """Cursor stand-in that knows a few notify functions and records statements"""
+    
+    def __init__(self, functions):
+        self.functions = functions
+        self.executed = []
+        self.rows = []
+    
+    def execute(self, statement, params=None):
+        self.executed.append(statement)
+        if 'pg_proc' in statement:
+            self.rows = [{'proname': name} for name in self.functions]
+        elif 'pg_stat_activity' in statement:
+            self.rows = [{'pid': LIVE_PID}]
+    
+    def fetchall(self):
+        return self.rows
+
+
+class FakeDBHelper:
+    """DatabaseHelper stand-in"""
+    
+    def __init__(self, functions=()):
+        self.connection = FakeConnection()
+        self.cursor = FakeCursor(list(functions))
+    
+    def disconnect(self):
+        self.connection.reader.close()
+        self.connection.writer.close()
+
+
+class TestChangeNotifier:
+    """Test cases for ChangeNotifier"""
+    
+    @pytest.fixture
+    def notifier(self):
+        """Installed notifier on a fake listening connection"""
+        notifier = ChangeNotifier(['classes'], FakeDBHelper())
+        notifier.install()
+        yield notifier
+        notifier.close()
+    
+    def test_events_are_stamped_on_arrival(self, notifier):
+        """Test the receive time is when the notification came in, not when a test waited"""
+        delivered = time.perf_counter()
+        notifier.db_helper.connection.deliver('classes', 'c1')
+        time.sleep(0.2)
+        
+        events = notifier.wait_for('classes', ['c1'], timeout=1)
+        
+        assert events and events[0]['received'] - delivered < 0.1
+    
+    def test_wait_until_rechecks_on_change(self, notifier):
+        """Test the condition is evaluated again when a change arrives, without a poll interval"""
+        rows = []
+        
+        def condition():
+            if notifier.events:
+                rows.append(notifier.events[-1]['id'])
+            return bool(rows)
+        
+        notifier.db_helper.connection.deliver('classes', 'c1')
+        
+        assert notifier.wait_until(condition, timeout=1)
+        assert rows == ['c1']
+    
+    def test_sweep_drops_only_leftovers_of_ended_sessions(self):
+        """Test functions of live sessions survive, those of crashed runs are dropped"""
+        functions = [f"test_notify_change_{LIVE_PID}_0a1b2c3d", "test_notify_change_999_0a1b2c3d",
+                     "test_notify_change_4e5f6a7b"]
+        notifier = ChangeNotifier(['classes'], FakeDBHelper(functions))
+        
+        assert notifier.sweep() == functions[1:]
+        assert notifier.db_helper.cursor.executed[-2:] == [
+            "DROP FUNCTION IF EXISTS test_notify_change_999_0a1b2c3d() CASCADE",
+            "DROP FUNCTION IF EXISTS test_notify_change_4e5f6a7b() CASCADE",
+        ]
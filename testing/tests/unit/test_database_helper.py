@@ -0,0 +1,52 @@
+"""
+Database Helper Test Cases for School Management System
+"""
+import os
+import re
+import pytest
+
+from config.test_config import TestConfig
+from utils.database_helper import TABLE_COLUMNS, insert_statement, timestamp_columns
+
+pytestmark = pytest.mark.unit
+
+CREATE_TABLE = re.compile(r"CREATE TABLE IF NOT EXISTS (\w+) \((.*?)\n\);", re.S)
+CONSTRAINTS = ('PRIMARY', 'UNIQUE', 'FOREIGN', 'CHECK', 'CONSTRAINT')
+
+
+@pytest.fixture(scope="module")
+def schema():
+    """Columns of every table in create_tables.sql: {table: {column: definition}}"""
+    with open(os.path.join(TestConfig.REPO_ROOT, 'create_tables.sql'), 'r') as f:
+        source = f.read()
+    tables = {}
+    for table, body in CREATE_TABLE.findall(source):
+        lines = [line.strip().rstrip(',') for line in body.splitlines() if line.strip()]
+        tables[table] = {line.split()[0]: line for line in lines if not line.startswith(CONSTRAINTS)}
+    return tables
+
+
+class TestTableColumns:
+    """Test cases for the entity column map shared by the batch and async inserts"""
+    
+    @pytest.mark.parametrize("table", sorted(TABLE_COLUMNS))
+    def test_columns_exist_in_schema(self, schema, table):
+        """Test every mapped column, and the insert timestamps, exist in create_tables.sql"""
+        columns = [column for column, _, _ in TABLE_COLUMNS[table]] + timestamp_columns(table)
+        
+        assert not set(columns) - set(schema[table])
+    
+    @pytest.mark.parametrize("table", sorted(TABLE_COLUMNS))
+    def test_required_columns_are_mapped(self, schema, table):
+        """Test every NOT NULL column without a default can be written"""
+        mapped = {column for column, _, _ in TABLE_COLUMNS[table]}
+        required = {column for column, definition in schema[table].items()
+                    if 'NOT NULL' in definition and 'DEFAULT' not in definition}
+        
+        assert not required - mapped
+    
+    def test_insert_statement_sets_only_existing_timestamps(self, schema):
+        """Test tables without updated_at are inserted without it"""
+        assert 'updated_at' not in schema['notifications']
+        assert 'updated_at' not in insert_statement('notifications')
+        assert 'updated_at' in insert_statement('classes')
@@ -0,0 +1,28 @@
+"""
+Duration Scheduler Test Cases for School Management System
+"""
+import os
+import pytest
+
+from utils.duration_scheduler import DurationHistory
+
+pytestmark = pytest.mark.unit
+
+
+class TestDurationHistory:
+    """Test cases for the shared test duration history"""
+    
+    def test_save_keeps_durations_saved_by_a_concurrent_suite(self, tmp_path):
+        """Test two runs that loaded the same history both keep their durations"""
+        path = os.path.join(tmp_path, "test_durations.json")
+        integration, e2e = DurationHistory(path), DurationHistory(path)
+        integration.add("tests/integration/test_api.py::test_login", 1.0)
+        e2e.add("tests/e2e/test_auth.py::test_login", 12.0)
+        
+        integration.save()
+        e2e.save()
+        
+        assert DurationHistory(path).durations == {
+            "tests/e2e/test_auth.py::test_login": 12.0,
+            "tests/integration/test_api.py::test_login": 1.0,
+        }
@@ -0,0 +1,46 @@
+"""
+Index Guard Test Cases for School Management System
+"""
+import pytest
+
+from utils import index_guard
+from utils.index_guard import IndexGuard
+
+pytestmark = pytest.mark.unit
+
+
+class FakeDBHelper:
+    """DatabaseHelper stand-in recording statements and transaction ends in order"""
+    
+    def __init__(self):
+        self.calls = []
+        self.cursor = self
+        self.connection = self
+    
+    def execute(self, statement, params=None):
+        self.calls.append(statement.split()[0])
+    
+    def execute_query(self, query, params=None):
+        return [] if 'pg_class' in query else [{}]
+    
+    def explain_analyze(self, query, params):
+        return {'Plan': {'Node Type': 'Index Scan'}}
+    
+    def rollback(self):
+        self.calls.append('ROLLBACK')
+    
+    def commit(self):
+        self.calls.append('COMMIT')
+
+
+class TestIndexGuard:
+    """Test cases for IndexGuard.run"""
+    
+    def test_statistics_are_restored_after_rollback(self, monkeypatch):
+        """Test the seeded row estimates don't outlive the rolled-back seed"""
+        monkeypatch.setattr(index_guard, 'seed_dataset', lambda db, scale, marker: db.execute('INSERT'))
+        db = FakeDBHelper()
+        
+        IndexGuard(db, budgets={'default': {'max_buffers': 100}}).run({'hot': "SELECT 1"})
+        
+        assert db.calls == ['INSERT', 'ROLLBACK', 'ANALYZE', 'COMMIT']
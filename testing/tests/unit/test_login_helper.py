@@ -0,0 +1,78 @@
+"""
+Login Helper Test Cases for School Management System
+"""
+import pytest
+
+from config.test_config import TestConfig
+from utils import login_helper
+from utils.page_sync import PageSync
+
+pytestmark = pytest.mark.unit
+
+DASHBOARD = "/admin/dashboard"
+USER = {'email': 'admin@test.com', 'password': 'secret'}
+
+
+class FakeDriver:
+    """WebDriver stand-in whose SPA redirects to /login when the token is rejected"""
+    
+    def __init__(self, token_valid):
+        self.token_valid = token_valid
+        self.current_url = ""
+    
+    def get(self, url):
+        self.current_url = url
+    
+    def settle(self):
+        """What the page looks like once its API calls answered"""
+        if not self.token_valid and DASHBOARD in self.current_url:
+            self.current_url = f"{TestConfig.BASE_URL}/login"
+        return True
+
+
+class FakeTokenStore:
+    """TokenStore stand-in recording invalidations"""
+    
+    def __init__(self):
+        self.invalidated = []
+    
+    def get(self, email, password):
+        return {'user': {'email': email}, 'accessToken': 'token', 'refreshToken': 'refresh'}
+    
+    def invalidate(self, email):
+        self.invalidated.append(email)
+
+
+class TestLoginAs:
+    """Test cases for login_as with token injection"""
+    
+    @pytest.fixture
+    def ui_logins(self, monkeypatch):
+        """Record fallbacks to the login form instead of driving a browser"""
+        calls = []
+        monkeypatch.setattr(TestConfig, 'E2E_TOKEN_LOGIN', True)
+        monkeypatch.setattr(login_helper, 'inject_session', lambda driver, session: None)
+        monkeypatch.setattr(PageSync, 'wait', lambda self, timeout=None: self.driver.settle())
+        monkeypatch.setattr(login_helper, 'login_via_ui',
+                            lambda driver, wait, user, dashboard_path: calls.append(user['email']) or driver)
+        return calls
+    
+    def test_invalid_token_falls_back_to_ui_login(self, ui_logins):
+        """A token the API rejects is dropped from the cache and the login form is used"""
+        token_store = FakeTokenStore()
+        
+        login_helper.login_as(FakeDriver(token_valid=False), None, token_store, USER, DASHBOARD)
+        
+        assert token_store.invalidated == [USER['email']]
+        assert ui_logins == [USER['email']]
+    
+    def test_valid_token_skips_ui_login(self, ui_logins):
+        """An accepted token keeps the dashboard without touching the login form"""
+        token_store = FakeTokenStore()
+        driver = FakeDriver(token_valid=True)
+        
+        login_helper.login_as(driver, None, token_store, USER, DASHBOARD)
+        
+        assert driver.current_url.endswith(DASHBOARD)
+        assert token_store.invalidated == []
+        assert ui_logins == []
@@ -0,0 +1,81 @@
+"""
+Page Metrics Test Cases for School Management System
+"""
+import json
+
+import pytest
+
+from config.test_config import TestConfig
+from utils.page_metrics import PageMetricsCollector, RouteMatcher, aggregate, check_budgets
+
+pytestmark = pytest.mark.unit
+
+LOADED_AT = 1700000000000.0  # epoch ms of the document navigation
+
+
+def network_event(request_id, path, wall_time):
+    """Chrome performance log entry for one API request"""
+    return {'message': json.dumps({'message': {'method': 'Network.requestWillBeSent', 'params': {
+        'requestId': request_id, 'timestamp': wall_time, 'wallTime': wall_time,
+        'request': {'method': 'GET', 'url': f"{TestConfig.API_BASE_URL}{path}"}}}})}
+
+
+class FakeDriver:
+    """WebDriver stand-in that loaded the dashboard and then pushState'd to the class list"""
+    
+    def __init__(self):
+        self.current_url = f"{TestConfig.BASE_URL}/admin/classes"
+        self.log = [network_event('1', '/dashboard/admin', LOADED_AT / 1000 + 0.1),
+                    network_event('2', '/classes', LOADED_AT / 1000 + 2.1)]
+    
+    def get_log(self, name):
+        log, self.log = self.log, []
+        return log
+    
+    def execute_script(self, script):
+        segment = {'ttfb': None, 'fcp': None, 'lcp': None, 'load': None, 'cls': 0}
+        return [{**segment, 'url': f"{TestConfig.BASE_URL}/admin/dashboard", 'navigation': 'document',
+                 'wallStart': LOADED_AT, 'ttfb': 50},
+                {**segment, 'url': f"{TestConfig.BASE_URL}/admin/classes", 'navigation': 'client',
+                 'wallStart': LOADED_AT + 2000}]
+
+
+class TestPageMetrics:
+    """Test cases for capturing client-side route changes"""
+    
+    @pytest.fixture
+    def collector(self, tmp_path):
+        """Collector that knows the two admin routes"""
+        return PageMetricsCollector(str(tmp_path), RouteMatcher(['/admin/dashboard', '/admin/classes']))
+    
+    def test_route_change_gets_its_own_record(self, collector):
+        """Test a pushState navigation is recorded with the API calls sent after it"""
+        records = collector.capture(FakeDriver(), 'test_navigate')
+        
+        assert [(r['route'], r['navigation'], r['apiCalls']) for r in records] == [
+            ('/admin/dashboard', 'document', ['GET /api/v1/dashboard/admin']),
+            ('/admin/classes', 'client', ['GET /api/v1/classes']),
+        ]
+    
+    def test_route_changes_are_aggregated_apart_from_page_loads(self, collector):
+        """Test client navigations get a '(client)' summary held to the route's budgets"""
+        records = collector.capture(FakeDriver(), 'test_navigate')
+        records.append({**records[1], 'navigation': 'document', 'route': '/admin/classes', 'cls': 0.5})
+        
+        summary = aggregate(records)
+        violations = check_budgets(summary, {'default': {'cls': 0.1, 'ttfb': 10}})
+        
+        assert sorted(summary) == ['/admin/classes', '/admin/classes (client)', '/admin/dashboard']
+        assert violations == ["/admin/classes: cls p75=0.5 exceeds budget 0.1",
+                              "/admin/dashboard: ttfb p75=50.0 exceeds budget 10"]
+    
+    def test_every_device_profile_has_budgets(self):
+        """Test no configured profile's throttled runs go unchecked"""
+        assert [name for name, profile in TestConfig.DEVICE_PROFILES.items() if not profile.get('budgets')] == []
+    
+    def test_profile_without_budgets_is_a_violation(self, monkeypatch):
+        """Test a run under a profile with no budgets fails instead of passing silently"""
+        monkeypatch.setitem(TestConfig.DEVICE_PROFILES, 'unbudgeted', {'cpu_slowdown': 2})
+        summary = aggregate([{'route': '/admin/dashboard', 'profile': 'unbudgeted', 'ttfb': 50}])
+        
+        assert check_budgets(summary) == ["/admin/dashboard @unbudgeted: no budgets for device profile unbudgeted"]
@@ -0,0 +1,22 @@
+"""
+Test Configuration Test Cases for School Management System
+"""
+import pytest
+
+from config.test_config import TestConfig
+
+pytestmark = pytest.mark.unit
+
+
+class TestBrowserOptions:
+    """Test cases for TestConfig.get_browser_options"""
+    
+    @pytest.mark.parametrize("page_metrics", [True, False])
+    def test_performance_log_only_with_page_metrics(self, monkeypatch, page_metrics):
+        """Test Chrome buffers DevTools network events only when page metrics read them"""
+        monkeypatch.setattr(TestConfig, 'BROWSER', 'chrome')
+        monkeypatch.setattr(TestConfig, 'PAGE_METRICS', page_metrics)
+        
+        capabilities = TestConfig.get_browser_options().to_capabilities()
+        
+        assert ('goog:loggingPrefs' in capabilities) == page_metrics
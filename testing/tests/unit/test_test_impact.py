@@ -0,0 +1,98 @@
+"""
+Test Impact Selection Test Cases for School Management System
+"""
+import os
+import pytest
+
+from utils.test_impact import BackendRouteMap, Endpoint, ImpactMap, impacted_tests
+
+pytestmark = pytest.mark.unit
+
+CONTROLLER = "backend/src/controllers/attendanceController.ts"
+
+
+class FakeRouteMap:
+    """BackendRouteMap stand-in with a single attendance endpoint"""
+    
+    def __init__(self):
+        self.endpoints = [Endpoint('GET', '/api/v1/attendance', "backend/src/routes/attendance.ts",
+                                   CONTROLLER, 'getAttendance')]
+    
+    def match(self, call):
+        return self.endpoints[0] if call == 'GET /api/v1/attendance' else None
+
+
+class TestImpactSelection:
+    """Test cases for impacted_tests"""
+    
+    @pytest.fixture
+    def impact_map(self, tmp_path):
+        """Map in which one test of test_attendance.py hit the changed endpoint and one did not"""
+        impact_map = ImpactMap(os.path.join(tmp_path, "impact_map.json"))
+        impact_map.update("tests/test_attendance.py::test_list", ['GET /api/v1/attendance'], [])
+        impact_map.update("tests/test_attendance.py::test_other", ['GET /api/v1/homework'], [])
+        return impact_map
+    
+    def test_unmapped_tests_in_mapped_files_are_selected(self, impact_map):
+        """Every collected node id missing from the map is selected, not only unmapped files"""
+        collected = [
+            "tests/test_attendance.py::test_list",
+            "tests/test_attendance.py::test_other",
+            "tests/test_attendance.py::test_added_since_last_run",
+            "tests/test_homework.py::test_create",
+        ]
+        
+        selected = impacted_tests([CONTROLLER], impact_map, FakeRouteMap(), collected)
+        
+        assert selected == {
+            "tests/test_attendance.py::test_list",
+            "tests/test_attendance.py::test_added_since_last_run",
+            "tests/test_homework.py::test_create",
+        }
+    
+    def test_failed_collection_runs_everything(self, impact_map, monkeypatch):
+        """Tests that can't be listed can't be ruled out"""
+        monkeypatch.setattr("utils.test_impact.collected_tests", lambda: None)
+        
+        assert impacted_tests([CONTROLLER], impact_map, FakeRouteMap()) is None
+    
+    def test_requirements_change_runs_everything(self, impact_map):
+        """Dependency pins are .txt files but can change any test's outcome"""
+        assert impacted_tests(["testing/requirements.txt"], impact_map, FakeRouteMap(), []) is None
+    
+    def test_route_file_without_parsed_routes_runs_everything(self, impact_map):
+        """A changed route file the parser found no endpoints in can't be attributed"""
+        assert impacted_tests(["backend/src/routes/reports.ts"], impact_map, FakeRouteMap(), []) is None
+    
+    def test_multi_line_route_calls_are_parsed(self, tmp_path):
+        """Test router calls split over several lines map to their controller"""
+        os.makedirs(os.path.join(tmp_path, "backend/src/routes"))
+        with open(os.path.join(tmp_path, "backend/src/index.ts"), "w") as f:
+            f.write("import attendanceRoutes from './routes/attendance';\n"
+                    "app.use('/api/v1/attendance', attendanceRoutes);\n")
+        with open(os.path.join(tmp_path, "backend/src/routes/attendance.ts"), "w") as f:
+            f.write("import { getAttendance } from '../controllers/attendanceController';\n"
+                    "router.get(\n"
+                    "  '/:id',\n"
+                    "  authorize('admin', 'teacher'),\n"
+                    "  getAttendance,\n"
+                    ");\n")
+        
+        route_map = BackendRouteMap(str(tmp_path))
+        
+        assert route_map.match('GET /api/v1/attendance/42') == Endpoint(
+            'GET', '/api/v1/attendance/:id', "backend/src/routes/attendance.ts", CONTROLLER, 'getAttendance')
+    
+    def test_save_keeps_entries_saved_by_a_concurrent_suite(self, impact_map):
+        """Test saving merges into the file instead of overwriting another suite's tests"""
+        other_suite = ImpactMap(impact_map.path)
+        other_suite.update("tests/test_homework.py::test_create", ['POST /api/v1/homework'], [])
+        other_suite.save()
+        
+        impact_map.save()
+        
+        assert sorted(ImpactMap(impact_map.path).tests) == [
+            "tests/test_attendance.py::test_list",
+            "tests/test_attendance.py::test_other",
+            "tests/test_homework.py::test_create",
+        ]
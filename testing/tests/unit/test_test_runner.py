@@ -0,0 +1,125 @@
+"""
+Test Runner Test Cases for School Management System
+"""
+import io
+import os
+import pytest
+
+import run_tests
+from utils.test_orchestrator import TestOrchestrator
+
+pytestmark = pytest.mark.unit
+
+
+class FakeProcess:
+    """Popen stand-in that records its environment and exits cleanly"""
+    
+    pid = 4321
+    
+    def __init__(self, command, env=None, **kwargs):
+        self.command = command
+        self.env = env
+        self.kwargs = kwargs
+        self.stdout = iter([])
+        FakeProcess.started.append(self)
+    
+    def wait(self):
+        return 0
+    
+    def poll(self):
+        return 0
+
+
+class TestRunner:
+    """Test cases for the test runner"""
+    
+    @pytest.fixture(autouse=True)
+    def report_collection(self, monkeypatch, tmp_path):
+        """Enable report collection the way --generate-report does, in a scratch directory"""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("PYTEST_ADDOPTS", "")
+        monkeypatch.setattr(run_tests.subprocess, "Popen", FakeProcess)
+        monkeypatch.setattr("utils.test_orchestrator.subprocess.Popen", FakeProcess)
+        FakeProcess.started = []
+        run_tests.enable_report_collection()
+        assert "--html=reports/report.html" in os.environ["PYTEST_ADDOPTS"]
+        assert "--junitxml=reports/junit.xml" in os.environ["PYTEST_ADDOPTS"]
+    
+    def test_performance_run_ignores_report_collection(self):
+        """Test --generate-report --test-type performance doesn't pass report options to the perf profile"""
+        assert run_tests.run_performance_tests()
+        
+        env = FakeProcess.started[0].env
+        assert env["PYTEST_ADDOPTS"] == ""
+        assert env["PERF_MODE"] == "true"
+    
+    def test_report_without_coverage_data_succeeds(self):
+        """Test --generate-report --test-type performance doesn't fail on the coverage it never collected"""
+        assert run_tests.run_performance_tests()
+        
+        assert run_tests.generate_report()
+        
+        assert not any("coverage" in process.command for process in FakeProcess.started)
+    
+    def test_performance_suite_ignores_report_collection(self):
+        """Test --generate-report --suites performance doesn't pass report options to the perf profile"""
+        orchestrator = TestOrchestrator([run_tests.SUITES["performance"], run_tests.SUITES["integration"]])
+        orchestrator.run()
+        
+        envs = {process.command[3]: process.env for process in FakeProcess.started}
+        assert envs["tests/performance/"]["PYTEST_ADDOPTS"] == ""
+        assert "--html=reports/report.html" in envs["tests/integration/"]["PYTEST_ADDOPTS"]
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="1" failures="2" skipped="1" tests="10"></testsuite></testsuites>
+"""
+
+
+class TestOrchestratorRun:
+    """Test cases for the concurrent suite orchestrator"""
+    
+    @pytest.fixture(autouse=True)
+    def fake_popen(self, monkeypatch, tmp_path):
+        """Start suites as fake processes that write a junit XML, in a scratch directory"""
+        class QuietProcess(FakeProcess):
+            def __init__(self, command, env=None, **kwargs):
+                super().__init__(command, env, **kwargs)
+                self.stdout = iter([".F..FsE...                                [100%]\n"])
+                junit_path = next(arg for arg in command if arg.startswith("--junitxml="))
+                with open(junit_path.split("=", 1)[1], "w") as f:
+                    f.write(JUNIT_XML)
+        
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("reports")
+        monkeypatch.setattr("utils.test_orchestrator.subprocess.Popen", QuietProcess)
+        FakeProcess.started = []
+    
+    def test_counts_come_from_junit_xml(self):
+        """Test pass/fail counts are right even though -q prints no per-test outcome words"""
+        orchestrator = TestOrchestrator([run_tests.SUITES["performance"]], stream=io.StringIO())
+        orchestrator.run()
+        
+        assert "-q" in FakeProcess.started[0].command
+        assert orchestrator.counts["performance"] == {"passed": 6, "failed": 2, "errors": 1}
+    
+    def test_suites_start_in_their_own_session(self, monkeypatch):
+        """Test suites start without preexec_fn and get their CPU priority from setpriority"""
+        priorities = []
+        monkeypatch.setattr("utils.test_orchestrator.os.setpriority",
+                            lambda which, pid, value: priorities.append((pid, value)), raising=False)
+        monkeypatch.setattr("utils.test_orchestrator.os.getpriority", lambda which, pid: 0, raising=False)
+        
+        TestOrchestrator([run_tests.SUITES["e2e"]], stream=io.StringIO()).run()
+        
+        kwargs = FakeProcess.started[0].kwargs
+        assert kwargs["start_new_session"] is True
+        assert "preexec_fn" not in kwargs
+        assert priorities == [(FakeProcess.pid, run_tests.SUITES["e2e"].nice)]
+    
+    def test_suites_write_reports_under_their_own_name(self):
+        """Test each suite process is told its name, which selects its reports directory"""
+        TestOrchestrator([run_tests.SUITES["integration"], run_tests.SUITES["e2e"]], stream=io.StringIO()).run()
+        
+        suites = sorted(process.env["TEST_SUITE"] for process in FakeProcess.started)
+        assert suites == ["e2e", "integration"]
@@ -0,0 +1,83 @@
+"""
+API chattiness analysis from the Chrome performance log
+"""
+import json
+from typing import Dict, Any, List
+from urllib.parse import urlparse
+
+from config.test_config import TestConfig
+
+
+def drain_performance_log(driver) -> List[Dict[str, Any]]:
+    """Read (and thereby clear) DevTools events from the Chrome performance log"""
+    try:
+        entries = driver.get_log('performance')
+    except Exception:
+        return []  # performance log not enabled or browser is not Chromium
+
+    events = []
+    for entry in entries:
+        message = json.loads(entry['message'])['message']
+        if message['method'].startswith('Network.'):
+            events.append(message)
+    return events
+
+
+def collect_api_requests(events: List[Dict[str, Any]], api_base_url: str = None) -> List[Dict[str, Any]]:
+    """Rebuild API requests (method, url, body, timing, bytes) from Network events"""
+    api_base_url = api_base_url or TestConfig.API_BASE_URL
+    requests = {}
+
+    for event in events:
+        params = event['params']
+        request_id = params.get('requestId')
+
+        if event['method'] == 'Network.requestWillBeSent':
+            request = params['request']
+            if not request['url'].startswith(api_base_url) or request['method'] == 'OPTIONS':
+                continue
+            requests.setdefault(request_id, {
+                'method': request['method'],
+                'url': request['url'],
+                'body': request.get('postData'),
+                'start': params['timestamp'],
+                'wall': params.get('wallTime'),  # epoch seconds, to attribute it to a route change
+                'end': None,
+                'bytes': 0
+            })
+        elif request_id in requests and event['method'] in ('Network.loadingFinished', 'Network.loadingFailed'):
+            requests[request_id]['end'] = params['timestamp']
+            requests[request_id]['bytes'] = params.get('encodedDataLength', 0)
+
+    return sorted(requests.values(), key=lambda r: r['start'])
+
+
+def waterfall_depth(requests: List[Dict[str, Any]]) -> int:
+    """Length of the longest chain of requests that each started after the previous finished"""
+    depths = []
+    for i, request in enumerate(requests):
+        depth = 1
+        for j in range(i):
+            previous = requests[j]
+            if previous['end'] is not None and previous['end'] <= request['start']:
+                depth = max(depth, depths[j] + 1)
+        depths.append(depth)
+    return max(depths, default=0)
+
+
+def summarize_api_requests(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Summarize a page's API traffic: counts, bytes, serial depth and duplicates"""
+    seen = {}
+    for request in requests:
+        key = (request['method'], request['url'], request['body'])
+        seen[key] = seen.get(key, 0) + 1
+    duplicates = {f"{method} {url}": count for (method, url, _), count in seen.items() if count > 1}
+
+    return {
+        'apiRequests': len(requests),
+        'apiBytes': sum(r['bytes'] for r in requests),
+        'apiDepth': waterfall_depth(requests),
+        'apiDuplicates': sum(count - 1 for count in duplicates.values()),
+        'apiDuplicateCalls': duplicates,
+        'apiCalls': sorted({f"{r['method']} {urlparse(r['url']).path}" for r in requests})
+    }
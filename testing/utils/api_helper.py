@@ -5,6 +5,7 @@ import requests
 import json
 import time
 from typing import Dict, Any, Optional
+from urllib.parse import urlparse
 from config.test_config import TestConfig
 
 class APIHelper:
@@ -16,6 +17,14 @@ class APIHelper:
         self.session.timeout = TestConfig.API_TIMEOUT
         self.access_token = None
         self.refresh_token = None
+        self.calls = set()  # 'METHOD /path' of every request, for test impact selection
+        self.api_time = 0.0  # seconds spent waiting on responses
+        self.session.hooks['response'].append(self._record_call)
+    
+    def _record_call(self, response, *args, **kwargs):
+        """Remember which endpoint a request hit and how long it took"""
+        self.calls.add(f"{response.request.method} {urlparse(response.request.url).path}")
+        self.api_time += response.elapsed.total_seconds()
     
     def set_headers(self, headers: Dict[str, str] = None):
         """Set request headers"""
@@ -265,6 +274,10 @@ class APIHelper:
         return self.get('/dashboard/parent', params)
     
     # Analytics APIs
+    def get_school_analytics(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Get school analytics"""
+        return self.get('/analytics/school', params)
+    
     def get_attendance_analytics(self, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """Get attendance analytics"""
         return self.get('/analytics/attendance', params)
@@ -309,8 +322,13 @@ class APIHelper:
         
         return True
     
-    def wait_for_condition(self, condition_func, timeout: int = 30, interval: float = 1.0) -> bool:
+    def wait_for_condition(self, condition_func, timeout: int = 30, interval: float = 1.0,
+                           notifier=None) -> bool:
         """Wait for a condition to be true"""
+        # A ChangeNotifier re-checks whenever a watched table changes instead of every interval
+        if notifier is not None:
+            return notifier.wait_until(condition_func, timeout)
+        
         start_time = time.time()
         
         while time.time() - start_time < timeout:
@@ -0,0 +1,200 @@
+"""
+Async Database Helper for School Management System Testing
+"""
+import time
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from config.test_config import TestConfig
+from utils.database_helper import ESTIMATE_COUNT_QUERY, insert_params, insert_statement
+from utils.query_stats import query_stats
+
+
+class AsyncDatabaseHelper:
+    """Async counterpart of DatabaseHelper for verification running alongside async load.
+
+    Statements run on a psycopg 3 connection pool as server-side prepared
+    statements, and execute_pipelined sends a batch of statements on one
+    connection without waiting for each result. Every method is a coroutine
+    with the same name and arguments as its DatabaseHelper equivalent.
+    """
+
+    def __init__(self, min_size: int = None, max_size: int = None):
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        self.pool = AsyncConnectionPool(
+            min_size=min_size or TestConfig.DB_POOL_MIN_SIZE,
+            max_size=max_size or TestConfig.DB_POOL_MAX_SIZE,
+            open=False,
+            kwargs={
+                'host': TestConfig.DB_HOST,
+                'port': TestConfig.DB_PORT,
+                'dbname': TestConfig.DB_NAME,
+                'user': TestConfig.DB_USER,
+                'password': TestConfig.DB_PASSWORD,
+                'row_factory': dict_row,
+            }
+        )
+        self.stats = query_stats if TestConfig.DB_QUERY_STATS else None
+
+    async def connect(self):
+        """Open the pool and wait for its minimum number of connections"""
+        try:
+            await self.pool.open()
+            await self.pool.wait()
+        except Exception as e:
+            print(f"Database connection failed: {e}")
+            raise
+
+    async def disconnect(self):
+        """Close every pooled connection"""
+        await self.pool.close()
+
+    async def _execute(self, connection, query: str, params=None):
+        """Execute a prepared statement, timing it when query statistics are enabled"""
+        start_time = time.perf_counter()
+        cursor = await connection.execute(query, params, prepare=True)
+        if self.stats:
+            self.stats.record(query, time.perf_counter() - start_time, cursor.rowcount)
+        return cursor
+
+    async def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
+        """Execute SELECT query and return results"""
+        try:
+            async with self.pool.connection() as connection:
+                cursor = await self._execute(connection, query, params)
+                return await cursor.fetchall()
+        except Exception as e:
+            print(f"Query execution failed: {e}")
+            raise
+
+    async def execute_update(self, query: str, params: tuple = None) -> int:
+        """Execute INSERT/UPDATE/DELETE query and return affected rows (committed on return)"""
+        try:
+            async with self.pool.connection() as connection:
+                cursor = await self._execute(connection, query, params)
+                return cursor.rowcount
+        except Exception as e:
+            print(f"Update execution failed: {e}")
+            raise
+
+    async def execute_pipelined(self, statements: Sequence[Tuple[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Send (query, params) pairs in one pipeline on one connection and return each result set"""
+        try:
+            async with self.pool.connection() as connection:
+                async with connection.pipeline():
+                    cursors = [await connection.execute(query, params, prepare=True)
+                               for query, params in statements]
+                return [await cursor.fetchall() if cursor.description else [] for cursor in cursors]
+        except Exception as e:
+            print(f"Pipelined execution failed: {e}")
+            raise
+
+    async def _get_by_id(self, table: str, record_id: str) -> Optional[Dict[str, Any]]:
+        results = await self.execute_query(f"SELECT * FROM {table} WHERE id = %s", (record_id,))
+        return results[0] if results else None
+
+    async def _insert(self, table: str, data: Dict[str, Any]) -> str:
+        result = await self.execute_query(insert_statement(table), insert_params(table, data))
+        return result[0]['id'] if result else None
+
+    async def get_many_by_id(self, table: str, record_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Look up many rows by ID in one pipeline, in input order"""
+        results = await self.execute_pipelined(
+            [(f"SELECT * FROM {table} WHERE id = %s", (record_id,)) for record_id in record_ids])
+        return [rows[0] if rows else None for rows in results]
+
+    async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Get user by email"""
+        results = await self.execute_query("SELECT * FROM users WHERE email = %s", (email,))
+        return results[0] if results else None
+
+    async def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get user by ID"""
+        return await self._get_by_id('users', user_id)
+
+    async def create_user(self, user_data: Dict[str, Any]) -> str:
+        """Create user and return ID"""
+        return await self._insert('users', user_data)
+
+    async def get_class_by_id(self, class_id: str) -> Optional[Dict[str, Any]]:
+        """Get class by ID"""
+        return await self._get_by_id('classes', class_id)
+
+    async def create_class(self, class_data: Dict[str, Any]) -> str:
+        """Create class and return ID"""
+        return await self._insert('classes', class_data)
+
+    async def get_attendance_by_date(self, date: str, class_id: str = None) -> List[Dict[str, Any]]:
+        """Get attendance records by date"""
+        if class_id:
+            return await self.execute_query(
+                "SELECT * FROM attendance WHERE date = %s AND class_id = %s", (date, class_id))
+        return await self.execute_query("SELECT * FROM attendance WHERE date = %s", (date,))
+
+    async def create_attendance(self, attendance_data: Dict[str, Any]) -> str:
+        """Create attendance record and return ID"""
+        return await self._insert('attendance', attendance_data)
+
+    async def get_homework_by_id(self, homework_id: str) -> Optional[Dict[str, Any]]:
+        """Get homework by ID"""
+        return await self._get_by_id('homework', homework_id)
+
+    async def create_homework(self, homework_data: Dict[str, Any]) -> str:
+        """Create homework and return ID"""
+        return await self._insert('homework', homework_data)
+
+    async def get_notification_by_id(self, notification_id: str) -> Optional[Dict[str, Any]]:
+        """Get notification by ID"""
+        return await self._get_by_id('notifications', notification_id)
+
+    async def create_notification(self, notification_data: Dict[str, Any]) -> str:
+        """Create notification and return ID"""
+        return await self._insert('notifications', notification_data)
+
+    async def get_qa_message_by_id(self, qa_id: str) -> Optional[Dict[str, Any]]:
+        """Get Q&A message by ID"""
+        return await self._get_by_id('qa_messages', qa_id)
+
+    async def create_qa_message(self, qa_data: Dict[str, Any]) -> str:
+        """Create Q&A message and return ID"""
+        return await self._insert('qa_messages', qa_data)
+
+    async def get_complaint_by_id(self, complaint_id: str) -> Optional[Dict[str, Any]]:
+        """Get complaint by ID"""
+        return await self._get_by_id('complaints', complaint_id)
+
+    async def create_complaint(self, complaint_data: Dict[str, Any]) -> str:
+        """Create complaint and return ID"""
+        return await self._insert('complaints', complaint_data)
+
+    async def get_table_count(self, table: str, condition: str = None, approximate: bool = False) -> int:
+        """Get count of records in table, optionally estimated from statistics instead of scanned"""
+        if approximate and condition:
+            plan = await self.execute_query(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {condition}")
+            return int(plan[0]['QUERY PLAN'][0]['Plan']['Plan Rows'])
+        if approximate:
+            result = await self.execute_query(ESTIMATE_COUNT_QUERY, (table,))
+            return int(result[0]['estimate']) if result else 0
+
+        query = f"SELECT COUNT(*) FROM {table}" + (f" WHERE {condition}" if condition else "")
+        result = await self.execute_query(query)
+        return result[0]['count'] if result else 0
+
+    async def find_missing_records(self, table: str, record_ids: List[str], batch_size: int = 10000) -> List[str]:
+        """Return the ids that have no row in table, pipelining one = ANY query per batch"""
+        query = f"SELECT id::text AS id FROM {table} WHERE id = ANY(%s::uuid[])"
+        batches = [[str(record_id) for record_id in record_ids[start:start + batch_size]]
+                   for start in range(0, len(record_ids), batch_size)]
+        results = await self.execute_pipelined([(query, (batch,)) for batch in batches])
+        found = {row['id'] for rows in results for row in rows}
+        return [record_id for record_id in record_ids if str(record_id) not in found]
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.disconnect()
@@ -0,0 +1,133 @@
+"""
+Browser Pool for School Management System Testing
+"""
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.edge.service import Service as EdgeService
+
+from config.test_config import TestConfig
+from utils.device_profiles import apply_device_profile
+from utils.page_metrics import PageMetricsCollector
+from utils.page_sync import PageSync
+
+
+class BrowserPool:
+    """Reusable WebDriver session with fast state reset between tests.
+
+    One pool is created per pytest process, i.e. one browser per xdist worker.
+    The browser is recycled after ``recycle_after`` tests or when it stops
+    responding.
+    """
+
+    def __init__(self, config=TestConfig, recycle_after: int = None, driver_path: str = None):
+        self.config = config
+        self.recycle_after = recycle_after or config.BROWSER_RECYCLE_AFTER
+        self.driver = None
+        self.uses = 0
+        self._driver_path = driver_path  # pools launched together can share one resolved binary
+
+    def install_driver(self) -> str:
+        """Resolve the driver binary once per pool instead of once per test"""
+        if not self._driver_path:
+            # Only the manager for the configured browser is imported
+            browser = self.config.BROWSER.lower()
+            if browser == 'chrome':
+                from webdriver_manager.chrome import ChromeDriverManager
+                self._driver_path = ChromeDriverManager().install()
+            elif browser == 'firefox':
+                from webdriver_manager.firefox import GeckoDriverManager
+                self._driver_path = GeckoDriverManager().install()
+            elif browser == 'edge':
+                from webdriver_manager.microsoft import EdgeChromiumDriverManager
+                self._driver_path = EdgeChromiumDriverManager().install()
+            else:
+                raise ValueError(f"Unsupported browser: {self.config.BROWSER}")
+        return self._driver_path
+
+    def create_driver(self):
+        """Create and configure a new WebDriver"""
+        browser = self.config.BROWSER.lower()
+        driver_path = self.install_driver()
+
+        if browser == 'chrome':
+            options = self.config.get_browser_options()
+            driver = webdriver.Chrome(service=ChromeService(driver_path), options=options)
+        elif browser == 'firefox':
+            options = self.config.get_browser_options()
+            driver = webdriver.Firefox(service=FirefoxService(driver_path), options=options)
+        else:
+            driver = webdriver.Edge(service=EdgeService(driver_path))
+
+        # Configure driver
+        driver.implicitly_wait(self.config.IMPLICIT_WAIT)
+        driver.set_page_load_timeout(self.config.PAGE_LOAD_TIMEOUT)
+        driver.maximize_window()
+        PageSync.install(driver)
+        if self.config.PAGE_METRICS:
+            PageMetricsCollector.install(driver)
+        apply_device_profile(driver, self.config.DEVICE_PROFILE)
+
+        return driver
+
+    def is_alive(self) -> bool:
+        """Check whether the browser session still responds"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            # A quit/crashed driver raises connection errors, not only WebDriverException
+            return False
+
+    def acquire(self):
+        """Get a clean browser, launching or recycling one if needed"""
+        if self.uses >= self.recycle_after or not self.is_alive():
+            self.quit()
+            self.driver = self.create_driver()
+        self.uses += 1
+        return self.driver
+
+    def reset(self):
+        """Clear browser state so the next test starts fresh"""
+        driver = self.driver
+
+        # Close any extra windows/tabs opened by the test
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage is per-origin, so clear it before leaving the app page
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass  # about:blank/data: pages have no storage
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def release(self, healthy: bool = True):
+        """Return the browser to the pool, dropping it if it can't be reset"""
+        if not self.driver:
+            return
+        if not healthy or self.uses >= self.recycle_after:
+            self.quit()
+            return
+        try:
+            self.reset()
+        except Exception as e:
+            print(f"Browser reset failed, recycling: {e}")
+            self.quit()
+
+    def quit(self):
+        """Close the pooled browser"""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Error closing driver: {e}")
+        self.driver = None
+        self.uses = 0
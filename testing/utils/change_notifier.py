@@ -0,0 +1,191 @@
+"""
+LISTEN/NOTIFY database change notification for School Management System Testing
+"""
+import json
+import os
+import re
+import select
+import threading
+import time
+import uuid
+from typing import Callable, Dict, Any, List
+
+from config.test_config import TestConfig
+
+CHANNEL = 'test_changes'
+
+# Every notifier's function is named test_notify_change_<backend pid>_<random>;
+# dropping it CASCADE also drops its test_notify_<table>_... triggers
+FUNCTION_PREFIX = 'test_notify_change_'
+FUNCTION_PID = re.compile(r'^test_notify_change_(\d+)_[0-9a-f]+$')
+
+LEFTOVER_FUNCTIONS_QUERY = """
+SELECT proname FROM pg_proc WHERE proname LIKE %s
+"""
+
+# Formatted with a per-notifier function name and channel
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+DECLARE
+    row_id text;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        row_id := OLD.id::text;
+    ELSE
+        row_id := NEW.id::text;
+    END IF;
+    PERFORM pg_notify('{channel}', json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', row_id)::text);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+class ChangeNotifier:
+    """Block until rows are committed instead of polling the database.
+
+    Test-installed AFTER triggers send a NOTIFY per changed row. Postgres only
+    delivers notifications when the writing transaction commits, so a received
+    event means the row is visible to other sessions. Trigger, function and
+    channel names are unique per notifier so concurrent workers sharing the
+    database don't drop each other's triggers; they carry the listening
+    session's pid so leftovers of crashed runs can be swept at install.
+
+    A listener thread reads notifications as they arrive, so each event's
+    ``received`` time is when Postgres delivered it, not when a test looked.
+    """
+
+    def __init__(self, tables: List[str] = None, db_helper=None):
+        if db_helper is None:
+            from utils.database_helper import DatabaseHelper
+            db_helper = DatabaseHelper()
+            db_helper.connection.autocommit = True  # LISTEN and delivery happen outside transactions
+        self.db_helper = db_helper
+        self.tables = tables or TestConfig.CHANGE_NOTIFY_TABLES
+        self.events = []
+        self.received_count = 0  # never reset, so waiters notice events cleared meanwhile
+        self._changed = threading.Condition()
+        self._listener = None
+        self._wakeup = None
+        suffix = f"{self.db_helper.connection.get_backend_pid()}_{uuid.uuid4().hex[:8]}"
+        self.channel = f"{CHANNEL}_{suffix}"
+        self.function = f"{FUNCTION_PREFIX}{suffix}"
+        self.triggers = {table: f"test_notify_{table}_{suffix}" for table in self.tables}
+
+    def sweep(self) -> List[str]:
+        """Drop notify functions (and their triggers) left behind by sessions that are gone"""
+        cursor = self.db_helper.cursor
+        cursor.execute(LEFTOVER_FUNCTIONS_QUERY, (FUNCTION_PREFIX.replace('_', '\\_') + '%',))
+        functions = [row['proname'] for row in cursor.fetchall()]
+        cursor.execute("SELECT pid FROM pg_stat_activity")
+        live = {row['pid'] for row in cursor.fetchall()}
+
+        stale = []
+        for function in functions:
+            match = FUNCTION_PID.match(function)
+            if not match or int(match.group(1)) not in live:
+                cursor.execute(f"DROP FUNCTION IF EXISTS {function}() CASCADE")
+                stale.append(function)
+        return stale
+
+    def install(self):
+        """Sweep leftovers, create the notify trigger on every watched table and start listening"""
+        self.sweep()
+        cursor = self.db_helper.cursor
+        cursor.execute(TRIGGER_FUNCTION.format(function=self.function, channel=self.channel))
+        for table, trigger in self.triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+            cursor.execute(f"CREATE TRIGGER {trigger} AFTER INSERT OR UPDATE OR DELETE ON {table} "
+                           f"FOR EACH ROW EXECUTE FUNCTION {self.function}()")
+        cursor.execute(f"LISTEN {self.channel}")
+
+        self._wakeup = os.pipe()
+        self._listener = threading.Thread(target=self._listen, name='change-notifier', daemon=True)
+        self._listener.start()
+
+    def uninstall(self):
+        """Stop the listener, stop listening and drop the triggers"""
+        if self._listener:
+            os.write(self._wakeup[1], b'x')
+            self._listener.join()
+            for fd in self._wakeup:
+                os.close(fd)
+            self._listener = None
+        cursor = self.db_helper.cursor
+        cursor.execute(f"UNLISTEN {self.channel}")
+        for table, trigger in self.triggers.items():
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {table}")
+        cursor.execute(f"DROP FUNCTION IF EXISTS {self.function}()")
+
+    def _listen(self):
+        """Block on the connection and buffer notifications the moment they arrive"""
+        connection = self.db_helper.connection
+        while True:
+            readable = select.select([connection, self._wakeup[0]], [], [])[0]
+            if self._wakeup[0] in readable:
+                return
+            connection.poll()
+            received = time.perf_counter()
+            with self._changed:
+                while connection.notifies:
+                    notify = connection.notifies.pop(0)
+                    self.events.append({**json.loads(notify.payload), 'received': received})
+                    self.received_count += 1
+                self._changed.notify_all()
+
+    def clear(self):
+        """Forget buffered events, e.g. between phases of a test"""
+        with self._changed:
+            self.events = []
+
+    def wait_until(self, condition: Callable[[], bool], timeout: float = None) -> bool:
+        """Re-check condition each time a watched table changes instead of on a timer"""
+        timeout = TestConfig.EXPLICIT_WAIT if timeout is None else timeout
+        deadline = time.perf_counter() + timeout
+
+        while True:
+            seen = self.received_count
+            if condition():
+                return True
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            with self._changed:
+                self._changed.wait_for(lambda: self.received_count > seen, remaining)
+
+    def wait_for(self, table: str, ids: List[str] = None, op: str = 'INSERT', count: int = 1,
+                 timeout: float = None) -> List[Dict[str, Any]]:
+        """Wait until the given row ids (or count rows) were changed on a table.
+
+        Returns the matching events, each with its perf_counter() receive time;
+        fewer than expected when the timeout expires.
+        """
+        timeout = TestConfig.EXPLICIT_WAIT if timeout is None else timeout
+        deadline = time.perf_counter() + timeout
+        wanted = [str(i) for i in ids] if ids is not None else None
+        wanted_set = set(wanted or [])
+
+        with self._changed:
+            while True:
+                matches = [e for e in self.events if e['table'] == table and e['op'] == op
+                           and (wanted is None or e['id'] in wanted_set)]
+                if wanted is not None:
+                    first = {}
+                    for event in matches:
+                        first.setdefault(event['id'], event)
+                    if len(first) == len(wanted_set):
+                        return [first[i] for i in wanted]
+                elif len(matches) >= count:
+                    return matches[:count]
+
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return list(first.values()) if wanted is not None else matches
+                self._changed.wait(remaining)
+
+    def close(self):
+        """Remove triggers and close the listening connection"""
+        try:
+            self.uninstall()
+        finally:
+            self.db_helper.disconnect()
@@ -0,0 +1,217 @@
+"""
+Concurrent multi-browser classroom simulation for School Management System Testing
+"""
+import json
+import os
+import threading
+import time
+import concurrent.futures
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, List
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select, WebDriverWait
+
+from config.test_config import TestConfig
+from utils.browser_pool import BrowserPool
+from utils.login_helper import DASHBOARD_PATHS, login_as
+from utils.page_metrics import percentile
+from utils.page_sync import PageSync
+from utils.token_store import TokenStore
+from utils.user_pool_provisioner import UserPool
+
+
+class HeadlessConfig(TestConfig):
+    """TestConfig with headless browsers, used for simulated users"""
+    HEADLESS = True
+    PAGE_METRICS = False  # virtual users time their own steps
+
+
+class VirtualUser:
+    """One browser logged in as one user, timing the steps of its UI flow"""
+
+    def __init__(self, user: Dict[str, Any], simulation: 'ClassroomSimulation', driver_path: str = None):
+        self.user = user
+        self.simulation = simulation
+        self.pool = BrowserPool(HeadlessConfig, recycle_after=1, driver_path=driver_path)
+        self.driver = None
+        self.wait = None
+        self.page_sync = None
+
+    def start(self, token_store: TokenStore):
+        """Launch the browser and log in"""
+        self.driver = self.pool.acquire()
+        self.wait = WebDriverWait(self.driver, TestConfig.EXPLICIT_WAIT)
+        self.page_sync = PageSync(self.driver)
+        login_as(self.driver, self.wait, token_store, self.user, DASHBOARD_PATHS[self.user['role']])
+
+    @contextmanager
+    def step(self, name: str):
+        """Time a UI step as the user perceives it"""
+        start_time = time.perf_counter()
+        error = None
+        try:
+            yield
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.simulation.record(name, time.perf_counter() - start_time, self.user['role'], error)
+
+    def open(self, path: str):
+        """Navigate to an app page and wait until it has settled"""
+        self.driver.get(f"{TestConfig.BASE_URL}{path}")
+        self.page_sync.wait()
+
+    def stop(self):
+        """Close the browser"""
+        self.pool.quit()
+
+
+def load_dashboard(vu: VirtualUser):
+    """Load the user's own dashboard"""
+    path = DASHBOARD_PATHS[vu.user['role']]
+    with vu.step(f"load {path}"):
+        vu.open(path)
+
+
+def submit_attendance(vu: VirtualUser):
+    """Open attendance, select a class, mark students present and submit"""
+    with vu.step("load /teacher/attendance"):
+        vu.open("/teacher/attendance")
+
+    with vu.step("select class"):
+        class_select = Select(vu.wait.until(EC.presence_of_element_located((By.NAME, "classId"))))
+        class_select.select_by_index(1)
+        vu.page_sync.wait()
+
+    with vu.step("submit attendance"):
+        for checkbox in vu.driver.find_elements(By.XPATH, "//input[@type='checkbox' and contains(@name, 'attendance')]"):
+            checkbox.click()
+        vu.driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        vu.wait.until(EC.presence_of_element_located((By.CLASS_NAME, "success")))
+
+
+class ClassroomSimulation:
+    """Run real UI flows for many concurrent browsers and report latency percentiles.
+
+    A scenario is a list of ``(role, count, flow)`` entries, e.g. 30 class
+    teachers running ``submit_attendance`` while 200 parents run
+    ``load_dashboard``. All browsers log in first and start their flows
+    together so the steps contend with each other.
+    """
+
+    def __init__(self, scenario: List[tuple], iterations: int = 1, user_pool: UserPool = None,
+                 token_store: TokenStore = None):
+        self.scenario = scenario
+        self.iterations = iterations
+        self.user_pool = user_pool or UserPool()
+        self.token_store = token_store or TokenStore()
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def record(self, step: str, duration: float, role: str, error: str = None):
+        """Record one step timing (thread-safe)"""
+        with self._lock:
+            self.samples.append({'step': step, 'duration': duration, 'role': role, 'error': error})
+
+    def _run_user(self, vu: VirtualUser, flow: Callable, barrier: threading.Barrier):
+        started = True
+        try:
+            vu.start(self.token_store)
+        except Exception as e:
+            started = False
+            self.record('login', 0.0, vu.user['role'], f"{type(e).__name__}: {e}")
+        try:
+            # Failed browsers still reach the barrier so the others are released
+            barrier.wait()
+            if not started:
+                return False
+            for _ in range(self.iterations):
+                try:
+                    flow(vu)
+                except Exception as e:
+                    print(f"{vu.user['email']} flow failed: {e}")
+            return True
+        finally:
+            vu.stop()
+
+    def run(self) -> Dict[str, Any]:
+        """Launch all browsers in parallel, run the flows and return the report"""
+        # Resolve the driver binary once, not once per browser behind the start barrier
+        driver_path = BrowserPool(HeadlessConfig).install_driver()
+        jobs = []
+        for role, count, flow in self.scenario:
+            for user in self.user_pool.draw(count, role):
+                jobs.append((VirtualUser(user, self, driver_path), flow))
+
+        barrier = threading.Barrier(len(jobs))
+        start_time = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = [executor.submit(self._run_user, vu, flow, barrier) for vu, flow in jobs]
+            started = [f.result() for f in concurrent.futures.as_completed(futures)]
+
+        report = self.report()
+        report['browsers'] = len(jobs)
+        report['wall_time'] = time.perf_counter() - start_time
+        report['startup_errors'] = started.count(False)
+        return report
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize UI-perceived latency per step"""
+        steps = {}
+        for sample in self.samples:
+            steps.setdefault(sample['step'], []).append(sample)
+
+        summary = {}
+        for step, samples in sorted(steps.items()):
+            durations = [s['duration'] for s in samples if not s['error']]
+            summary[step] = {
+                'count': len(samples),
+                'errors': sum(1 for s in samples if s['error']),
+                'p50': percentile(durations, 50),
+                'p90': percentile(durations, 90),
+                'p95': percentile(durations, 95),
+                'p99': percentile(durations, 99),
+                'max': max(durations, default=None)
+            }
+        return {'steps': summary}
+
+    def save_report(self, report: Dict[str, Any], path: str = None) -> str:
+        """Write the simulation report"""
+        path = path or os.path.join(TestConfig.REPORTS_DIR, 'classroom_simulation.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return path
+
+
+def main():
+    """Run a classroom simulation from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Concurrent multi-browser classroom simulation")
+    parser.add_argument("--teachers", type=int, default=TestConfig.CLASSROOM_TEACHERS,
+                        help="Class teachers submitting attendance")
+    parser.add_argument("--parents", type=int, default=TestConfig.CLASSROOM_PARENTS,
+                        help="Parents loading /parent/dashboard")
+    parser.add_argument("--iterations", type=int, default=1, help="Flow repetitions per browser")
+    args = parser.parse_args()
+
+    simulation = ClassroomSimulation([
+        ('class_teacher', args.teachers, submit_attendance),
+        ('parent', args.parents, load_dashboard),
+    ], iterations=args.iterations)
+    report = simulation.run()
+    path = simulation.save_report(report)
+
+    print(f"{report['browsers']} browsers in {report['wall_time']:.1f}s, report: {path}")
+    for step, stats in report['steps'].items():
+        p50 = f"{stats['p50']:.2f}s" if stats['p50'] is not None else "-"
+        p95 = f"{stats['p95']:.2f}s" if stats['p95'] is not None else "-"
+        print(f"  {step}: n={stats['count']} errors={stats['errors']} p50={p50} p95={p95}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,90 @@ Database Helper for School Management System Testing
 """
 import psycopg2
 import psycopg2.extras
+import re
+import time
+import uuid
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional
 from config.test_config import TestConfig
+from utils.query_stats import query_stats
+
+POSITIONAL_PARAM = re.compile(r'%s|%%')
+
+# Columns of each entity table in create_tables.sql (the schema the test database is
+# created from): (column, camelCase data key, default). Used by create_*, insert_many,
+# update_many and the async helper's inserts; defaults repeat the column defaults,
+# since an explicit NULL overrides them.
+TABLE_COLUMNS = {
+    'users': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('first_name', 'firstName', None),
+        ('last_name', 'lastName', None), ('email', 'email', None), ('password_hash', 'passwordHash', None),
+        ('phone', 'phone', None), ('date_of_birth', 'dateOfBirth', None), ('gender', 'gender', None),
+        ('address', 'address', None), ('role', 'role', None), ('is_active', 'isActive', True),
+    ],
+    'classes': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('name', 'name', None), ('section', 'section', None),
+        ('academic_year', 'academicYear', None), ('class_teacher_id', 'classTeacherId', None),
+        ('room_number', 'roomNumber', None), ('is_active', 'isActive', True),
+    ],
+    'attendance': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('student_id', 'studentId', None),
+        ('class_id', 'classId', None), ('date', 'date', None), ('status', 'status', None),
+        ('marked_by', 'markedBy', None), ('remarks', 'remarks', None),
+    ],
+    'homework': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('class_id', 'classId', None),
+        ('subject_id', 'subjectId', None), ('teacher_id', 'teacherId', None), ('title', 'title', None),
+        ('description', 'description', None), ('due_date', 'dueDate', None),
+        ('attachment_url', 'attachmentUrl', None), ('is_active', 'isActive', True),
+    ],
+    'notifications': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('sender_id', 'senderId', None),
+        ('recipient_id', 'recipientId', None), ('class_id', 'classId', None), ('title', 'title', None),
+        ('message', 'message', None), ('type', 'type', None), ('priority', 'priority', 'medium'),
+        ('is_read', 'isRead', False),
+    ],
+    'qa_messages': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('parent_id', 'parentId', None),
+        ('teacher_id', 'teacherId', None), ('student_id', 'studentId', None), ('subject', 'subject', None),
+        ('message', 'message', None), ('reply', 'reply', None), ('is_answered', 'isAnswered', False),
+    ],
+    'complaints': [
+        ('id', 'id', None), ('school_id', 'schoolId', None), ('complainant_id', 'complainantId', None),
+        ('handler_id', 'handlerId', None), ('title', 'title', None), ('description', 'description', None),
+        ('status', 'status', 'pending'), ('priority', 'priority', 'medium'),
+    ],
+}
+# Tables without an updated_at column
+CREATED_AT_ONLY = {'notifications'}
+
+ESTIMATE_COUNT_QUERY = """
+    SELECT CASE WHEN c.reltuples < 0 OR c.relpages = 0 THEN COALESCE(s.n_live_tup, 0)
+                ELSE c.reltuples / c.relpages * (pg_relation_size(c.oid) / current_setting('block_size')::int)
+           END AS estimate
+    FROM pg_class c LEFT JOIN pg_stat_user_tables s ON s.relid = c.oid
+    WHERE c.oid = %s::regclass
+"""
+
+
+def timestamp_columns(table: str) -> List[str]:
+    """Timestamp columns set to NOW() when a row is inserted"""
+    return ['created_at'] if table in CREATED_AT_ONLY else ['created_at', 'updated_at']
+
+
+def insert_statement(table: str) -> str:
+    """INSERT ... RETURNING id for one row of a table in TABLE_COLUMNS"""
+    timestamps = timestamp_columns(table)
+    columns = ', '.join([column for column, _, _ in TABLE_COLUMNS[table]] + timestamps)
+    placeholders = ', '.join(['%s'] * len(TABLE_COLUMNS[table]) + ['NOW()'] * len(timestamps))
+    return f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) RETURNING id"
+
+
+def insert_params(table: str, data: Dict[str, Any]) -> tuple:
+    """Parameters for insert_statement from camelCase entity data (a missing id is generated, as in insert_many)"""
+    data = {**data, 'id': str(data.get('id') or uuid.uuid4())}
+    return tuple(data.get(key, default) for _, key, default in TABLE_COLUMNS[table])
+
 
 class DatabaseHelper:
     """Helper class for database operations during testing"""
@@ -12,6 +94,10 @@ class DatabaseHelper:
     def __init__(self):
         self.connection = None
         self.cursor = None
+        self.stats = query_stats if TestConfig.DB_QUERY_STATS else None
+        self.prepared_cache_size = TestConfig.DB_PREPARED_CACHE_SIZE
+        self.prepared_count = 0
+        self.column_types = {}  # table -> {column: SQL type}, for casting batch update values
         self.connect()
     
     def connect(self):
@@ -25,6 +111,7 @@ class DatabaseHelper:
                 password=TestConfig.DB_PASSWORD
             )
             self.cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            self.prepared = OrderedDict()  # SQL text -> prepared statement name, least recently used first
         except Exception as e:
             print(f"Database connection failed: {e}")
             raise
@@ -36,10 +123,53 @@ class DatabaseHelper:
         if self.connection:
             self.connection.close()
     
+    def _execute(self, query: str, params=None, recorded_query: str = None):
+        """Execute a statement, timing it when query statistics are enabled"""
+        if not self.stats:
+            self.cursor.execute(query, params)
+            return
+        start_time = time.perf_counter()
+        try:
+            self.cursor.execute(query, params)
+        finally:
+            self.stats.record(recorded_query or query, time.perf_counter() - start_time, self.cursor.rowcount)
+    
+    def _prepare(self, query: str) -> str:
+        """PREPARE a query on the server, evicting the least recently used statement when the cache is full"""
+        if len(self.prepared) >= self.prepared_cache_size:
+            _, evicted = self.prepared.popitem(last=False)
+            self.cursor.execute(f"DEALLOCATE {evicted}")
+        
+        self.prepared_count += 1
+        name = f"harness_stmt_{self.prepared_count}"
+        numbers = iter(range(1, query.count('%s') + 1))
+        server_query = POSITIONAL_PARAM.sub(lambda m: f"${next(numbers)}" if m.group() == '%s' else '%', query)
+        self.cursor.execute(f"PREPARE {name} AS {server_query}")
+        self.prepared[query] = name
+        return name
+    
+    def execute_prepared(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """Execute a SELECT as a server-side prepared statement, parsed and planned once per connection"""
+        if not self.prepared_cache_size:
+            return self.execute_query(query, params)
+        try:
+            name = self.prepared.get(query)
+            if name is None:
+                name = self._prepare(query)
+            else:
+                self.prepared.move_to_end(query)
+            placeholders = ', '.join(['%s'] * len(params))
+            self._execute(f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}",
+                          params, recorded_query=query)
+            return self.cursor.fetchall()
+        except Exception as e:
+            print(f"Prepared query execution failed: {e}")
+            raise
+    
     def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
         """Execute SELECT query and return results"""
         try:
-            self.cursor.execute(query, params)
+            self._execute(query, params)
             return self.cursor.fetchall()
         except Exception as e:
             print(f"Query execution failed: {e}")
@@ -48,7 +178,7 @@ class DatabaseHelper:
     def execute_update(self, query: str, params: tuple = None) -> int:
         """Execute INSERT/UPDATE/DELETE query and return affected rows"""
         try:
-            self.cursor.execute(query, params)
+            self._execute(query, params)
             self.connection.commit()
             return self.cursor.rowcount
         except Exception as e:
@@ -56,44 +186,35 @@ class DatabaseHelper:
             print(f"Update execution failed: {e}")
             raise
     
+    def explain_analyze(self, query: str, params=None) -> Dict[str, Any]:
+        """Run EXPLAIN (ANALYZE, BUFFERS) on a query and return its JSON plan"""
+        try:
+            self.cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}", params)
+            return self.cursor.fetchone()['QUERY PLAN'][0]
+        except Exception as e:
+            print(f"Explain failed: {e}")
+            raise
+    
+    def _insert(self, table: str, data: Dict[str, Any]) -> str:
+        """Insert one entity row with the same columns as insert_many and return its ID"""
+        result = self.execute_query(insert_statement(table), insert_params(table, data))
+        return result[0]['id'] if result else None
+    
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email"""
         query = "SELECT * FROM users WHERE email = %s"
-        results = self.execute_query(query, (email,))
+        results = self.execute_prepared(query, (email,))
         return results[0] if results else None
     
     def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
         query = "SELECT * FROM users WHERE id = %s"
-        results = self.execute_query(query, (user_id,))
+        results = self.execute_prepared(query, (user_id,))
         return results[0] if results else None
     
     def create_user(self, user_data: Dict[str, Any]) -> str:
         """Create user and return ID"""
-        query = """
-        INSERT INTO users (id, school_id, first_name, last_name, email, password_hash, 
-                          phone, date_of_birth, gender, address, role, is_active, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            user_data.get('id'),
-            user_data.get('schoolId'),
-            user_data.get('firstName'),
-            user_data.get('lastName'),
-            user_data.get('email'),
-            user_data.get('passwordHash'),
-            user_data.get('phone'),
-            user_data.get('dateOfBirth'),
-            user_data.get('gender'),
-            user_data.get('address'),
-            user_data.get('role'),
-            user_data.get('isActive', True)
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('users', user_data)
     
     def delete_user(self, user_id: str) -> bool:
         """Delete user by ID"""
@@ -104,32 +225,12 @@ class DatabaseHelper:
     def get_class_by_id(self, class_id: str) -> Optional[Dict[str, Any]]:
         """Get class by ID"""
         query = "SELECT * FROM classes WHERE id = %s"
-        results = self.execute_query(query, (class_id,))
+        results = self.execute_prepared(query, (class_id,))
         return results[0] if results else None
     
     def create_class(self, class_data: Dict[str, Any]) -> str:
         """Create class and return ID"""
-        query = """
-        INSERT INTO classes (id, school_id, name, section, academic_year, class_teacher_id,
-                           max_students, room_number, is_active, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            class_data.get('id'),
-            class_data.get('schoolId'),
-            class_data.get('name'),
-            class_data.get('section'),
-            class_data.get('academicYear'),
-            class_data.get('classTeacherId'),
-            class_data.get('maxStudents'),
-            class_data.get('roomNumber'),
-            class_data.get('isActive', True)
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('classes', class_data)
     
     def delete_class(self, class_id: str) -> bool:
         """Delete class by ID"""
@@ -146,58 +247,21 @@ class DatabaseHelper:
             query = "SELECT * FROM attendance WHERE date = %s"
             params = (date,)
         
-        return self.execute_query(query, params)
+        return self.execute_prepared(query, params)
     
     def create_attendance(self, attendance_data: Dict[str, Any]) -> str:
         """Create attendance record and return ID"""
-        query = """
-        INSERT INTO attendance (id, student_id, class_id, date, status, marked_by, remarks, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            attendance_data.get('id'),
-            attendance_data.get('studentId'),
-            attendance_data.get('classId'),
-            attendance_data.get('date'),
-            attendance_data.get('status'),
-            attendance_data.get('markedBy'),
-            attendance_data.get('remarks')
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('attendance', attendance_data)
     
     def get_homework_by_id(self, homework_id: str) -> Optional[Dict[str, Any]]:
         """Get homework by ID"""
         query = "SELECT * FROM homework WHERE id = %s"
-        results = self.execute_query(query, (homework_id,))
+        results = self.execute_prepared(query, (homework_id,))
         return results[0] if results else None
     
     def create_homework(self, homework_data: Dict[str, Any]) -> str:
         """Create homework and return ID"""
-        query = """
-        INSERT INTO homework (id, class_id, subject_id, teacher_id, title, description,
-                            due_date, max_marks, is_published, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            homework_data.get('id'),
-            homework_data.get('classId'),
-            homework_data.get('subjectId'),
-            homework_data.get('teacherId'),
-            homework_data.get('title'),
-            homework_data.get('description'),
-            homework_data.get('dueDate'),
-            homework_data.get('maxMarks'),
-            homework_data.get('isPublished', False)
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('homework', homework_data)
     
     def delete_homework(self, homework_id: str) -> bool:
         """Delete homework by ID"""
@@ -208,84 +272,32 @@ class DatabaseHelper:
     def get_notification_by_id(self, notification_id: str) -> Optional[Dict[str, Any]]:
         """Get notification by ID"""
         query = "SELECT * FROM notifications WHERE id = %s"
-        results = self.execute_query(query, (notification_id,))
+        results = self.execute_prepared(query, (notification_id,))
         return results[0] if results else None
     
     def create_notification(self, notification_data: Dict[str, Any]) -> str:
         """Create notification and return ID"""
-        query = """
-        INSERT INTO notifications (id, school_id, title, message, type, priority, is_active, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            notification_data.get('id'),
-            notification_data.get('schoolId'),
-            notification_data.get('title'),
-            notification_data.get('message'),
-            notification_data.get('type'),
-            notification_data.get('priority'),
-            notification_data.get('isActive', True)
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('notifications', notification_data)
     
     def get_qa_message_by_id(self, qa_id: str) -> Optional[Dict[str, Any]]:
         """Get Q&A message by ID"""
         query = "SELECT * FROM qa_messages WHERE id = %s"
-        results = self.execute_query(query, (qa_id,))
+        results = self.execute_prepared(query, (qa_id,))
         return results[0] if results else None
     
     def create_qa_message(self, qa_data: Dict[str, Any]) -> str:
         """Create Q&A message and return ID"""
-        query = """
-        INSERT INTO qa_messages (id, student_id, parent_id, message, priority, status, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            qa_data.get('id'),
-            qa_data.get('studentId'),
-            qa_data.get('parentId'),
-            qa_data.get('message'),
-            qa_data.get('priority'),
-            qa_data.get('status', 'pending')
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('qa_messages', qa_data)
     
     def get_complaint_by_id(self, complaint_id: str) -> Optional[Dict[str, Any]]:
         """Get complaint by ID"""
         query = "SELECT * FROM complaints WHERE id = %s"
-        results = self.execute_query(query, (complaint_id,))
+        results = self.execute_prepared(query, (complaint_id,))
         return results[0] if results else None
     
     def create_complaint(self, complaint_data: Dict[str, Any]) -> str:
         """Create complaint and return ID"""
-        query = """
-        INSERT INTO complaints (id, student_id, parent_id, subject, description, category,
-                              priority, status, created_at, updated_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())
-        RETURNING id
-        """
-        
-        params = (
-            complaint_data.get('id'),
-            complaint_data.get('studentId'),
-            complaint_data.get('parentId'),
-            complaint_data.get('subject'),
-            complaint_data.get('description'),
-            complaint_data.get('category'),
-            complaint_data.get('priority'),
-            complaint_data.get('status', 'open')
-        )
-        
-        result = self.execute_query(query, params)
-        return result[0]['id'] if result else None
+        return self._insert('complaints', complaint_data)
     
     def cleanup_test_data(self, table: str, condition: str = None):
         """Clean up test data from specified table"""
@@ -297,8 +309,11 @@ class DatabaseHelper:
         affected_rows = self.execute_update(query)
         return affected_rows
     
-    def get_table_count(self, table: str, condition: str = None) -> int:
-        """Get count of records in table"""
+    def get_table_count(self, table: str, condition: str = None, approximate: bool = False) -> int:
+        """Get count of records in table, optionally estimated from statistics instead of scanned"""
+        if approximate:
+            return self.estimate_table_count(table, condition)
+        
         if condition:
             query = f"SELECT COUNT(*) FROM {table} WHERE {condition}"
         else:
@@ -307,12 +322,113 @@ class DatabaseHelper:
         result = self.execute_query(query)
         return result[0]['count'] if result else 0
     
+    def estimate_table_count(self, table: str, condition: str = None) -> int:
+        """Estimate a row count without scanning: planner estimate for a condition, table statistics otherwise"""
+        if condition:
+            plan = self.execute_query(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {condition}")
+            return int(plan[0]['QUERY PLAN'][0]['Plan']['Plan Rows'])
+        
+        # Scale reltuples to the current table size like the planner does; tables
+        # never vacuumed or analyzed fall back to the live tuple counter
+        result = self.execute_query(ESTIMATE_COUNT_QUERY, (table,))
+        return int(result[0]['estimate']) if result else 0
+    
     def verify_data_integrity(self, table: str, record_id: str) -> bool:
         """Verify data integrity for a record"""
         query = f"SELECT * FROM {table} WHERE id = %s"
-        result = self.execute_query(query, (record_id,))
+        result = self.execute_prepared(query, (record_id,))
         return len(result) > 0
     
+    def find_missing_records(self, table: str, record_ids: List[str], batch_size: int = 10000) -> List[str]:
+        """Return the ids that have no row in table, checking a batch of ids per query"""
+        found = set()
+        for start in range(0, len(record_ids), batch_size):
+            batch = [str(record_id) for record_id in record_ids[start:start + batch_size]]
+            query = f"SELECT id::text AS id FROM {table} WHERE id = ANY(%s::uuid[])"
+            found.update(row['id'] for row in self.execute_query(query, (batch,)))
+        return [record_id for record_id in record_ids if str(record_id) not in found]
+    
+    def _write_batches(self, query: str, rows: List[tuple], template: str, page_size: int = None) -> set:
+        """Run execute_values over rows page by page, commit, and return the RETURNING ids"""
+        page_size = page_size or TestConfig.DB_BATCH_PAGE_SIZE
+        try:
+            start_time = time.perf_counter()
+            returned = psycopg2.extras.execute_values(
+                self.cursor, query, rows, template=template, page_size=page_size, fetch=True)
+            self.connection.commit()
+            if self.stats:
+                self.stats.record(query, time.perf_counter() - start_time, len(returned))
+            return {str(row['id']) for row in returned}
+        except Exception as e:
+            self.connection.rollback()
+            print(f"Batch write failed: {e}")
+            raise
+    
+    def _column_types(self, table: str) -> Dict[str, str]:
+        """SQL type of every column of a table, looked up once per helper"""
+        if table not in self.column_types:
+            query = """
+                SELECT attname, format_type(atttypid, atttypmod) AS type FROM pg_attribute
+                WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """
+            self.column_types[table] = {row['attname']: row['type'] for row in self.execute_query(query, (table,))}
+        return self.column_types[table]
+    
+    def insert_many(self, table: str, rows: List[Dict[str, Any]], page_size: int = None) -> List[str]:
+        """Insert camelCase entity rows (TABLE_COLUMNS) in pages and return their IDs in input order.
+        
+        Rows without an id get a generated UUID, so every returned id maps back to its input row.
+        """
+        ids = [str(row.get('id') or uuid.uuid4()) for row in rows]
+        columns = TABLE_COLUMNS[table]
+        timestamps = timestamp_columns(table)
+        query = (f"INSERT INTO {table} ({', '.join([column for column, _, _ in columns] + timestamps)}) "
+                 f"VALUES %s RETURNING id")
+        template = f"({', '.join(['%s'] * len(columns) + ['NOW()'] * len(timestamps))})"
+        values = [tuple({**row, 'id': record_id}.get(key, default) for _, key, default in columns)
+                  for record_id, row in zip(ids, rows)]
+        
+        returned = self._write_batches(query, values, template, page_size)
+        return [record_id if record_id in returned else None for record_id in ids]
+    
+    def update_many(self, table: str, rows: List[Dict[str, Any]], page_size: int = None) -> List[Optional[str]]:
+        """Update entity rows by id in pages; every row must carry the same camelCase fields.
+        
+        Returns the ids in input order, None for rows that no longer exist.
+        """
+        if not rows:
+            return []
+        keys = set(rows[0])
+        for index, row in enumerate(rows):
+            if set(row) != keys:
+                raise ValueError(f"update_many row {index} has fields {sorted(row)}, expected {sorted(keys)}")
+        
+        fields = [(column, key) for column, key, _ in TABLE_COLUMNS[table] if key != 'id' and key in keys]
+        if not fields:
+            raise ValueError(f"update_many rows carry no {table} columns to update")
+        types = self._column_types(table)
+        assignments = [f"{column} = v.{column}" for column, _ in fields]
+        if table not in CREATED_AT_ONLY:
+            assignments.append("updated_at = NOW()")
+        query = (f"UPDATE {table} AS t SET {', '.join(assignments)} "
+                 f"FROM (VALUES %s) AS v(id, {', '.join(column for column, _ in fields)}) "
+                 f"WHERE t.id = v.id RETURNING t.id")
+        # VALUES rows are not typed by a target column, so cast each value to it
+        template = "(%s::uuid, " + ', '.join(f"%s::{types[column]}" for column, _ in fields) + ")"
+        ids = [str(row['id']) for row in rows]
+        values = [(record_id,) + tuple(row[key] for _, key in fields) for record_id, row in zip(ids, rows)]
+        
+        returned = self._write_batches(query, values, template, page_size)
+        return [record_id if record_id in returned else None for record_id in ids]
+    
+    def delete_many(self, table: str, record_ids: List[str], page_size: int = None) -> List[Optional[str]]:
+        """Delete rows by id in pages and return the ids in input order, None for ids not found"""
+        ids = [str(record_id) for record_id in record_ids]
+        query = f"DELETE FROM {table} WHERE id IN (SELECT v.id FROM (VALUES %s) AS v(id)) RETURNING id"
+        
+        returned = self._write_batches(query, [(record_id,) for record_id in ids], "(%s::uuid)", page_size)
+        return [record_id if record_id in returned else None for record_id in ids]
+    
     def get_recent_records(self, table: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent records from table"""
         query = f"SELECT * FROM {table} ORDER BY created_at DESC LIMIT %s"
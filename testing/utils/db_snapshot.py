@@ -0,0 +1,225 @@
+"""
+Database snapshot/restore of seeded volume datasets for School Management System Testing
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import time
+from typing import Dict, List, Tuple
+
+import psycopg2
+from psycopg2 import sql
+
+from config.test_config import TestConfig
+from utils.volume_dataset import dataset_size, seed_dataset
+
+VOLUME_PREFIX = 'volume'
+
+
+class DatabaseSnapshot:
+    """Snapshot the seeded test database once and restore it in seconds.
+
+    ``template`` keeps snapshots as template databases on the same server and
+    restores with CREATE DATABASE ... TEMPLATE (a file-level copy).
+    ``dump`` keeps parallel ``pg_dump -Fd`` directories and restores with
+    ``pg_restore -j``; slower, but snapshots can be moved to another server.
+    Both need the database to themselves, so other sessions (e.g. the
+    backend) are disconnected while snapshotting and restoring.
+    """
+
+    def __init__(self, strategy: str = None, database: str = None, snapshot_dir: str = None,
+                 jobs: int = None):
+        self.strategy = strategy or TestConfig.SNAPSHOT_STRATEGY
+        self.database = database or TestConfig.DB_NAME
+        self.snapshot_dir = snapshot_dir or TestConfig.SNAPSHOT_DIR
+        self.jobs = jobs or TestConfig.SNAPSHOT_JOBS
+        if self.strategy not in ('template', 'dump'):
+            raise ValueError(f"Unsupported snapshot strategy: {self.strategy}")
+
+    @staticmethod
+    def key(scale: Dict[str, int], seed: int) -> str:
+        """Snapshot name for a dataset: generator seed, size and a digest of the full scale"""
+        digest = hashlib.sha1(json.dumps(scale, sort_keys=True).encode()).hexdigest()[:8]
+        return f"vol_s{seed}_{dataset_size(scale)}_{digest}"
+
+    def _admin_connection(self):
+        """Autocommit connection to the maintenance database (CREATE/DROP DATABASE)"""
+        connection = psycopg2.connect(
+            host=TestConfig.DB_HOST,
+            port=TestConfig.DB_PORT,
+            database='postgres',
+            user=TestConfig.DB_USER,
+            password=TestConfig.DB_PASSWORD
+        )
+        connection.autocommit = True
+        return connection
+
+    @staticmethod
+    def _disconnect_sessions(cursor, database: str):
+        cursor.execute(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE datname = %s AND pid <> pg_backend_pid()", (database,))
+
+    def _recreate(self, cursor, template: str = None):
+        """Drop and recreate the test database, optionally as a copy of a template"""
+        self._disconnect_sessions(cursor, self.database)
+        cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(self.database)))
+        if template:
+            cursor.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                sql.Identifier(self.database), sql.Identifier(template)))
+        else:
+            cursor.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(self.database)))
+
+    def template_name(self, key: str) -> str:
+        """Template database holding a snapshot"""
+        return f"{self.database}_{key}"
+
+    def dump_path(self, key: str) -> str:
+        """pg_dump directory holding a snapshot"""
+        return os.path.join(self.snapshot_dir, key)
+
+    def _pg_command(self, *args: str) -> List[str]:
+        return [*args, '-h', TestConfig.DB_HOST, '-p', str(TestConfig.DB_PORT), '-U', TestConfig.DB_USER]
+
+    def _run(self, command: List[str]):
+        env = {**os.environ, 'PGPASSWORD': TestConfig.DB_PASSWORD}
+        subprocess.run(command, env=env, check=True)
+
+    def exists(self, key: str) -> bool:
+        """Check whether a snapshot exists"""
+        if self.strategy == 'dump':
+            return os.path.exists(os.path.join(self.dump_path(key), 'toc.dat'))
+        connection = self._admin_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (self.template_name(key),))
+                return cursor.fetchone() is not None
+        finally:
+            connection.close()
+
+    def create(self, key: str):
+        """Snapshot the current state of the test database"""
+        if self.strategy == 'dump':
+            path = self.dump_path(key)
+            shutil.rmtree(path, ignore_errors=True)
+            os.makedirs(self.snapshot_dir, exist_ok=True)
+            self._run(self._pg_command('pg_dump', '-Fd', '-j', str(self.jobs), '-f', path, self.database))
+            return
+
+        template = self.template_name(key)
+        connection = self._admin_connection()
+        try:
+            with connection.cursor() as cursor:
+                self._disconnect_sessions(cursor, self.database)
+                cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(template)))
+                cursor.execute(sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                    sql.Identifier(template), sql.Identifier(self.database)))
+        finally:
+            connection.close()
+
+    def restore(self, key: str):
+        """Replace the test database with a snapshot"""
+        if not self.exists(key):
+            raise ValueError(f"Snapshot {key} not found")
+
+        connection = self._admin_connection()
+        try:
+            with connection.cursor() as cursor:
+                self._recreate(cursor, None if self.strategy == 'dump' else self.template_name(key))
+        finally:
+            connection.close()
+
+        if self.strategy == 'dump':
+            self._run(self._pg_command('pg_restore', '-j', str(self.jobs), '--no-owner',
+                                       '-d', self.database, self.dump_path(key)))
+
+    def drop(self, key: str):
+        """Delete a snapshot"""
+        if self.strategy == 'dump':
+            shutil.rmtree(self.dump_path(key), ignore_errors=True)
+            return
+        connection = self._admin_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(
+                    sql.Identifier(self.template_name(key))))
+        finally:
+            connection.close()
+
+    def list(self) -> List[str]:
+        """Keys of all existing snapshots"""
+        if self.strategy == 'dump':
+            if not os.path.isdir(self.snapshot_dir):
+                return []
+            return sorted(k for k in os.listdir(self.snapshot_dir) if self.exists(k))
+        prefix = f"{self.database}_"
+        connection = self._admin_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT datname FROM pg_database WHERE datname LIKE %s", (f"{prefix}vol_%",))
+                return sorted(row[0][len(prefix):] for row in cursor.fetchall())
+        finally:
+            connection.close()
+
+    def ensure(self, scale: Dict[str, int] = None, seed: int = None) -> Tuple[str, bool]:
+        """Restore the dataset's snapshot, seeding and snapshotting it on first use.
+
+        Returns the snapshot key and whether it was restored (False: freshly seeded).
+        """
+        from utils.database_helper import DatabaseHelper
+
+        scale = scale or TestConfig.VOLUME_DATASET
+        seed = TestConfig.VOLUME_SEED if seed is None else seed
+        key = self.key(scale, seed)
+        if self.exists(key):
+            self.restore(key)
+            return key, True
+
+        with DatabaseHelper() as db:
+            try:
+                seed_dataset(db, scale, VOLUME_PREFIX, seed)
+                db.connection.commit()
+            except Exception as e:
+                db.connection.rollback()
+                print(f"Volume dataset seeding failed: {e}")
+                raise
+        self.create(key)
+        return key, False
+
+
+def main():
+    """Manage volume dataset snapshots from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Snapshot and restore seeded volume datasets")
+    parser.add_argument("action", choices=["ensure", "restore", "create", "list", "drop"])
+    parser.add_argument("--seed", type=int, default=TestConfig.VOLUME_SEED, help="Generator seed")
+    parser.add_argument("--strategy", choices=["template", "dump"], default=TestConfig.SNAPSHOT_STRATEGY)
+    parser.add_argument("--key", help="Snapshot key (default: derived from seed and VOLUME_DATASET)")
+    args = parser.parse_args()
+
+    snapshot = DatabaseSnapshot(strategy=args.strategy)
+    key = args.key or snapshot.key(TestConfig.VOLUME_DATASET, args.seed)
+    start_time = time.time()
+
+    if args.action == "ensure":
+        key, restored = snapshot.ensure(seed=args.seed)
+        print(f"{'Restored' if restored else 'Seeded and snapshotted'} {key} in {time.time() - start_time:.1f}s")
+    elif args.action == "restore":
+        snapshot.restore(key)
+        print(f"Restored {key} in {time.time() - start_time:.1f}s")
+    elif args.action == "create":
+        snapshot.create(key)
+        print(f"Snapshotted {key} in {time.time() - start_time:.1f}s")
+    elif args.action == "drop":
+        snapshot.drop(key)
+        print(f"Dropped {key}")
+    else:
+        for existing in snapshot.list():
+            print(existing)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Device and network emulation profiles for School Management System Testing
+"""
+from typing import Dict, Any
+
+from config.test_config import TestConfig
+
+
+def get_device_profile(name: str) -> Dict[str, Any]:
+    """Look up a named device profile"""
+    try:
+        return TestConfig.DEVICE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown device profile: {name} "
+                         f"(available: {', '.join(TestConfig.DEVICE_PROFILES)})")
+
+
+def apply_device_profile(driver, name: str = None) -> bool:
+    """Apply network and CPU throttling through Chrome DevTools emulation"""
+    name = name or TestConfig.DEVICE_PROFILE
+    if not name:
+        return False
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        raise ValueError(f"Device profiles need a Chromium browser, not {TestConfig.BROWSER}")
+
+    profile = get_device_profile(name)
+
+    network = profile.get('network')
+    if network:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
+            'offline': False,
+            'latency': network['latency_ms'],
+            # DevTools expects bytes per second; profiles use kilobits per second
+            'downloadThroughput': network['download_kbps'] * 1024 / 8,
+            'uploadThroughput': network['upload_kbps'] * 1024 / 8
+        })
+
+    if profile.get('cpu_slowdown', 1) > 1:
+        driver.execute_cdp_cmd('Emulation.setCPUThrottlingRate', {'rate': profile['cpu_slowdown']})
+
+    viewport = profile.get('viewport')
+    if viewport:
+        driver.execute_cdp_cmd('Emulation.setDeviceMetricsOverride', {
+            'width': viewport[0], 'height': viewport[1],
+            'deviceScaleFactor': 1, 'mobile': False
+        })
+
+    return True
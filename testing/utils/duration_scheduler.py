@@ -0,0 +1,89 @@
+"""
+Duration-aware test scheduling (longest-processing-time first) for pytest-xdist
+"""
+import heapq
+import json
+import os
+import re
+import statistics
+from typing import Dict, List, Tuple
+
+from config.test_config import TestConfig
+from utils.file_lock import locked, write_json
+
+# --dist loadgroup appends "@<group>" to node ids reported back to the controller
+GROUP_SUFFIX = re.compile(r'@lpt\d+$')
+
+
+class DurationHistory:
+    """Per-test durations from previous runs, smoothed across runs"""
+
+    def __init__(self, path: str = None, smoothing: float = 0.5):
+        self.path = path or TestConfig.TEST_DURATIONS_FILE
+        self.smoothing = smoothing  # weight of the newest measurement
+        self.durations = self._load()
+        self.current = {}
+
+    def _load(self) -> Dict[str, float]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def add(self, nodeid: str, duration: float):
+        """Add a phase duration (setup, call or teardown) for the current run"""
+        nodeid = GROUP_SUFFIX.sub('', nodeid)
+        self.current[nodeid] = self.current.get(nodeid, 0.0) + duration
+
+    def save(self):
+        """Merge this run's durations into the history file"""
+        if not self.current:
+            return
+        with locked(self.path):
+            # Suites running concurrently may have saved their own tests since this run loaded
+            self.durations = self._load()
+            for nodeid, duration in self.current.items():
+                previous = self.durations.get(nodeid)
+                self.durations[nodeid] = duration if previous is None else (
+                    self.smoothing * duration + (1 - self.smoothing) * previous)
+            write_json(self.path, self.durations)
+
+    def predict(self, nodeid: str) -> float:
+        """Predicted duration; unknown tests get their suite's default estimate"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        for prefix, estimate in TestConfig.DEFAULT_TEST_DURATIONS.items():
+            if nodeid.startswith(prefix):
+                return estimate
+        return statistics.median(self.durations.values()) if self.durations else 1.0
+
+
+def lpt_partition(durations: List[Tuple[str, float]], bins: int) -> Dict[str, int]:
+    """Assign tests to bins longest-first, always onto the least-loaded bin"""
+    loads = [(0.0, i) for i in range(bins)]
+    heapq.heapify(loads)
+    assignment = {}
+    for nodeid, duration in sorted(durations, key=lambda d: (-d[1], d[0])):
+        load, index = heapq.heappop(loads)
+        assignment[nodeid] = index
+        heapq.heappush(loads, (load + duration, index))
+    return assignment
+
+
+def schedule_items(items, history: DurationHistory, workers: int):
+    """Group items into one xdist_group per worker and order them longest-first.
+
+    Used with ``--dist loadgroup``; every worker computes the same groups from
+    the same collection and history file.
+    """
+    import pytest
+
+    predicted = {item.nodeid: history.predict(item.nodeid) for item in items}
+    assignment = lpt_partition(list(predicted.items()), workers)
+
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=f"lpt{assignment[item.nodeid]}"))
+    items.sort(key=lambda item: (assignment[item.nodeid], -predicted[item.nodeid]))
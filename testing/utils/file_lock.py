@@ -0,0 +1,29 @@
+"""
+Cross-process file locking for School Management System Testing
+"""
+import contextlib
+import json
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows; concurrent suites rely on POSIX process groups anyway
+    fcntl = None
+
+
+@contextlib.contextmanager
+def locked(path: str):
+    """Hold an exclusive lock on <path>.lock while a shared file is read, merged and rewritten"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def write_json(path: str, data):
+    """Replace a JSON file atomically so readers never see a partial write"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
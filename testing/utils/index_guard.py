@@ -0,0 +1,143 @@
+"""
+EXPLAIN-based index regression guard for School Management System Testing
+"""
+import json
+import os
+from typing import Dict, Any, List, Optional
+
+from config.test_config import TestConfig
+from utils.volume_dataset import SEEDED_TABLES, seed_dataset
+
+# Seeded rows are recognised by this prefix; everything is rolled back after the check
+MARKER = 'index-guard'
+
+# Production hot queries; parameters come from the seeded data
+HOT_QUERIES = {
+    'attendance_by_class_date': """
+        SELECT * FROM attendance WHERE class_id = %(class_id)s AND date = %(date)s
+    """,
+    'attendance_by_student': """
+        SELECT date, status FROM attendance
+        WHERE student_id = %(student_id)s AND date >= %(since)s ORDER BY date DESC
+    """,
+    'homework_by_class': """
+        SELECT * FROM homework WHERE class_id = %(class_id)s AND is_active = true ORDER BY due_date DESC
+    """,
+    'notifications_by_recipient': """
+        SELECT * FROM notifications WHERE recipient_id = %(recipient_id)s ORDER BY created_at DESC LIMIT 20
+    """,
+    'users_by_school': """
+        SELECT id, first_name, last_name, role FROM users
+        WHERE school_id = %(school_id)s ORDER BY last_name, first_name LIMIT 50
+    """,
+}
+
+PARAMS_QUERY = """
+SELECT c.id AS class_id, c.school_id, st.id AS student_id, st.user_id AS recipient_id,
+       CURRENT_DATE - 1 AS date, CURRENT_DATE - 30 AS since
+FROM classes c JOIN students st ON st.class_id = c.id
+WHERE c.academic_year = %(marker)s
+ORDER BY c.id, st.id
+LIMIT 1
+"""
+
+
+def plan_nodes(node: Dict[str, Any]):
+    """Yield a plan node and all of its children"""
+    yield node
+    for child in node.get('Plans', []):
+        yield from plan_nodes(child)
+
+
+class IndexGuard:
+    """Seed production-like volume and check hot query plans against thresholds.
+
+    Seeding, ANALYZE and EXPLAIN (ANALYZE, BUFFERS) all run in one transaction
+    that is rolled back. ANALYZE updates pg_class.reltuples/relpages in place,
+    which survives the rollback, so the tables are analyzed again afterwards.
+    """
+
+    def __init__(self, db_helper=None, scale: Dict[str, int] = None, budgets: Dict[str, Dict] = None):
+        if db_helper is None:
+            from utils.database_helper import DatabaseHelper
+            db_helper = DatabaseHelper()
+        self.db_helper = db_helper
+        self.scale = {**TestConfig.INDEX_GUARD_SCALE, **(scale or {})}
+        self.budgets = budgets or TestConfig.INDEX_GUARD_BUDGETS
+
+    def seed(self) -> Dict[str, Any]:
+        """Insert the seed dataset and return parameters for the hot queries"""
+        seed_dataset(self.db_helper, self.scale, MARKER)
+        return self.db_helper.execute_query(PARAMS_QUERY, {'marker': MARKER})[0]
+
+    def budget(self, name: str) -> Dict[str, int]:
+        """Thresholds for a query, falling back to the default"""
+        return {**self.budgets['default'], **self.budgets.get(name, {})}
+
+    def table_rows(self, tables: List[str]) -> Dict[str, float]:
+        """Planner row estimates per table"""
+        rows = self.db_helper.execute_query(
+            "SELECT relname, reltuples FROM pg_class WHERE relname = ANY(%s) AND relkind = 'r'",
+            (list(tables),))
+        return {row['relname']: row['reltuples'] for row in rows}
+
+    def check_plan(self, name: str, plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Summarize a plan and list threshold violations"""
+        budget = self.budget(name)
+        nodes = list(plan_nodes(plan['Plan']))
+        table_rows = self.table_rows({n['Relation Name'] for n in nodes if 'Relation Name' in n})
+
+        violations = []
+        for node in nodes:
+            relation = node.get('Relation Name')
+            if node['Node Type'] == 'Seq Scan' and table_rows.get(relation, 0) >= budget['seq_scan_min_rows']:
+                violations.append(f"sequential scan on {relation} ({int(table_rows[relation])} rows)")
+            if node.get('Sort Space Type') == 'Disk':
+                violations.append(f"sort spilled to disk ({node.get('Sort Space Used')} kB)")
+
+        top = plan['Plan']
+        buffers = top.get('Shared Hit Blocks', 0) + top.get('Shared Read Blocks', 0)
+        temp_blocks = top.get('Temp Written Blocks', 0)
+        if buffers > budget['max_buffers']:
+            violations.append(f"{buffers} shared buffers (budget {budget['max_buffers']})")
+        if temp_blocks:
+            violations.append(f"{temp_blocks} temp blocks written")
+
+        return {
+            'execution_ms': plan.get('Execution Time'),
+            'buffers': buffers,
+            'temp_blocks': temp_blocks,
+            'nodes': [f"{n['Node Type']}" + (f" on {n['Relation Name']}" if 'Relation Name' in n else '')
+                      + (f" using {n['Index Name']}" if 'Index Name' in n else '') for n in nodes],
+            'violations': violations
+        }
+
+    def run(self, queries: Dict[str, str] = None) -> Dict[str, Dict[str, Any]]:
+        """Seed, explain every hot query and roll everything back"""
+        queries = queries or HOT_QUERIES
+        try:
+            params = self.seed()
+            return {name: self.check_plan(name, self.db_helper.explain_analyze(query, params))
+                    for name, query in queries.items()}
+        finally:
+            self.db_helper.connection.rollback()
+            self.restore_statistics()
+
+    def restore_statistics(self):
+        """Re-ANALYZE the seeded tables so planner estimates match the rolled-back data"""
+        self.db_helper.cursor.execute(f"ANALYZE {', '.join(SEEDED_TABLES)}")
+        self.db_helper.connection.commit()
+
+    @staticmethod
+    def violations(report: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Flatten a report into 'query: violation' messages"""
+        return [f"{name}: {violation}" for name, result in report.items() for violation in result['violations']]
+
+    @staticmethod
+    def save_report(report: Dict[str, Dict[str, Any]], path: str = None) -> Optional[str]:
+        """Write the plan report"""
+        path = path or os.path.join(TestConfig.REPORTS_DIR, 'index_guard.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return path
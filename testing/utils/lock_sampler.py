@@ -0,0 +1,170 @@
+"""
+Database lock and wait-event sampler for School Management System Testing
+"""
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+from config.test_config import TestConfig
+
+ACTIVITY_QUERY = """
+SELECT pid, state, wait_event_type, wait_event, left(query, 200) AS query,
+       EXTRACT(EPOCH FROM now() - xact_start) AS xact_age,
+       pg_blocking_pids(pid) AS blocked_by
+FROM pg_stat_activity
+WHERE datname = current_database() AND pid <> pg_backend_pid() AND backend_type = 'client backend'
+"""
+
+WAITING_LOCKS_QUERY = """
+SELECT pid, locktype, mode, relation::regclass::text AS relation
+FROM pg_locks
+WHERE NOT granted
+"""
+
+
+class LockSampler:
+    """Poll pg_stat_activity and pg_locks in the background during a load phase.
+
+    Tells database contention (backends waiting on locks or I/O) apart from
+    app-server slowness (database mostly idle while clients wait).
+    """
+
+    def __init__(self, interval: float = None, db_helper=None):
+        if db_helper is None:
+            from utils.database_helper import DatabaseHelper
+            db_helper = DatabaseHelper()
+            db_helper.connection.autocommit = True  # statistics are cached per transaction
+        self.db_helper = db_helper
+        self.interval = interval or TestConfig.LOCK_SAMPLE_INTERVAL
+        self.samples = []
+        self.errors = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started_at = None
+        self._elapsed = 0.0
+
+    def sample(self) -> Dict[str, Any]:
+        """Take one snapshot of backends and ungranted locks"""
+        backends = self.db_helper.execute_query(ACTIVITY_QUERY)
+        waiting = self.db_helper.execute_query(WAITING_LOCKS_QUERY)
+        return {'time': time.perf_counter(), 'backends': backends, 'waiting_locks': waiting}
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.samples.append(self.sample())
+            except Exception as e:
+                self.errors += 1
+                if self.errors == 1:
+                    print(f"Lock sampling failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """Start sampling in a background thread"""
+        self._stop.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='lock-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling"""
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+            self._elapsed += time.perf_counter() - self._started_at
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @staticmethod
+    def blocking_chain(pid: int, backends: Dict[int, Dict[str, Any]]) -> List[int]:
+        """Follow blocked_by from a waiting backend to the session at the head of the queue"""
+        chain = [pid]
+        while backends.get(chain[-1], {}).get('blocked_by'):
+            blocker = backends[chain[-1]]['blocked_by'][0]
+            if blocker in chain:
+                break  # deadlock; the server will cancel one of them
+            chain.append(blocker)
+        return chain
+
+    def report(self) -> Dict[str, Any]:
+        """Wait-event histogram, blocking chains and longest lock holders"""
+        wait_events = {}
+        lock_waits = {}
+        chains = {}
+        holders = {}
+        blocked_samples = 0
+        active_backends = 0
+
+        for sample in self.samples:
+            backends = {b['pid']: b for b in sample['backends']}
+            for backend in backends.values():
+                if backend['state'] != 'active':
+                    continue
+                active_backends += 1
+                event = (f"{backend['wait_event_type']}:{backend['wait_event']}"
+                         if backend['wait_event_type'] else 'CPU')
+                wait_events[event] = wait_events.get(event, 0) + 1
+
+            for lock in sample['waiting_locks']:
+                key = f"{lock['mode']} on {lock['locktype']} {lock['relation'] or ''}".strip()
+                lock_waits[key] = lock_waits.get(key, 0) + 1
+
+            blocked = [pid for pid, b in backends.items() if b['blocked_by']]
+            if blocked:
+                blocked_samples += 1
+            roots = {}
+            for pid in blocked:
+                chain = self.blocking_chain(pid, backends)
+                described = ' <- '.join(
+                    f"{p}: {' '.join((backends.get(p, {}).get('query') or '?').split())[:80]}"
+                    for p in reversed(chain))
+                chains[described] = chains.get(described, 0) + 1
+                roots[pid] = chain[-1]
+
+            # Sessions at the head of a queue hold the locks everyone else waits on
+            for root in set(roots.values()):
+                backend = backends.get(root)
+                if not backend:
+                    continue
+                holder = holders.setdefault(root, {
+                    'pid': root, 'query': backend['query'], 'max_xact_age': 0.0, 'max_blocked': 0, 'samples': 0})
+                holder['max_xact_age'] = max(holder['max_xact_age'], float(backend['xact_age'] or 0))
+                holder['max_blocked'] = max(holder['max_blocked'], list(roots.values()).count(root))
+                holder['samples'] += 1
+
+        def top(counts: Dict[str, int], limit: int = 10) -> Dict[str, int]:
+            return dict(sorted(counts.items(), key=lambda c: -c[1])[:limit])
+
+        return {
+            'samples': len(self.samples),
+            'duration': self._elapsed,
+            'sampling_errors': self.errors,
+            'blocked_sample_ratio': blocked_samples / len(self.samples) if self.samples else 0.0,
+            'avg_active_backends': active_backends / len(self.samples) if self.samples else 0.0,
+            'wait_events': top(wait_events, limit=20),
+            'lock_waits': top(lock_waits),
+            'blocking_chains': top(chains),
+            'lock_holders': sorted(holders.values(), key=lambda h: -h['max_xact_age'])[:10]
+        }
+
+    def save_report(self, name: str, report: Dict[str, Any] = None) -> Optional[str]:
+        """Write a report to reports/lock_samples/<name>.json"""
+        report = report or self.report()
+        path = os.path.join(TestConfig.REPORTS_DIR, 'lock_samples', f"{name}.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2, default=str)
+        return path
+
+    def close(self):
+        """Stop sampling and close the sampler's database connection"""
+        self.stop()
+        self.db_helper.disconnect()
@@ -0,0 +1,72 @@
+"""
+Browser login helpers for School Management System Testing
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from config.test_config import TestConfig
+from utils.page_sync import PageSync
+from utils.token_store import inject_session
+
+# Where the login page redirects each role
+DASHBOARD_PATHS = {
+    'admin': '/admin/dashboard',
+    'teacher': '/teacher/dashboard',
+    'class_teacher': '/teacher/dashboard',
+    'subject_teacher': '/teacher/dashboard',
+    'student': '/student/dashboard',
+    'parent': '/parent/dashboard',
+}
+
+
+def login_via_ui(driver, wait, user, dashboard_path):
+    """Drive the login form and wait for the dashboard"""
+    driver.get(TestConfig.BASE_URL)
+    
+    # Navigate to login page
+    login_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Login")))
+    login_link.click()
+    
+    # Fill login form
+    email_input = wait.until(EC.presence_of_element_located((By.NAME, "email")))
+    password_input = driver.find_element(By.NAME, "password")
+    
+    email_input.clear()
+    email_input.send_keys(user['email'])
+    password_input.clear()
+    password_input.send_keys(user['password'])
+    
+    # Submit form
+    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
+    login_button.click()
+    
+    # Wait for redirect to dashboard
+    wait.until(EC.url_contains(dashboard_path))
+    
+    return driver
+
+
+def login_as(driver, wait, token_store, user, dashboard_path):
+    """Open the dashboard already authenticated, falling back to the login form"""
+    if not TestConfig.E2E_TOKEN_LOGIN:
+        return login_via_ui(driver, wait, user, dashboard_path)
+    
+    session = token_store.get(user['email'], user['password'])
+    inject_session(driver, session)
+    driver.get(f"{TestConfig.BASE_URL}{dashboard_path}")
+    
+    if not session_accepted(driver, dashboard_path):
+        # Token was rejected (e.g. revoked by a logout test); log in for real once
+        token_store.invalidate(user['email'])
+        return login_via_ui(driver, wait, user, dashboard_path)
+    
+    return driver
+
+
+def session_accepted(driver, dashboard_path):
+    """Check that the dashboard is still shown once its auth calls have settled"""
+    # The URL matches right after driver.get(); a rejected token only shows once the
+    # API answers 401, the refresh fails and the SPA redirects to /login
+    PageSync(driver).wait()
+    url = driver.current_url
+    return dashboard_path in url and '/login' not in url
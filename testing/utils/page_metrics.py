@@ -0,0 +1,299 @@
+"""
+Browser-side page performance capture for School Management System Testing
+"""
+import glob
+import json
+import os
+import re
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+from config.test_config import TestConfig
+from utils.api_chattiness import drain_performance_log, collect_api_requests, summarize_api_requests
+
+# Buffers LCP, layout shifts and long tasks from the very start of each document and
+# splits the document into segments: its own navigation, then one per client-side
+# (History API) route change, so SPA navigations get their own record
+OBSERVER_SCRIPT = """
+(function () {
+  if (window.__pageMetrics || !window.PerformanceObserver) { return; }
+  var m = window.__pageMetrics = {lcp: null, shifts: [], longTasks: [], collected: 0,
+                                  segments: [{url: location.href.split('#')[0], start: 0}]};
+  var observe = function (type, callback) {
+    try { new PerformanceObserver(function (list) { list.getEntries().forEach(callback); })
+            .observe({type: type, buffered: true}); } catch (e) {}
+  };
+  observe('largest-contentful-paint', function (e) { m.lcp = e.renderTime || e.loadTime || e.startTime; });
+  observe('layout-shift', function (e) { if (!e.hadRecentInput) { m.shifts.push({start: e.startTime, value: e.value}); } });
+  observe('longtask', function (e) { m.longTasks.push({start: e.startTime, duration: e.duration}); });
+
+  var routeChange = function () {
+    var url = location.href.split('#')[0];
+    if (url !== m.segments[m.segments.length - 1].url) {
+      m.segments.push({url: url, start: performance.now()});
+    }
+  };
+  ['pushState', 'replaceState'].forEach(function (name) {
+    var original = history[name];
+    history[name] = function () {
+      var result = original.apply(this, arguments);
+      routeChange();
+      return result;
+    };
+  });
+  window.addEventListener('popstate', routeChange);
+})();
+"""
+
+# One record per segment not collected yet; without the observer only the
+# document's own navigation can be attributed, and not after a route change
+COLLECT_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0];
+if (!nav) { return []; }
+var m = window.__pageMetrics;
+var tracked = !!m;
+if (!tracked) {
+  if (location.href.split('#')[0] !== nav.name.split('#')[0]) { return []; }
+  m = {lcp: null, shifts: [], longTasks: [], collected: 0, segments: [{url: nav.name.split('#')[0], start: 0}]};
+}
+var paint = performance.getEntriesByName('first-contentful-paint')[0];
+var resources = performance.getEntriesByType('resource');
+var now = performance.now();
+var records = [];
+for (var i = m.collected; i < m.segments.length; i++) {
+  var segment = m.segments[i];
+  var end = i + 1 < m.segments.length ? m.segments[i + 1].start : now;
+  var fullLoad = i === 0;
+  var inSegment = function (start) { return start >= segment.start && start < end; };
+  var tasks = m.longTasks.filter(function (t) { return inSegment(t.start); })
+                         .map(function (t) { return t.duration; });
+  var loaded = resources.filter(function (r) { return inSegment(r.startTime); });
+  records.push({
+    url: segment.url,
+    navigation: fullLoad ? 'document' : 'client',
+    wallStart: performance.timeOrigin + segment.start,
+    ttfb: fullLoad ? nav.responseStart - nav.startTime : null,
+    domContentLoaded: fullLoad ? nav.domContentLoadedEventEnd - nav.startTime : null,
+    load: fullLoad && nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : null,
+    fcp: fullLoad && paint ? paint.startTime : null,
+    lcp: fullLoad && m.lcp !== null && m.lcp < end ? m.lcp : null,
+    cls: tracked ? m.shifts.filter(function (e) { return inSegment(e.start); })
+                           .reduce(function (a, e) { return a + e.value; }, 0) : null,
+    longTaskCount: tasks.length,
+    longTaskTotal: tasks.reduce(function (a, d) { return a + d; }, 0),
+    tbt: tasks.reduce(function (a, d) { return a + Math.max(0, d - 50); }, 0),
+    resourceCount: loaded.length,
+    resourceBytes: loaded.reduce(function (a, r) { return a + (r.transferSize || 0); }, 0),
+    resourceTime: loaded.reduce(function (a, r) { return Math.max(a, r.responseEnd - segment.start); }, 0)
+  });
+}
+m.collected = m.segments.length;
+return records;
+"""
+
+# Summaries of client-side route changes are kept apart from full page loads
+CLIENT_SUFFIX = ' (client)'
+
+METRICS = ['ttfb', 'domContentLoaded', 'load', 'fcp', 'lcp', 'cls', 'longTaskCount',
+           'longTaskTotal', 'tbt', 'resourceCount', 'resourceBytes', 'resourceTime',
+           'apiRequests', 'apiBytes', 'apiDepth', 'apiDuplicates']
+
+
+def discover_routes(app_dir: str = None) -> List[str]:
+    """List Next.js routes from frontend/src/app/**/page.tsx"""
+    app_dir = os.path.abspath(app_dir or TestConfig.FRONTEND_APP_DIR)
+    routes = []
+    for page in glob.glob(os.path.join(app_dir, '**', 'page.tsx'), recursive=True):
+        rel = os.path.relpath(os.path.dirname(page), app_dir).replace(os.sep, '/')
+        routes.append('/' if rel == '.' else f"/{rel}")
+    # Literal segments before dynamic ones so /classes/create wins over /classes/[id]
+    return sorted(routes, key=lambda r: (r.count('['), r))
+
+
+class RouteMatcher:
+    """Map concrete URL paths to frontend route patterns"""
+
+    def __init__(self, routes: List[str] = None):
+        self.patterns = []
+        for route in routes if routes is not None else discover_routes():
+            regex = re.sub(r'\\\[[^/]+?\\\]', '[^/]+', re.escape(route))
+            self.patterns.append((route, re.compile(f"^{regex}/?$")))
+
+    def match(self, path: str) -> Optional[str]:
+        """Return the route pattern for a path, or None if it is not an app page"""
+        for route, pattern in self.patterns:
+            if pattern.match(path):
+                return route
+        return None
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    index = min(len(values) - 1, max(0, int(round(pct / 100 * len(values))) - 1))
+    return values[index]
+
+
+class PageMetricsCollector:
+    """Record performance metrics for every page an e2e test visits"""
+
+    def __init__(self, output_dir: str = None, matcher: RouteMatcher = None):
+        self.output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'page_metrics')
+        self.matcher = matcher or RouteMatcher()
+        self.records = []
+
+    @staticmethod
+    def install(driver) -> bool:
+        """Register the observer script for every new document (Chromium only)"""
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return False
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': OBSERVER_SCRIPT})
+        return True
+
+    def capture(self, driver, test_name: str = None) -> List[Dict[str, Any]]:
+        """Capture metrics for the page load and each client-side route change since the last capture"""
+        try:
+            # Always drain the network log so its events belong to these pages only
+            api_requests = collect_api_requests(drain_performance_log(driver))
+            if not driver.current_url.startswith(TestConfig.BASE_URL):
+                return []
+            segments = driver.execute_script(COLLECT_SCRIPT) or []
+        except Exception as e:
+            print(f"Failed to capture page metrics: {e}")
+            return []
+
+        # API requests belong to the route that was showing when they were sent
+        sent = [r['wall'] * 1000 if r['wall'] is not None else float('-inf') for r in api_requests]
+        starts = [float('-inf')] + [segment['wallStart'] for segment in segments[1:]]
+        ends = starts[1:] + [float('inf')]
+
+        records = []
+        for metrics, start, end in zip(segments, starts, ends):
+            metrics.pop('wallStart')
+            url = metrics.pop('url')
+            route = self.matcher.match(urlparse(url).path) if url.startswith(TestConfig.BASE_URL) else None
+            if not route:
+                continue
+            requests = [r for r, sent_at in zip(api_requests, sent) if start <= sent_at < end]
+            records.append({'route': route, 'url': url, 'test': test_name,
+                            'profile': TestConfig.DEVICE_PROFILE or 'none', **metrics,
+                            **summarize_api_requests(requests)})
+        self.records.extend(records)
+        return records
+
+    def track(self, driver, test_name: str = None):
+        """Capture the outgoing page before every driver.get during a test"""
+        original_get = driver.get
+
+        def get(url):
+            self.capture(driver, test_name)
+            return original_get(url)
+
+        driver.get = get
+
+    def untrack(self, driver, test_name: str = None):
+        """Capture the final page and restore driver.get"""
+        self.capture(driver, test_name)
+        driver.__dict__.pop('get', None)
+
+    def save(self) -> Optional[str]:
+        """Write this process's raw records (one file per xdist worker)"""
+        if not self.records:
+            return None
+        os.makedirs(self.output_dir, exist_ok=True)
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        path = os.path.join(self.output_dir, f"raw_{worker}.jsonl")
+        with open(path, 'a') as f:
+            for record in self.records:
+                f.write(json.dumps(record) + '\n')
+        self.records = []
+        return path
+
+
+def load_records(output_dir: str = None) -> List[Dict[str, Any]]:
+    """Load raw records written by all workers"""
+    output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'page_metrics')
+    records = []
+    for path in glob.glob(os.path.join(output_dir, 'raw_*.jsonl')):
+        with open(path, 'r') as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def clear_records(output_dir: str = None):
+    """Remove raw records from a previous run"""
+    output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'page_metrics')
+    for path in glob.glob(os.path.join(output_dir, 'raw_*.jsonl')):
+        os.remove(path)
+
+
+def aggregate(records: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Aggregate records per route into p50/p75/p95 summaries"""
+    by_route = {}
+    for record in records:
+        # Keep throttled runs apart from full-speed ones, and route changes from page loads
+        key = record['route'] + (CLIENT_SUFFIX if record.get('navigation') == 'client' else '')
+        profile = record.get('profile', 'none')
+        key = key if profile == 'none' else f"{key} @{profile}"
+        by_route.setdefault(key, []).append(record)
+
+    summary = {}
+    for route, route_records in sorted(by_route.items()):
+        summary[route] = {'visits': len(route_records)}
+        for metric in METRICS:
+            values = [r.get(metric) for r in route_records]
+            summary[route][metric] = {
+                'p50': percentile(values, 50),
+                'p75': percentile(values, 75),
+                'p95': percentile(values, 95)
+            }
+
+        # Name the repeated calls so N+1 fetches can be traced to the page code
+        duplicate_calls = {}
+        for record in route_records:
+            for call, count in record.get('apiDuplicateCalls', {}).items():
+                duplicate_calls[call] = max(duplicate_calls.get(call, 0), count)
+        summary[route]['apiDuplicateCalls'] = duplicate_calls
+    return summary
+
+
+def check_budgets(summary: Dict[str, Dict[str, Any]], budgets: Dict[str, Dict[str, float]] = None,
+                  stat: str = 'p75') -> List[str]:
+    """Compare per-route summaries against budgets; returns violation messages.
+
+    Throttled '<route> @<profile>' summaries are only held to the profile's own
+    budgets (or an explicit '<route> @<profile>' entry), never the full-speed ones;
+    a profile without budgets is itself a violation.
+    '<route> (client)' summaries use the route's budgets; load metrics they
+    don't have (ttfb, fcp, lcp, load) are skipped.
+    """
+    budgets = budgets or TestConfig.PAGE_BUDGETS
+    violations = []
+    for route, route_summary in summary.items():
+        path, _, profile = route.partition(' @')
+        path = path[:-len(CLIENT_SUFFIX)] if path.endswith(CLIENT_SUFFIX) else path
+        scoped = TestConfig.DEVICE_PROFILES.get(profile, {}).get('budgets') if profile else budgets
+        if scoped is None:
+            # An unchecked throttled run would pass silently
+            violations.append(f"{route}: no budgets for device profile {profile}")
+            continue
+        route_budget = {**scoped.get('default', {}), **scoped.get(path, {}), **budgets.get(route, {})}
+        for metric, limit in route_budget.items():
+            # Request counts are near-deterministic, so one chatty visit should fail
+            metric_stat = 'p95' if metric.startswith('api') else stat
+            value = (route_summary.get(metric) or {}).get(metric_stat)
+            if value is not None and value > limit:
+                violations.append(f"{route}: {metric} {metric_stat}={value:.1f} exceeds budget {limit}")
+    return violations
+
+
+def write_report(summary: Dict[str, Dict[str, Any]], violations: List[str], output_dir: str = None) -> str:
+    """Write the aggregated per-route report"""
+    output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'page_metrics')
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, 'summary.json')
+    with open(path, 'w') as f:
+        json.dump({'routes': summary, 'violations': violations}, f, indent=2)
+    return path
@@ -0,0 +1,91 @@
+"""
+Event-driven UI synchronization for School Management System Testing
+"""
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.test_config import TestConfig
+
+# Counts in-flight fetch/XHR requests and records the last network or DOM activity
+TRACKER_SCRIPT = """
+(function () {
+  if (window.__pageSync) { return; }
+  var state = window.__pageSync = {pending: 0, lastActivity: performance.now()};
+  var touch = function () { state.lastActivity = performance.now(); };
+  var done = function () { state.pending = Math.max(0, state.pending - 1); touch(); };
+
+  if (window.fetch) {
+    var originalFetch = window.fetch;
+    window.fetch = function () {
+      state.pending++; touch();
+      return originalFetch.apply(this, arguments).finally(done);
+    };
+  }
+
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    state.pending++; touch();
+    this.addEventListener('loadend', done, {once: true});
+    return originalSend.apply(this, arguments);
+  };
+
+  new MutationObserver(touch).observe(document, {
+    childList: true, subtree: true, attributes: true, characterData: true
+  });
+})();
+"""
+
+STATUS_SCRIPT = """
+var state = window.__pageSync;
+return {
+  tracked: !!state,
+  readyState: document.readyState,
+  pending: state ? state.pending : 0,
+  quietFor: state ? performance.now() - state.lastActivity : 0
+};
+"""
+
+
+class PageSync:
+    """Wait until the page has no pending requests and the DOM stopped changing"""
+
+    def __init__(self, driver, timeout: float = None, idle_ms: int = None):
+        self.driver = driver
+        self.timeout = timeout or TestConfig.EXPLICIT_WAIT
+        self.idle_ms = idle_ms if idle_ms is not None else TestConfig.PAGE_IDLE_MS
+
+    @staticmethod
+    def install(driver) -> bool:
+        """Inject the tracker into every new document (Chromium only)"""
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return False
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': TRACKER_SCRIPT})
+        return True
+
+    def _status(self):
+        status = self.driver.execute_script(STATUS_SCRIPT)
+        if not status['tracked']:
+            # Document loaded before the tracker was registered (or non-Chromium
+            # browser): inject now; requests already in flight are missed, but the
+            # quiet window still has to elapse.
+            self.driver.execute_script(TRACKER_SCRIPT)
+            status = self.driver.execute_script(STATUS_SCRIPT)
+        return status
+
+    def _settled(self, _driver) -> bool:
+        try:
+            status = self._status()
+        except WebDriverException:
+            return False  # navigation in progress
+        return (status['readyState'] == 'complete'
+                and status['pending'] == 0
+                and status['quietFor'] >= self.idle_ms)
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the page settles; returns as soon as it does"""
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=0.05).until(self._settled)
+            return True
+        except TimeoutException:
+            print(f"Page did not settle within {timeout or self.timeout}s: {self.driver.current_url}")
+            return False
@@ -0,0 +1,158 @@
+"""
+Per-endpoint database query profiling (N+1 detection) for School Management System Testing
+"""
+import json
+import os
+import threading
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
+
+from config.test_config import TestConfig
+from utils.test_impact import BackendRouteMap
+
+# One row per normalized statement; the snapshot itself, transaction control
+# and session settings are left out so only the endpoint's own work is counted
+SNAPSHOT_QUERY = """
+SELECT queryid, min(query) AS query, sum(calls) AS calls,
+       sum(total_exec_time) AS total_exec_time, sum(rows) AS rows
+FROM pg_stat_statements
+WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+  AND query NOT ILIKE '%pg_stat_statements%'
+  AND query !~* '^(BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE|SET|SHOW|DEALLOCATE|DISCARD)'
+GROUP BY queryid
+"""
+
+
+class QueryProfiler:
+    """Attribute pg_stat_statements deltas to the API calls made through an APIHelper.
+
+    pg_stat_statements is server-wide, so requests are serialized while the
+    profiler is attached and nothing else should hit the database meanwhile
+    (run with one xdist worker; don't enable it for load tests).
+    """
+
+    def __init__(self, db=None, route_map: BackendRouteMap = None):
+        if db is None:
+            from utils.database_helper import DatabaseHelper
+            db = DatabaseHelper()
+            db.connection.autocommit = True  # every snapshot reads current statistics
+        self.db = db
+        self.route_map = route_map or BackendRouteMap()
+        self.records = []
+        self._lock = threading.RLock()
+        self.available = self._check_extension()
+
+    def _check_extension(self) -> bool:
+        try:
+            return bool(self.db.execute_query(
+                "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"))
+        except Exception as e:
+            print(f"pg_stat_statements check failed: {e}")
+            return False
+
+    def snapshot(self) -> Dict[int, Dict[str, Any]]:
+        """Current cumulative statistics per normalized statement"""
+        return {row['queryid']: row for row in self.db.execute_query(SNAPSHOT_QUERY)}
+
+    @staticmethod
+    def diff(before: Dict[int, Dict[str, Any]], after: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Statements executed between two snapshots, most frequent first"""
+        statements = []
+        for queryid, row in after.items():
+            previous = before.get(queryid, {'calls': 0, 'total_exec_time': 0.0, 'rows': 0})
+            calls = int(row['calls'] - previous['calls'])
+            if calls > 0:
+                statements.append({
+                    'query': row['query'],
+                    'calls': calls,
+                    'time_ms': float(row['total_exec_time'] - previous['total_exec_time']),
+                    'rows': int(row['rows'] - previous['rows'])
+                })
+        return sorted(statements, key=lambda s: -s['calls'])
+
+    def endpoint(self, method: str, url: str) -> str:
+        """Backend route for a request, e.g. 'GET /api/v1/classes/:id'"""
+        call = f"{method.upper()} {urlparse(url).path}"
+        endpoint = self.route_map.match(call)
+        return f"{endpoint.method} {endpoint.path}" if endpoint else call
+
+    def profile(self, method: str, url: str, send):
+        """Run one request between two snapshots and record its statements"""
+        with self._lock:
+            before = self.snapshot()
+            response = send()
+            statements = self.diff(before, self.snapshot())
+
+        self.records.append({
+            'endpoint': self.endpoint(method, url),
+            'url': url,
+            'status': response.status_code,
+            'queries': sum(s['calls'] for s in statements),
+            'db_time_ms': sum(s['time_ms'] for s in statements),
+            'rows': sum(s['rows'] for s in statements),
+            'max_repeats': statements[0]['calls'] if statements else 0,
+            'statements': statements
+        })
+        return response
+
+    def attach(self, api_helper):
+        """Profile every request made through an APIHelper's session"""
+        session = api_helper.session
+        if getattr(session, '_query_profiler', None) is self:
+            return
+        original_request = session.request
+
+        def request(method, url, *args, **kwargs):
+            return self.profile(method, url, lambda: original_request(method, url, *args, **kwargs))
+
+        session.request = request
+        session._query_profiler = self
+
+    @staticmethod
+    def budget(endpoint: str) -> Dict[str, int]:
+        """Query budget for an endpoint, falling back to the default"""
+        return {**TestConfig.QUERY_BUDGETS['default'], **TestConfig.QUERY_BUDGETS.get(endpoint, {})}
+
+    def check_budgets(self, records: List[Dict[str, Any]] = None) -> List[str]:
+        """Return a violation message for every request over its endpoint's budget"""
+        violations = []
+        for record in self.records if records is None else records:
+            budget = self.budget(record['endpoint'])
+            if record['queries'] > budget['queries']:
+                violations.append(f"{record['endpoint']}: {record['queries']} queries "
+                                  f"(budget {budget['queries']})")
+            if record['max_repeats'] > budget['repeated']:
+                top = record['statements'][0]
+                violations.append(f"{record['endpoint']}: possible N+1, statement ran "
+                                  f"{top['calls']} times (budget {budget['repeated']}): "
+                                  f"{' '.join(top['query'].split())[:200]}")
+        return violations
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Worst observed query count, repeats, DB time and rows per endpoint"""
+        summary = {}
+        for record in self.records:
+            stats = summary.setdefault(record['endpoint'], {
+                'requests': 0, 'max_queries': 0, 'max_repeats': 0, 'max_db_time_ms': 0.0, 'max_rows': 0})
+            stats['requests'] += 1
+            stats['max_queries'] = max(stats['max_queries'], record['queries'])
+            stats['max_repeats'] = max(stats['max_repeats'], record['max_repeats'])
+            stats['max_db_time_ms'] = max(stats['max_db_time_ms'], record['db_time_ms'])
+            stats['max_rows'] = max(stats['max_rows'], record['rows'])
+        return dict(sorted(summary.items()))
+
+    def save(self, output_dir: str = None) -> Optional[str]:
+        """Write this process's per-endpoint summary (one file per xdist worker)"""
+        if not self.records:
+            return None
+        output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'query_profile')
+        os.makedirs(output_dir, exist_ok=True)
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        path = os.path.join(output_dir, f"summary_{worker}.json")
+        with open(path, 'w') as f:
+            json.dump({'endpoints': self.summary(), 'violations': self.check_budgets()}, f, indent=2)
+        return path
+
+    def close(self):
+        """Close the profiler's database connection"""
+        self.db.disconnect()
@@ -0,0 +1,122 @@
+"""
+Harness-side query latency statistics for School Management System Testing
+"""
+import bisect
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Any, List, Optional
+
+from config.test_config import TestConfig
+
+# Upper bounds of the latency histogram buckets (milliseconds); the last bucket is open
+BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+_NORMALIZERS = [
+    (re.compile(r'--[^\n]*|/\*.*?\*/', re.S), ' '),
+    (re.compile(r"'(?:[^']|'')*'"), '?'),                   # string literals
+    (re.compile(r'%\(\w+\)s|%s|\$\d+'), '?'),               # bind parameters
+    (re.compile(r'\b\d+(?:\.\d+)?\b'), '?'),                # numbers
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)'), '(?)'),     # IN lists
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def fingerprint(query: str) -> str:
+    """Normalize a statement so executions with different values group together"""
+    for pattern, replacement in _NORMALIZERS:
+        query = pattern.sub(replacement, query)
+    return query.strip().rstrip(';').lower()
+
+
+class QueryStats:
+    """Per-fingerprint latency histograms, row counts and a slow-query log.
+
+    Filled by DatabaseHelper when DB_QUERY_STATS is on; one instance is shared
+    by every helper in the process so harness DB time can be totalled per test.
+    """
+
+    def __init__(self, slow_query_ms: float = None):
+        self.slow_query_ms = TestConfig.DB_SLOW_QUERY_MS if slow_query_ms is None else slow_query_ms
+        self.fingerprints = {}
+        self.slow_queries = []
+        self.total_time = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, query: str, duration: float, rows: int = 0):
+        """Add one timed statement (duration in seconds)"""
+        key = fingerprint(query)
+        duration_ms = duration * 1000
+        with self._lock:
+            self.total_time += duration
+            stats = self.fingerprints.get(key)
+            if stats is None:
+                stats = self.fingerprints[key] = {
+                    'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0,
+                    'histogram': [0] * (len(BUCKETS_MS) + 1)
+                }
+            stats['calls'] += 1
+            stats['total_ms'] += duration_ms
+            stats['max_ms'] = max(stats['max_ms'], duration_ms)
+            stats['rows'] += max(rows, 0)
+            stats['histogram'][bisect.bisect_left(BUCKETS_MS, duration_ms)] += 1
+            if duration_ms >= self.slow_query_ms:
+                self.slow_queries.append({
+                    'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+                    'duration_ms': round(duration_ms, 2),
+                    'rows': rows,
+                    'query': ' '.join(query.split())[:500]
+                })
+
+    @staticmethod
+    def percentile(histogram: List[int], pct: float) -> Optional[float]:
+        """Upper bound (ms) of the bucket holding the pct-th percentile; None for the open bucket"""
+        target = sum(histogram) * pct / 100
+        seen = 0
+        for bound, count in zip(BUCKETS_MS + [None], histogram):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return None
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Fingerprints ordered by total time"""
+        with self._lock:
+            items = list(self.fingerprints.items())
+        rows = []
+        for key, stats in sorted(items, key=lambda item: -item[1]['total_ms']):
+            rows.append({
+                'fingerprint': key,
+                'calls': stats['calls'],
+                'total_ms': round(stats['total_ms'], 2),
+                'mean_ms': round(stats['total_ms'] / stats['calls'], 2),
+                'p50_ms': self.percentile(stats['histogram'], 50),
+                'p95_ms': self.percentile(stats['histogram'], 95),
+                'max_ms': round(stats['max_ms'], 2),
+                'rows': stats['rows'],
+                'histogram': dict(zip([f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"],
+                                      stats['histogram']))
+            })
+        return rows
+
+    def save(self, output_dir: str = None) -> Optional[str]:
+        """Write this process's summary and slow-query log (one file pair per xdist worker)"""
+        if not self.fingerprints:
+            return None
+        output_dir = output_dir or os.path.join(TestConfig.REPORTS_DIR, 'db_query_stats')
+        os.makedirs(output_dir, exist_ok=True)
+        worker = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        path = os.path.join(output_dir, f"summary_{worker}.json")
+        with open(path, 'w') as f:
+            json.dump({'total_ms': round(self.total_time * 1000, 2), 'fingerprints': self.summary(),
+                       'slow_queries': len(self.slow_queries)}, f, indent=2)
+        with open(os.path.join(output_dir, f"slow_{worker}.log"), 'w') as f:
+            for entry in self.slow_queries:
+                f.write(f"{entry['time']} {entry['duration_ms']}ms rows={entry['rows']} {entry['query']}\n")
+        return path
+
+
+# Shared by every DatabaseHelper in this process
+query_stats = QueryStats()
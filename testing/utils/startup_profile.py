@@ -0,0 +1,84 @@
+"""
+Harness startup-time profiler for School Management System Testing
+"""
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, Any, List
+
+from config.test_config import TestConfig
+
+# "import time:       123 |       4567 |     package.module"
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)$')
+
+
+def parse_import_times(output: str) -> List[Dict[str, Any]]:
+    """Parse ``python -X importtime`` output into (module, self, cumulative, depth) entries"""
+    entries = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                'module': module,
+                'self': int(self_us) / 1e6,
+                'cumulative': int(cumulative_us) / 1e6,
+                'depth': (len(indent) - 1) // 2
+            })
+    return entries
+
+
+def top_packages(entries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Total import time per top-level package, counting each package's own imports once"""
+    packages = {}
+    for entry in entries:
+        package = entry['module'].split('.')[0]
+        packages[package] = packages.get(package, 0.0) + entry['self']
+    return dict(sorted(packages.items(), key=lambda p: -p[1]))
+
+
+def profile_startup(pytest_args: List[str]) -> Dict[str, Any]:
+    """Time ``pytest --collect-only`` for the given args and attribute import time"""
+    command = [sys.executable, '-X', 'importtime', '-m', 'pytest', '--collect-only', '-q',
+               '-p', 'no:cacheprovider', *pytest_args]
+    start_time = time.perf_counter()
+    result = subprocess.run(command, capture_output=True, text=True)
+    wall_time = time.perf_counter() - start_time
+
+    entries = parse_import_times(result.stderr)
+    return {
+        'command': ' '.join(command),
+        'returncode': result.returncode,
+        'wall_time': wall_time,
+        'import_time': sum(e['self'] for e in entries),
+        'packages': top_packages(entries)
+    }
+
+
+def main():
+    """Profile harness startup from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Profile pytest startup and collection time")
+    parser.add_argument("pytest_args", nargs="*", default=["tests/integration"],
+                        help="Arguments passed to pytest --collect-only")
+    parser.add_argument("--top", type=int, default=15, help="Packages to list")
+    parser.add_argument("--budget", type=float, default=TestConfig.STARTUP_BUDGET,
+                        help="Fail when startup exceeds this many seconds")
+    args = parser.parse_args()
+
+    profile = profile_startup(args.pytest_args)
+    print(f"Startup + collection: {profile['wall_time']:.2f}s "
+          f"(imports {profile['import_time']:.2f}s, budget {args.budget:.2f}s)")
+    for package, seconds in list(profile['packages'].items())[:args.top]:
+        print(f"  {package:<30} {seconds * 1000:8.1f} ms")
+
+    if profile['returncode'] not in (0, 5):  # 5: no tests collected
+        print(f"pytest exited with {profile['returncode']}")
+        sys.exit(profile['returncode'])
+    sys.exit(0 if profile['wall_time'] <= args.budget else 1)
+
+
+if __name__ == "__main__":
+    main()
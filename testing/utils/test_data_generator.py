@@ -3,7 +3,6 @@ Test Data Generator for School Management System
 """
 import random
 import string
-from faker import Faker
 from datetime import datetime, timedelta
 import json
 import os
@@ -12,8 +11,16 @@ class TestDataGenerator:
     """Generate test data for various test scenarios"""
     
     def __init__(self):
-        self.fake = Faker()
-        self.fake.seed_instance(42)  # For consistent test data
+        self._fake = None
+    
+    @property
+    def fake(self):
+        """Faker instance, created on first use (importing and building it is slow)"""
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker()
+            self._fake.seed_instance(42)  # For consistent test data
+        return self._fake
     
     def generate_user_data(self, role='student'):
         """Generate user data based on role"""
@@ -0,0 +1,188 @@
+"""
+Change-based test impact selection for School Management System Testing
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from config.test_config import TestConfig
+from utils.file_lock import locked, write_json
+
+ROUTE_IMPORT = re.compile(r"import\s+(\w+)\s+from\s+'\./routes/(\w+)'")
+ROUTE_MOUNT = re.compile(r"app\.use\(\s*'([^']+)'\s*,\s*(\w+)\s*\)")
+CONTROLLER_IMPORT = re.compile(r"import\s*\{([^}]*)\}\s*from\s*'\.\./controllers/(\w+)'", re.S)
+# Calls may span lines (one middleware per line) and end with a trailing comma
+ROUTE_HANDLER = re.compile(r"router\.(get|post|put|patch|delete)\(\s*'([^']*)'\s*,(.*?)\);", re.S)
+
+# Changes to these never affect test outcomes
+IGNORED_CHANGES = re.compile(r"(\.md$|\.txt$|^Atlas/|^\.gitignore$)")
+# ...except dependency pins, which can change anything
+DEPENDENCY_CHANGES = re.compile(r"(^|/)requirements[^/]*\.txt$")
+
+
+@dataclass
+class Endpoint:
+    """A backend route and the controller that serves it"""
+    method: str
+    path: str
+    route_file: str
+    controller_file: Optional[str]
+    handler: str
+
+    @property
+    def regex(self):
+        return re.compile('^' + re.sub(r':\w+', '[^/]+', self.path.rstrip('/') or '/') + '/?$')
+
+
+class BackendRouteMap:
+    """Map API endpoints to backend/src/routes and backend/src/controllers files"""
+
+    def __init__(self, repo_root: str = None):
+        self.repo_root = os.path.abspath(repo_root or TestConfig.REPO_ROOT)
+        self.endpoints = self._parse()
+
+    def _read(self, rel_path: str) -> str:
+        with open(os.path.join(self.repo_root, rel_path), 'r') as f:
+            return f.read()
+
+    def _parse(self) -> List[Endpoint]:
+        index = self._read('backend/src/index.ts')
+        route_modules = dict(ROUTE_IMPORT.findall(index))
+
+        endpoints = []
+        for prefix, variable in ROUTE_MOUNT.findall(index):
+            if variable not in route_modules:
+                continue
+            route_file = f"backend/src/routes/{route_modules[variable]}.ts"
+            source = self._read(route_file)
+
+            controllers = {}
+            for names, controller in CONTROLLER_IMPORT.findall(source):
+                for name in re.split(r'[\s,]+', names.strip()):
+                    if name:
+                        controllers[name] = f"backend/src/controllers/{controller}.ts"
+
+            # Declaration order matters: Express uses the first matching route
+            for method, path, args in ROUTE_HANDLER.findall(source):
+                handler = [arg.strip() for arg in args.split(',') if arg.strip()][-1]
+                full_path = prefix.rstrip('/') + ('' if path == '/' else path)
+                endpoints.append(Endpoint(method.upper(), full_path, route_file,
+                                          controllers.get(handler), handler))
+        return endpoints
+
+    def match(self, call: str) -> Optional[Endpoint]:
+        """Resolve a recorded 'METHOD /api/v1/...' call to its endpoint"""
+        method, _, path = call.partition(' ')
+        for endpoint in self.endpoints:
+            if endpoint.method == method and endpoint.regex.match(path):
+                return endpoint
+        return None
+
+
+class ImpactMap:
+    """Which API calls and frontend pages each test exercised, learned from test runs"""
+
+    def __init__(self, path: str = None):
+        self.path = path or TestConfig.TEST_IMPACT_MAP
+        self.tests = self._load()
+        self.updates = {}
+
+    def _load(self) -> Dict[str, Dict[str, List[str]]]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def update(self, nodeid: str, api_calls: List[str], pages: List[str]):
+        """Replace a test's recorded calls and pages with this run's"""
+        self.tests[nodeid] = self.updates[nodeid] = {'api_calls': sorted(set(api_calls)),
+                                                     'pages': sorted(set(pages))}
+
+    def save(self):
+        """Merge this run's entries into the map file if anything was recorded"""
+        if not self.updates:
+            return
+        with locked(self.path):
+            # Suites running concurrently may have saved their own tests since this run loaded
+            self.tests = {**self._load(), **self.updates}
+            write_json(self.path, self.tests)
+
+
+def changed_files(base: str = 'HEAD', repo_root: str = None) -> List[str]:
+    """Files changed between base and the working tree, relative to the repo root"""
+    repo_root = repo_root or TestConfig.REPO_ROOT
+    result = subprocess.run(['git', 'diff', '--name-only', base], cwd=repo_root,
+                            capture_output=True, text=True, check=True)
+    untracked = subprocess.run(['git', 'ls-files', '--others', '--exclude-standard'], cwd=repo_root,
+                               capture_output=True, text=True, check=True)
+    return sorted(set(result.stdout.split()) | set(untracked.stdout.split()))
+
+
+def collected_tests() -> Optional[List[str]]:
+    """Node ids pytest collects from the test tree, or None if collection fails"""
+    result = subprocess.run([sys.executable, '-m', 'pytest', '--collect-only', '-q', '-o', 'addopts=',
+                             '-p', 'no:cacheprovider'],
+                            cwd=os.path.dirname(os.path.abspath(TestConfig.TESTS_DIR)),
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return [line for line in result.stdout.splitlines() if '::' in line]
+
+
+def impacted_tests(changes: List[str], impact_map: ImpactMap = None,
+                   route_map: BackendRouteMap = None, collected: List[str] = None) -> Optional[Set[str]]:
+    """Select test node ids/files affected by the changed files.
+
+    Returns None when a change can't be attributed (middleware, config, shared
+    harness code, ...) or the test tree can't be collected, and the whole suite
+    has to run. collected defaults to the node ids pytest collects.
+    """
+    impact_map = impact_map or ImpactMap()
+    route_map = route_map or BackendRouteMap()
+
+    changed_endpoints = set()
+    changed_pages = set()
+    selected = set()
+
+    for change in changes:
+        if DEPENDENCY_CHANGES.search(change):
+            return None
+        if IGNORED_CHANGES.search(change):
+            continue
+        if change.startswith('backend/src/controllers/') or change.startswith('backend/src/routes/'):
+            endpoints = {id(e) for e in route_map.endpoints if change in (e.controller_file, e.route_file)}
+            if not endpoints:
+                # New file, or a route syntax the parser doesn't understand
+                return None
+            changed_endpoints.update(endpoints)
+        elif change.startswith('frontend/src/app/') and change.endswith('/page.tsx'):
+            route = change[len('frontend/src/app'):-len('/page.tsx')] or '/'
+            changed_pages.add(route)
+        elif change.startswith('testing/tests/') and change.endswith('.py'):
+            test_file = change[len('testing/'):]
+            if os.path.exists(os.path.join(TestConfig.REPO_ROOT, change)):
+                selected.add(test_file)
+        else:
+            return None
+
+    for nodeid, exercised in impact_map.tests.items():
+        endpoints = {id(e) for e in map(route_map.match, exercised['api_calls']) if e}
+        if endpoints & changed_endpoints or set(exercised['pages']) & changed_pages:
+            selected.add(nodeid)
+
+    # Tests the map has never seen can't be ruled out, even in files it knows
+    if changed_endpoints or changed_pages:
+        collected = collected if collected is not None else collected_tests()
+        if collected is None:
+            return None
+        selected.update(nodeid for nodeid in collected if nodeid not in impact_map.tests)
+
+    # A whole file already covers its node ids
+    return {t for t in selected if t.split('::')[0] not in selected or '::' not in t}
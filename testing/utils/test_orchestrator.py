@@ -0,0 +1,167 @@
+"""
+Concurrent streaming test orchestrator for School Management System Testing
+"""
+import os
+import signal
+import sys
+import subprocess
+import threading
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Suite:
+    """A pytest invocation with its own resource budget"""
+    name: str
+    args: List[str]
+    workers: Optional[int] = None  # xdist workers; None runs in one process
+    env: Dict[str, str] = field(default_factory=dict)
+    nice: int = 0  # CPU priority relative to the other suites (POSIX only)
+    timeout: Optional[float] = None  # seconds before the suite is killed
+
+    @property
+    def junit_path(self) -> str:
+        """Where this suite's junit XML is written (also the source of its pass/fail counts)"""
+        return os.path.join('reports', f"junit-{self.name}.xml")
+
+    def command(self, fail_fast: bool = False) -> List[str]:
+        """Build the pytest argv for this suite"""
+        command = [sys.executable, '-m', 'pytest', *self.args, f"--junitxml={self.junit_path}"]
+        if self.workers:
+            command += ['-n', str(self.workers)]
+        if fail_fast:
+            command.append('-x')
+        return command
+
+
+class TestOrchestrator:
+    """Run several suites concurrently, streaming their output as it arrives"""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, suites: List[Suite], fail_fast: bool = False, stream=None):
+        self.suites = suites
+        self.fail_fast = fail_fast
+        self.stream = stream or sys.stdout
+        self.processes = {}
+        self.results = {}
+        self.counts = {suite.name: {'passed': 0, 'failed': 0, 'errors': 0} for suite in suites}
+        self._stop = threading.Event()
+        self._failed_suite = None  # with -x it stops by itself and prints its summary
+        self._print_lock = threading.Lock()
+
+    def _print(self, suite: Suite, line: str):
+        with self._print_lock:
+            self.stream.write(f"[{suite.name}] {line}")
+            if not line.endswith('\n'):
+                self.stream.write('\n')
+            self.stream.flush()
+
+    def _start(self, suite: Suite) -> subprocess.Popen:
+        # TEST_SUITE gives the suite its own reports directory (see TestConfig.REPORTS_DIR)
+        env = {**os.environ, 'TEST_SUITE': suite.name, **suite.env}
+        # Own session so a stop reaches xdist workers too; preexec_fn isn't safe in threads
+        process = subprocess.Popen(
+            suite.command(self.fail_fast), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, bufsize=1, env=env, start_new_session=True
+        )
+        if suite.nice and hasattr(os, 'setpriority'):
+            # Set before pytest spawns workers, which inherit it
+            os.setpriority(os.PRIO_PROCESS, process.pid, os.getpriority(os.PRIO_PROCESS, 0) + suite.nice)
+        return process
+
+    def _signal(self, process: subprocess.Popen, sig: int):
+        """Signal the suite's whole process group (pytest and its xdist workers)"""
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, sig)
+            else:
+                process.terminate()
+        except ProcessLookupError:
+            pass
+
+    def _collect(self, suite: Suite):
+        """Take final pass/fail counts from the suite's junit XML once it exits (independent of -q/-v)"""
+        counts = self.counts[suite.name]
+        try:
+            root = ET.parse(suite.junit_path).getroot()
+        except (OSError, ET.ParseError):
+            return
+        for testsuite in root.iter('testsuite'):
+            failed = int(testsuite.get('failures', 0))
+            errors = int(testsuite.get('errors', 0))
+            skipped = int(testsuite.get('skipped', 0))
+            counts['passed'] += int(testsuite.get('tests', 0)) - failed - errors - skipped
+            counts['failed'] += failed
+            counts['errors'] += errors
+
+    def _run_suite(self, suite: Suite):
+        if os.path.exists(suite.junit_path):
+            os.remove(suite.junit_path)  # a crashed run must not report the previous counts
+        process = self._start(suite)
+        self.processes[suite.name] = process
+        self._print(suite, f"started: {' '.join(suite.command(self.fail_fast))}")
+
+        if suite.timeout:
+            timer = threading.Timer(suite.timeout, self._timeout, args=(suite, process))
+            timer.daemon = True
+            timer.start()
+
+        for line in process.stdout:
+            self._print(suite, line)
+
+        returncode = process.wait()
+        self.results[suite.name] = returncode
+        self._collect(suite)
+        if returncode != 0 and self.fail_fast:
+            self._fail(suite)
+
+    def _fail(self, suite: Suite):
+        if not self._stop.is_set():
+            self._failed_suite = suite.name
+            self._stop.set()
+
+    def _timeout(self, suite: Suite, process: subprocess.Popen):
+        if process.poll() is None:
+            self._print(suite, f"timed out after {suite.timeout}s, stopping")
+            self._signal(process, getattr(signal, 'SIGKILL', signal.SIGTERM))
+
+    def _stop_all(self):
+        for name, process in self.processes.items():
+            if name != self._failed_suite and process.poll() is None:
+                with self._print_lock:
+                    self.stream.write(f"[{name}] stopping (fail-fast)\n")
+                self._signal(process, signal.SIGTERM)
+
+    def run(self) -> Dict[str, int]:
+        """Run all suites; returns each suite's exit code"""
+        start_time = time.time()
+        threads = [threading.Thread(target=self._run_suite, args=(suite,), daemon=True)
+                   for suite in self.suites]
+        for thread in threads:
+            thread.start()
+
+        while any(thread.is_alive() for thread in threads):
+            if self._stop.wait(0.2):
+                self._stop_all()
+                break
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.time() - start_time
+        with self._print_lock:
+            self.stream.write(f"\nSuites finished in {elapsed:.1f}s\n")
+            for suite in self.suites:
+                counts = self.counts[suite.name]
+                self.stream.write(f"  {suite.name}: exit={self.results.get(suite.name)} "
+                                  f"passed={counts['passed']} failed={counts['failed']} "
+                                  f"errors={counts['errors']}\n")
+        return self.results
+
+    @property
+    def success(self) -> bool:
+        """True when every suite exited cleanly"""
+        return bool(self.results) and all(code == 0 for code in self.results.values())
@@ -0,0 +1,109 @@
+"""
+Auth token cache for School Management System Testing
+"""
+import base64
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import requests
+
+from config.test_config import TestConfig
+
+
+class TokenStore:
+    """Obtain login tokens once through the API and cache them until they expire"""
+
+    def __init__(self, path: str = None, expiry_margin: int = 60):
+        self.path = path or TestConfig.TOKEN_CACHE
+        self.expiry_margin = expiry_margin  # seconds of validity required on reuse
+        self.sessions = self._load()
+        self._lock = threading.Lock()  # shared by concurrent browsers in one process
+
+    def _load(self) -> Dict[str, Any]:
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def save(self):
+        """Persist cache atomically (several xdist workers may share it)"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(dict(self.sessions), f, indent=2)
+            os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def token_expiry(token: str) -> float:
+        """Read the exp claim from a JWT without verifying it"""
+        try:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            return float(json.loads(base64.urlsafe_b64decode(payload))['exp'])
+        except (IndexError, KeyError, ValueError):
+            return 0.0
+
+    def is_valid(self, session: Optional[Dict[str, Any]]) -> bool:
+        """Check that a cached session's access token is not about to expire"""
+        if not session:
+            return False
+        return self.token_expiry(session['accessToken']) - self.expiry_margin > time.time()
+
+    def fetch(self, email: str, password: str) -> Dict[str, Any]:
+        """Login through the API and return user and tokens"""
+        response = requests.post(
+            f"{TestConfig.API_BASE_URL}/auth/login",
+            json={'email': email, 'password': password},
+            timeout=TestConfig.API_TIMEOUT
+        )
+        response.raise_for_status()
+
+        data = response.json()['data']
+        tokens = data.get('tokens', data)
+        return {
+            'user': data.get('user'),
+            'accessToken': tokens['accessToken'],
+            'refreshToken': tokens['refreshToken']
+        }
+
+    def get(self, email: str, password: str) -> Dict[str, Any]:
+        """Get a cached session, logging in only when there is none or it expired"""
+        session = self.sessions.get(email)
+        if not self.is_valid(session):
+            # Another worker may have refreshed the file meanwhile
+            session = self._load().get(email)
+        if not self.is_valid(session):
+            session = self.fetch(email, password)
+            self.sessions[email] = session
+            self.save()
+        return session
+
+    def invalidate(self, email: str):
+        """Drop a cached session"""
+        if self.sessions.pop(email, None):
+            self.save()
+
+
+def inject_session(driver, session: Dict[str, Any]):
+    """Put tokens into the browser the way frontend/src/stores/authStore.ts stores them"""
+    # localStorage is per-origin, so load a light same-origin resource first
+    driver.get(f"{TestConfig.BASE_URL}/favicon.ico")
+
+    # zustand persist ('auth-storage') only keeps user and isAuthenticated
+    auth_storage = json.dumps({
+        'state': {'user': session['user'], 'isAuthenticated': True},
+        'version': 0
+    })
+    driver.execute_script(
+        "localStorage.setItem('accessToken', arguments[0]);"
+        "localStorage.setItem('refreshToken', arguments[1]);"
+        "localStorage.setItem('auth-storage', arguments[2]);",
+        session['accessToken'], session['refreshToken'], auth_storage
+    )
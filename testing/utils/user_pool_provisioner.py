@@ -0,0 +1,244 @@
+"""
+Load-test user pool provisioning for School Management System Testing
+"""
+import hashlib
+import itertools
+import json
+import os
+import uuid
+import concurrent.futures
+from typing import Dict, Any, List, Optional
+
+import bcrypt
+import psycopg2.extras
+
+from config.test_config import TestConfig
+from utils.database_helper import DatabaseHelper
+
+
+def hash_password(password: str, rounds: int = TestConfig.BCRYPT_ROUNDS) -> str:
+    """Hash a password with bcrypt (runs inside worker processes)"""
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+class PasswordHashCache:
+    """On-disk cache of bcrypt hashes keyed by password"""
+
+    def __init__(self, path: str = None, rounds: int = None):
+        self.path = path or TestConfig.PASSWORD_HASH_CACHE
+        self.rounds = rounds or TestConfig.BCRYPT_ROUNDS
+        self.hashes = self._load()
+
+    def _key(self, password: str) -> str:
+        """Cache key; the plain password is never written to disk"""
+        return f"{self.rounds}:{hashlib.sha256(password.encode('utf-8')).hexdigest()}"
+
+    def _load(self) -> Dict[str, str]:
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def save(self):
+        """Persist cache to disk"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'w') as f:
+            json.dump(self.hashes, f, indent=2)
+
+    def get_many(self, passwords: List[str], workers: int = None) -> Dict[str, str]:
+        """Return hashes for passwords, computing missing ones in a process pool"""
+        missing = sorted({p for p in passwords if self._key(p) not in self.hashes})
+
+        if missing:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                hashed = executor.map(hash_password, missing, itertools.repeat(self.rounds))
+                for password, password_hash in zip(missing, hashed):
+                    self.hashes[self._key(password)] = password_hash
+            self.save()
+
+        return {p: self.hashes[self._key(p)] for p in passwords}
+
+
+class UserPoolProvisioner:
+    """Bulk-create load-test users directly in Postgres and write a credential manifest"""
+
+    ROLES = ['admin', 'class_teacher', 'subject_teacher', 'parent', 'student']
+    EMAIL_DOMAIN = 'loadtest.school.com'
+    ACADEMIC_YEAR = 'loadtest'  # marks the classes created for pool class teachers
+
+    def __init__(self, db_helper: DatabaseHelper = None, school_id: str = None,
+                 manifest_path: str = None, hash_cache: PasswordHashCache = None):
+        self.db_helper = db_helper or DatabaseHelper()
+        self.school_id = school_id
+        self.manifest_path = manifest_path or TestConfig.LOAD_USER_MANIFEST
+        self.hash_cache = hash_cache or PasswordHashCache()
+
+    def resolve_school_id(self) -> str:
+        """Use the configured admin's school when none was given"""
+        if not self.school_id:
+            admin = self.db_helper.get_user_by_email(TestConfig.ADMIN_EMAIL)
+            if not admin:
+                raise ValueError(f"Admin user {TestConfig.ADMIN_EMAIL} not found; pass school_id explicitly")
+            self.school_id = admin['school_id']
+        return self.school_id
+
+    def build_credentials(self, users_per_role: int, roles: List[str] = None,
+                          distinct_passwords: int = 8) -> List[Dict[str, Any]]:
+        """Build deterministic credentials so re-runs hit the hash cache"""
+        credentials = []
+        for role in roles or self.ROLES:
+            for i in range(users_per_role):
+                credentials.append({
+                    'email': f"{role}.{i:05d}@{self.EMAIL_DOMAIN}",
+                    'password': f"LoadTest#{role[:2].upper()}{i % distinct_passwords}a",
+                    'role': role
+                })
+        return credentials
+
+    def provision(self, users_per_role: int = None, roles: List[str] = None,
+                  distinct_passwords: int = 8, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """Create (or refresh) the user pool and write the manifest"""
+        users_per_role = users_per_role or TestConfig.LOAD_USER_POOL_SIZE
+        school_id = self.resolve_school_id()
+        credentials = self.build_credentials(users_per_role, roles, distinct_passwords)
+        hashes = self.hash_cache.get_many([c['password'] for c in credentials])
+
+        rows = [
+            (str(uuid.uuid4()), school_id, c['email'], hashes[c['password']], c['role'],
+             'Load', c['email'].split('@')[0], True)
+            for c in credentials
+        ]
+        query = """
+        INSERT INTO users (id, school_id, email, password_hash, role, first_name, last_name,
+                          is_active, created_at, updated_at)
+        VALUES %s
+        ON CONFLICT (school_id, email)
+        DO UPDATE SET password_hash = EXCLUDED.password_hash, role = EXCLUDED.role,
+                      is_active = true, updated_at = NOW()
+        RETURNING id, email
+        """
+        try:
+            results = psycopg2.extras.execute_values(
+                self.db_helper.cursor, query, rows,
+                template="(%s, %s, %s, %s, %s, %s, %s, %s, NOW(), NOW())",
+                page_size=page_size, fetch=True
+            )
+            ids = {row['email']: row['id'] for row in results}
+            for c in credentials:
+                c['id'] = str(ids[c['email']])
+                c['schoolId'] = str(school_id)
+            self.assign_classes(credentials, page_size)
+            self.db_helper.connection.commit()
+        except Exception as e:
+            self.db_helper.connection.rollback()
+            print(f"User pool provisioning failed: {e}")
+            raise
+
+        self.write_manifest(credentials)
+        return credentials
+
+    def assign_classes(self, credentials: List[Dict[str, Any]], page_size: int = 1000):
+        """Give every class teacher a class and spread the pool students over those classes.
+
+        Without a class the attendance flow has nothing to select. Runs inside
+        provision()'s transaction and adds classId to the credentials.
+        """
+        teachers = [c for c in credentials if c['role'] == 'class_teacher']
+        if not teachers:
+            return
+
+        class_rows = [
+            (str(uuid.uuid4()), t['schoolId'], f"Load {t['email'].split('@')[0]}", 'A', self.ACADEMIC_YEAR, t['id'])
+            for t in teachers
+        ]
+        classes = psycopg2.extras.execute_values(self.db_helper.cursor, """
+        INSERT INTO classes (id, school_id, name, section, academic_year, class_teacher_id,
+                            is_active, created_at, updated_at)
+        VALUES %s
+        ON CONFLICT (school_id, name, section, academic_year)
+        DO UPDATE SET class_teacher_id = EXCLUDED.class_teacher_id, is_active = true, updated_at = NOW()
+        RETURNING id, class_teacher_id
+        """, class_rows, template="(%s, %s, %s, %s, %s, %s, true, NOW(), NOW())",
+            page_size=page_size, fetch=True)
+        class_ids = {str(row['class_teacher_id']): str(row['id']) for row in classes}
+        for t in teachers:
+            t['classId'] = class_ids[t['id']]
+
+        students = [c for c in credentials if c['role'] == 'student']
+        student_rows = [
+            (str(uuid.uuid4()), student['schoolId'], student['id'], teachers[i % len(teachers)]['classId'],
+             student['email'].split('@')[0])
+            for i, student in enumerate(students)
+        ]
+        if student_rows:
+            psycopg2.extras.execute_values(self.db_helper.cursor, """
+            INSERT INTO students (id, school_id, user_id, class_id, roll_number, is_active, created_at, updated_at)
+            VALUES %s
+            ON CONFLICT (user_id)
+            DO UPDATE SET class_id = EXCLUDED.class_id, roll_number = EXCLUDED.roll_number, updated_at = NOW()
+            """, student_rows, template="(%s, %s, %s, %s, %s, true, NOW(), NOW())", page_size=page_size)
+
+    def write_manifest(self, credentials: List[Dict[str, Any]]) -> str:
+        """Write credential manifest for the load engine"""
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(self.manifest_path, 'w') as f:
+            json.dump({'users': credentials}, f, indent=2)
+        return self.manifest_path
+
+    def cleanup(self) -> int:
+        """Delete every provisioned load-test user and the classes assigned to them"""
+        self.db_helper.execute_update("DELETE FROM classes WHERE academic_year = %s", (self.ACADEMIC_YEAR,))
+        return self.db_helper.execute_update(
+            "DELETE FROM users WHERE email LIKE %s", (f"%@{self.EMAIL_DOMAIN}",)
+        )
+
+
+class UserPool:
+    """Credential manifest from which load tests draw virtual users"""
+
+    def __init__(self, manifest_path: str = None):
+        self.manifest_path = manifest_path or TestConfig.LOAD_USER_MANIFEST
+        with open(self.manifest_path, 'r') as f:
+            self.users = json.load(f)['users']
+        self._cycles = {}
+
+    @classmethod
+    def exists(cls, manifest_path: str = None) -> bool:
+        """Check whether a manifest has been provisioned"""
+        return os.path.exists(manifest_path or TestConfig.LOAD_USER_MANIFEST)
+
+    def by_role(self, role: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all users for a role (all users when role is None)"""
+        return [u for u in self.users if role is None or u['role'] == role]
+
+    def draw(self, count: int, role: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Draw virtual users round-robin, wrapping when the pool is smaller than count"""
+        users = self.by_role(role)
+        if not users:
+            raise ValueError(f"No provisioned users for role: {role}")
+        cycle = self._cycles.setdefault(role, itertools.cycle(users))
+        return [next(cycle) for _ in range(count)]
+
+
+def main():
+    """Provision the load-test user pool from the command line"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Provision load-test user pool")
+    parser.add_argument("--users-per-role", type=int, default=TestConfig.LOAD_USER_POOL_SIZE)
+    parser.add_argument("--roles", nargs="+", choices=UserPoolProvisioner.ROLES)
+    parser.add_argument("--school-id", help="School to create users in (defaults to admin's school)")
+    parser.add_argument("--cleanup", action="store_true", help="Delete provisioned users instead")
+    args = parser.parse_args()
+
+    with DatabaseHelper() as db_helper:
+        provisioner = UserPoolProvisioner(db_helper, school_id=args.school_id)
+        if args.cleanup:
+            print(f"Deleted {provisioner.cleanup()} load-test users")
+        else:
+            users = provisioner.provision(args.users_per_role, args.roles)
+            print(f"Provisioned {len(users)} users, manifest: {provisioner.manifest_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Server-side volume dataset seeding for School Management System Testing
+"""
+from typing import Dict, Any
+
+SEEDED_TABLES = ['schools', 'users', 'classes', 'students', 'subjects', 'attendance', 'homework',
+                 'notifications']
+
+# Seeded schools are named <prefix>-<n>@loadtest.school.com and their classes
+# carry the prefix as academic_year, so several datasets can coexist
+SEED_STATEMENTS = [
+    """
+    INSERT INTO schools (id, name, email, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), 'Seeded School ' || %(prefix)s || ' ' || n,
+           %(prefix)s || '-' || n || '@loadtest.school.com', true, NOW(), NOW()
+    FROM generate_series(1, %(schools)s) n
+    """,
+    """
+    WITH seed AS (
+        SELECT gen_random_uuid() AS user_id, s.id AS school_id, n
+        FROM schools s CROSS JOIN generate_series(1, %(classes_per_school)s) n
+        WHERE s.email LIKE %(prefix)s || '-%%@loadtest.school.com'
+    ), teachers AS (
+        INSERT INTO users (id, school_id, email, password_hash, role, first_name, last_name,
+                           is_active, created_at, updated_at)
+        SELECT user_id, school_id, 'seed.teacher.' || user_id || '@loadtest.school.com', 'x',
+               'class_teacher', 'Seeded', 'Teacher ' || n, true, NOW(), NOW()
+        FROM seed
+    )
+    INSERT INTO classes (id, school_id, name, section, academic_year, class_teacher_id,
+                         is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), school_id, 'Class ' || n, 'A', %(prefix)s, user_id, true, NOW(), NOW()
+    FROM seed
+    """,
+    """
+    WITH seed AS (
+        SELECT gen_random_uuid() AS user_id, c.id AS class_id, c.school_id, n
+        FROM classes c CROSS JOIN generate_series(1, %(students_per_class)s) n
+        WHERE c.academic_year = %(prefix)s
+    ), student_users AS (
+        INSERT INTO users (id, school_id, email, password_hash, role, first_name, last_name,
+                           is_active, created_at, updated_at)
+        SELECT user_id, school_id, 'seed.student.' || user_id || '@loadtest.school.com', 'x',
+               'student', 'Seeded', 'Student ' || n, true, NOW(), NOW()
+        FROM seed
+    )
+    INSERT INTO students (id, school_id, user_id, class_id, roll_number, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), school_id, user_id, class_id, n::text, true, NOW(), NOW()
+    FROM seed
+    """,
+    """
+    INSERT INTO subjects (id, school_id, name, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), id, 'Seeded Subject', true, NOW(), NOW()
+    FROM schools WHERE email LIKE %(prefix)s || '-%%@loadtest.school.com'
+    """,
+    # Attendance is marked day by day, so rows of one date sit together on disk
+    """
+    INSERT INTO attendance (id, school_id, student_id, class_id, date, status, marked_by,
+                            created_at, updated_at)
+    SELECT gen_random_uuid(), st.school_id, st.id, st.class_id, CURRENT_DATE - d,
+           CASE WHEN random() < 0.9 THEN 'present' ELSE 'absent' END, c.class_teacher_id, NOW(), NOW()
+    FROM generate_series(%(attendance_days)s, 1, -1) d
+    CROSS JOIN students st JOIN classes c ON c.id = st.class_id
+    WHERE c.academic_year = %(prefix)s
+    ORDER BY d DESC, st.class_id
+    """,
+    """
+    INSERT INTO homework (id, school_id, class_id, subject_id, teacher_id, title, description,
+                          due_date, is_active, created_at, updated_at)
+    SELECT gen_random_uuid(), c.school_id, c.id, sub.id, c.class_teacher_id, 'Homework ' || h,
+           'Seeded homework', CURRENT_DATE - %(homework_per_class)s + h, true, NOW(), NOW()
+    FROM generate_series(1, %(homework_per_class)s) h
+    CROSS JOIN classes c JOIN subjects sub ON sub.school_id = c.school_id AND sub.name = 'Seeded Subject'
+    WHERE c.academic_year = %(prefix)s
+    ORDER BY h
+    """,
+    """
+    INSERT INTO notifications (id, school_id, sender_id, recipient_id, class_id, title, message,
+                               type, priority, is_read, sent_at, created_at)
+    SELECT gen_random_uuid(), c.school_id, c.class_teacher_id, st.user_id, c.id, 'Notice ' || n,
+           'Seeded notification', 'general', 'normal', random() < 0.5, NOW(), NOW() - n * INTERVAL '1 day'
+    FROM generate_series(%(notifications_per_student)s, 1, -1) n
+    CROSS JOIN students st JOIN classes c ON c.id = st.class_id
+    WHERE c.academic_year = %(prefix)s
+    ORDER BY n DESC
+    """,
+    f"ANALYZE {', '.join(SEEDED_TABLES)}",
+]
+
+
+def seed_dataset(db_helper, scale: Dict[str, int], prefix: str, seed: int = None):
+    """Insert a dataset of the given scale inside the helper's current transaction.
+
+    ``seed`` makes random() (attendance status, read flags) reproducible; the
+    caller decides whether to commit or roll back.
+    """
+    if seed is not None:
+        db_helper.cursor.execute("SELECT setseed(%s)", ((seed % 1000) / 1000.0,))
+    params = {**scale, 'prefix': prefix}
+    for statement in SEED_STATEMENTS:
+        db_helper.cursor.execute(statement, params)
+
+
+def dataset_size(scale: Dict[str, int]) -> int:
+    """Number of seeded students, the headline size of a dataset"""
+    return scale['schools'] * scale['classes_per_school'] * scale['students_per_class']